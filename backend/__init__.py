@@ -74,16 +74,24 @@ def create_app(config_name):
     from backend.routes.universe import universe_bp
     from backend.routes.api import api_bp
     from backend.routes.missions import missions_bp, init_mission_system
+    from backend.routes.star_charts import star_charts_bp
+    from backend.routes.static_data import static_data_bp
     
     app.register_blueprint(main_blueprint)
     app.register_blueprint(universe_bp, url_prefix='/api')
     app.register_blueprint(api_bp)
     app.register_blueprint(missions_bp)
+    app.register_blueprint(star_charts_bp)
+    app.register_blueprint(static_data_bp)
     
     # Initialize mission system
     with app.app_context():
         init_mission_system(app)
 
+    # Hashed static datasets for a fresh checkout or image without a build
+    from backend.static_data import ensure_static_data
+    ensure_static_data()
+
     # Add security headers to all responses
     @app.after_request
     def add_security_headers(response):
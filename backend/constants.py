@@ -43,6 +43,59 @@ STORAGE_THRESHOLD_JSON = 50      # Use JSON storage below this count
 STORAGE_THRESHOLD_SQLITE = 100   # Use SQLite between JSON and this count
 # Above STORAGE_THRESHOLD_SQLITE, consider PostgreSQL
 
+# Mission save batching ('write_behind' coalesces saves, 'sync' writes on every save)
+MISSION_SAVE_DURABILITY = 'write_behind'
+MISSION_SAVE_FLUSH_INTERVAL = 1.0  # Maximum seconds a saved mission waits to be written
+MISSION_SAVE_MAX_DIRTY = 50  # Pending missions that trigger an early flush
+MISSION_SAVE_GROUP_COMMIT = True  # One directory fsync per flushed batch instead of per file
+
+# Lazy mission loading: index metadata at startup, Mission objects built on first access
+MISSION_LAZY_LOADING = False
+MISSION_CACHE_SIZE = 500  # Resident missions before cold completed ones are evicted
+
+# Mission journal: saves append deltas to an NDJSON log, mission files are rewritten on snapshots
+MISSION_JOURNAL_ENABLED = False
+MISSION_JOURNAL_SNAPSHOT_INTERVAL = 1000  # Journal records that trigger a snapshot
+MISSION_JOURNAL_KEEP_SEGMENTS = 5  # Rotated journal segments kept as an audit trail
+
+# Background mission jobs (cascade effects, background trigger callbacks)
+MISSION_JOB_WORKERS = 2  # Worker threads; 0 runs jobs inline in the request
+MISSION_JOB_MAX_RETRIES = 2  # Extra attempts for a failing job
+MISSION_JOB_RETRY_DELAY = 0.5  # Seconds before the first retry, doubled per retry
+
+# Mission event stream (SSE /api/missions/stream and its long-poll fallback)
+MISSION_STREAM_BUFFER_SIZE = 1000  # Recent events kept for reconnecting and polling clients
+MISSION_STREAM_HEARTBEAT = 15.0  # Seconds between SSE keepalive comments
+MISSION_STREAM_POLL_TIMEOUT = 25.0  # Longest a long-poll request waits for events
+# Open SSE connections per process; each holds a server thread (gunicorn runs
+# --threads 4), so further clients get 503 and fall back to long polling
+MISSION_STREAM_MAX_CLIENTS = 2
+
+# SQLite mission backend (WAL journal; NORMAL may drop the last commits on power loss, FULL never)
+MISSION_SQLITE_SYNCHRONOUS = 'NORMAL'
+MISSION_SQLITE_MMAP_SIZE = 64 * 1024 * 1024  # Bytes of the database file memory-mapped for reads
+MISSION_SQLITE_BUSY_TIMEOUT = 5.0  # Seconds a connection waits for a lock held by another writer
+
+
+# =============================================================================
+# Star Charts
+# =============================================================================
+
+STAR_CHARTS_SECTOR_CACHE_SIZE = 16  # Decoded sectors kept in memory per worker
+STAR_CHARTS_RELOAD_INTERVAL = 5  # Seconds between data file change checks
+STAR_CHARTS_RETIRED_SNAPSHOT_TTL = 60  # Seconds a replaced snapshot stays open for in-flight requests
+STAR_CHARTS_GRID_CELL_SIZE = 25.0  # Spatial grid cell width in game units
+STAR_CHARTS_MAX_PAGE_SIZE = 200  # Maximum objects per spatial query page
+
+
+# =============================================================================
+# Static Data
+# =============================================================================
+
+STATIC_DATA_RELOAD_INTERVAL = 5  # Seconds between static data manifest change checks
+STATIC_DATA_MAX_AGE = 31536000  # Cache lifetime of content-hashed files (1 year)
+REFERENCE_DATA_RELOAD_INTERVAL = 5  # Seconds between reference data change checks
+
 
 # =============================================================================
 # Coordinate Limits
@@ -58,5 +111,6 @@ MIN_COORDINATE = -10000  # Minimum coordinate value
 
 MAX_STRING_LENGTH = 1000     # Default max length for string inputs
 MAX_MISSION_ID_LENGTH = 100  # Max length for mission IDs
+MAX_MISSION_EVENT_BATCH = 200  # Max game events per /api/missions/events/batch request
 MAX_SYSTEM_NAME_LENGTH = 50  # Max length for system names
 MAX_NUM_SYSTEMS = 500        # Max systems per generation (DoS protection)
@@ -0,0 +1,81 @@
+"""
+File Change Monitoring
+======================
+
+Cheap change detection for data files that are reloaded in place.
+
+A file's signature is its (inode, mtime in ns, size). Writers that replace
+files atomically with os.replace() always produce a new inode, and in-place
+edits change the mtime or size, so comparing signatures catches both without
+reading file contents.
+
+ChangeMonitor throttles how often a worker stats its files and makes sure
+only one thread performs a reload at a time, so a burst of requests after a
+data update triggers exactly one reload per worker.
+"""
+
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
+FileSignature = Tuple[int, int, int]
+
+
+def file_signature(path) -> Optional[FileSignature]:
+    """
+    Get the change signature of a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        tuple or None: (inode, mtime_ns, size), or None if the file is missing
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class ChangeMonitor:
+    """Rate limiter and single-flight guard for file change checks."""
+
+    def __init__(self, interval: Optional[float]):
+        """
+        Initialize the monitor.
+
+        Args:
+            interval (float or None): Minimum seconds between checks, or None
+                to disable automatic checks
+        """
+        self.interval = interval
+        self._next_check = 0.0
+        self._check_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+
+    def due(self) -> bool:
+        """
+        Return True if a check should run now, at most once per interval.
+
+        The check window is claimed by the caller, so concurrent callers in
+        the same interval get False.
+        """
+        if self.interval is None:
+            return False
+
+        now = time.monotonic()
+        with self._check_lock:
+            if now < self._next_check:
+                return False
+            self._next_check = now + self.interval
+            return True
+
+    def try_begin_reload(self) -> bool:
+        """Claim the reload slot; False if another thread is already reloading."""
+        return self._reload_lock.acquire(blocking=False)
+
+    def end_reload(self) -> None:
+        """Release the reload slot claimed by try_begin_reload()."""
+        self._reload_lock.release()
@@ -0,0 +1,93 @@
+"""
+Atomic File Writes
+Crash-safe JSON persistence for mission files
+
+A file is written to a temporary name in its target directory, fsynced and
+renamed over the target with os.replace, so readers see either the old or
+the new content and never a truncated file. The rename itself is durable
+only once the directory is fsynced; DirectorySyncGroup lets a batch of
+writes share one directory fsync per directory (group commit).
+"""
+
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def fsync_directory(directory: str):
+    """Flush a directory entry update (rename, create) to disk"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        # Directories cannot be opened on some platforms (Windows)
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.debug(f"Directory fsync not supported for {directory}: {e}")
+    finally:
+        os.close(fd)
+
+
+class DirectorySyncGroup:
+    """
+    Defers directory fsyncs of several atomic writes to one commit()
+
+    Usage:
+        group = DirectorySyncGroup()
+        for path, data in batch:
+            atomic_write_json(path, data, sync_group=group)
+        group.commit()
+    """
+
+    def __init__(self):
+        self.directories: Set[str] = set()
+
+    def add(self, directory: str):
+        self.directories.add(directory)
+
+    def commit(self) -> int:
+        """fsync every collected directory once, returns the number synced"""
+        directories, self.directories = self.directories, set()
+        for directory in directories:
+            fsync_directory(directory)
+        return len(directories)
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = 2,
+                      sync_group: Optional[DirectorySyncGroup] = None):
+    """
+    Atomically replace path with data serialized as JSON
+
+    Args:
+        path: Target file
+        data: JSON-serializable object
+        indent: json.dump indent; None writes compact JSON without whitespace
+        sync_group: Collects the directory fsync for a later commit; without
+            one the directory is fsynced immediately
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=indent,
+                      separators=None if indent is not None else (',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if sync_group is not None:
+        sync_group.add(directory)
+    else:
+        fsync_directory(directory)
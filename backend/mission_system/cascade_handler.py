@@ -2,10 +2,21 @@
 Mission Cascade Handler
 Handles cascade effects when missions are botched
 Following spec section 4.2 - Botch Handling Variations
+
+'botch_related_missions' rules are compiled into a directed dependency
+graph as they are registered (mission -> missions botched with it). The
+transitive closure of a mission is computed once per graph version and
+reused, so a botch walks every dependent mission exactly once even when
+subgraphs are shared or the rules form a cycle. Registering an edge that
+closes a cycle is logged and recorded in `cycles`.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from collections import deque
+from typing import Dict, List, Any, Optional, Tuple
+
+from .mission import MissionState
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +31,18 @@ class MissionCascadeHandler:
         self.mission_manager = mission_manager
         self.cascade_rules: Dict[str, List[Dict[str, Any]]] = {}
         self.shared_data: Dict[str, Any] = {}
+        # Cascades run on job queue workers; read-modify-write updates of
+        # shared_data are serialized
+        self._shared_data_lock = threading.RLock()
+        
+        # Botch dependency graph: mission ID -> {related mission ID: reason}
+        self.botch_graph: Dict[str, Dict[str, str]] = {}
+        # Mission ID -> (related ID, reason, botched via) in cascade order,
+        # cleared whenever the graph changes
+        self._botch_closures: Dict[str, Tuple[Tuple[str, str, str], ...]] = {}
+        # Mission ID paths of cycles found at registration, first ID repeated last
+        self.cycles: List[List[str]] = []
+        self._graph_lock = threading.Lock()
         
         # Register default cascade rules
         self._register_default_cascade_rules()
@@ -30,75 +53,216 @@ class MissionCascadeHandler:
             self.cascade_rules[mission_id] = []
         
         self.cascade_rules[mission_id].append(rule)
+        if rule['type'] == 'botch_related_missions':
+            data = rule['data']
+            self._add_botch_edges(mission_id, data['mission_ids'],
+                                  data.get('reason', 'Related mission failed'))
         logger.debug(f"🌊 Registered cascade rule for mission {mission_id}: {rule['type']}")
     
-    def handle_mission_botched(self, mission_id: str, context: Dict[str, Any]):
-        """Handle cascade effects when a mission is botched"""
-        rules = self.cascade_rules.get(mission_id, [])
-        
-        logger.info(f"🌊 Processing {len(rules)} cascade rules for botched mission {mission_id}")
+    def _add_botch_edges(self, mission_id: str, related_ids: List[str], reason: str):
+        """Add dependency edges mission_id -> related_ids, recording any cycle they close"""
+        with self._graph_lock:
+            edges = self.botch_graph.setdefault(mission_id, {})
+            for related_id in related_ids:
+                if related_id in edges:
+                    continue
+                edges[related_id] = reason
+                
+                path = self._find_path(related_id, mission_id)
+                if path is not None:
+                    cycle = [mission_id] + path
+                    self.cycles.append(cycle)
+                    logger.warning(f"⚠️ Cascade rules form a cycle: {' → '.join(cycle)}")
+            self._botch_closures.clear()
+    
+    def _find_path(self, source: str, target: str) -> Optional[List[str]]:
+        """Path of mission IDs from source to target in the botch graph, or None"""
+        parents: Dict[str, Optional[str]] = {source: None}
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            if current == target:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = parents[current]
+                return path[::-1]
+            for related_id in self.botch_graph.get(current, {}):
+                if related_id not in parents:
+                    parents[related_id] = current
+                    queue.append(related_id)
+        return None
+    
+    def get_botch_closure(self, mission_id: str) -> Tuple[Tuple[str, str, str], ...]:
+        """
+        Missions transitively botched along with a mission
         
-        for rule in rules:
-            effect_type = rule['type']
-            effect_data = rule['data']
+        Returns:
+            (related mission ID, reason, mission it is botched via) tuples in
+            breadth-first order, each mission once and never mission_id itself
+        """
+        with self._graph_lock:
+            closure = self._botch_closures.get(mission_id)
+            if closure is not None:
+                return closure
             
-            try:
-                if effect_type == 'botch_related_missions':
-                    self._botch_related_missions(effect_data['mission_ids'], 
-                                               effect_data.get('reason', 'Related mission failed'))
-                
-                elif effect_type == 'modify_faction_standing':
-                    self._modify_faction_standing(effect_data['faction'], 
-                                                 effect_data['change'],
-                                                 effect_data.get('reason', 'Mission failure'))
-                
-                elif effect_type == 'update_shared_data':
-                    self._update_shared_data(effect_data['key'], effect_data['value'])
-                
-                elif effect_type == 'unlock_alternative':
-                    self._unlock_alternative_mission(effect_data['alternative_mission_id'])
-                
-                elif effect_type == 'lock_location':
-                    self._lock_location(effect_data['location'], 
-                                       effect_data.get('duration', 3600))  # 1 hour default
-                
-                elif effect_type == 'affect_npc_status':
-                    self._affect_npc_status(effect_data['npc_id'], effect_data['status'])
-                
-                elif effect_type == 'trigger_event':
-                    self._trigger_world_event(effect_data['event_type'], effect_data.get('event_data', {}))
-
-            except (TypeError, KeyError, AttributeError, ValueError) as e:
-                logger.error(f"❌ Failed to execute cascade rule {effect_type}: {e}")
+            seen = {mission_id}
+            entries = []
+            queue = deque([mission_id])
+            while queue:
+                current = queue.popleft()
+                for related_id, reason in self.botch_graph.get(current, {}).items():
+                    if related_id not in seen:
+                        seen.add(related_id)
+                        entries.append((related_id, reason, current))
+                        queue.append(related_id)
+            
+            closure = tuple(entries)
+            self._botch_closures[mission_id] = closure
+            return closure
     
-    def _botch_related_missions(self, mission_ids: List[str], reason: str):
-        """Botch a list of related missions"""
-        for related_id in mission_ids:
+    def preview_botch(self, mission_id: str) -> Dict[str, Any]:
+        """
+        Dry run of botching a mission: its full impact, without changing anything
+        
+        Related missions that are unknown, already botched or completed are
+        left out (missions depending on them are not).
+        
+        Returns:
+            Dict with 'mission_id', 'botched' ({'id', 'reason', 'via'} per
+            mission the cascade would botch) and 'effects' ({'mission_id',
+            'type', 'data'} per other rule of the botched missions)
+        """
+        botched = []
+        for related_id, reason, via in self.get_botch_closure(mission_id):
             related_mission = self.mission_manager.get_mission(related_id)
-            if related_mission and not related_mission.is_botched:
-                success = related_mission.botch()
-                if success:
-                    self.mission_manager.save_mission(related_mission)
-                    logger.warning(f"💥 Cascade botched mission: {related_mission.title} ({reason})")
+            if (related_mission is None or related_mission.is_botched
+                    or related_mission.state == MissionState.COMPLETED):
+                continue
+            botched.append({'id': related_id, 'reason': reason, 'via': via})
+        
+        effects = [effect for _, effect in self._effects_of([mission_id] + [entry['id'] for entry in botched])]
+        return {'mission_id': mission_id, 'botched': botched, 'effects': effects}
+    
+    def _effects_of(self, source_ids: List[str]) -> List[Tuple[Tuple[str, int], Dict[str, Any]]]:
+        """((mission ID, rule index), effect) for every non-botch rule of the given missions"""
+        effects = []
+        for source_id in source_ids:
+            for index, rule in enumerate(self.cascade_rules.get(source_id, [])):
+                if rule['type'] != 'botch_related_missions':
+                    effects.append(((source_id, index),
+                                    {'mission_id': source_id, 'type': rule['type'], 'data': rule['data']}))
+        return effects
+    
+    def on_mission_botched(self, mission_data: Any, context: Optional[Dict[str, Any]]):
+        """
+        Background 'mission_botched' trigger: run the cascade of the botched mission
+        
+        The job queue passes the same context object to every retry of the
+        job, so it carries the record of what the failed attempts applied.
+        """
+        context = context if context is not None else {}
+        applied = context.setdefault('cascade_applied', set())
+        return self.handle_mission_botched(mission_data.id, context.get('context') or {}, applied)
+    
+    def handle_mission_botched(self, mission_id: str, context: Dict[str, Any],
+                               applied: Optional[set] = None) -> Dict[str, Any]:
+        """
+        Handle cascade effects when a mission is botched
+        
+        Botches the whole closure first and saves each botched mission once,
+        then applies the other rules of every mission botched.
+        
+        Args:
+            mission_id: The botched mission
+            context: Botch context from the caller
+            applied: Record of missions botched and rules applied by earlier
+                attempts of this cascade, updated as it goes. Passing the same
+                set to a retry makes it idempotent: nothing is applied twice
+        
+        Returns:
+            The impact applied by this call, shaped like preview_botch()
+        """
+        applied = set() if applied is None else applied
+        impact = self.preview_botch(mission_id)
+        
+        newly_botched = []
+        botched_missions = []
+        for entry in impact['botched']:
+            related_mission = self.mission_manager.get_mission(entry['id'])
+            if related_mission and not related_mission.is_botched and related_mission.botch():
+                applied.add(('botched', entry['id']))
+                newly_botched.append(entry)
+                botched_missions.append(related_mission)
+                logger.warning(f"💥 Cascade botched mission: {related_mission.title} ({entry['reason']})")
+        for related_mission in botched_missions:
+            self.mission_manager.save_mission(related_mission)
+        
+        # Missions botched by this cascade, including by a failed earlier attempt
+        sources = [mission_id] + [related_id for related_id, _, _ in self.get_botch_closure(mission_id)
+                                  if ('botched', related_id) in applied]
+        effects = []
+        for key, effect in self._effects_of(sources):
+            if ('effect', key) in applied:
+                continue
+            self._apply_effect(effect['type'], effect['data'])
+            applied.add(('effect', key))
+            effects.append(effect)
+        
+        logger.info(f"🌊 Cascade of botched mission {mission_id}: "
+                    f"{len(newly_botched)} missions botched, {len(effects)} effects")
+        
+        impact['botched'] = newly_botched
+        impact['effects'] = effects
+        return impact
+    
+    def _apply_effect(self, effect_type: str, effect_data: Dict[str, Any]):
+        """Run one non-botch cascade rule"""
+        try:
+            if effect_type == 'modify_faction_standing':
+                self._modify_faction_standing(effect_data['faction'], 
+                                             effect_data['change'],
+                                             effect_data.get('reason', 'Mission failure'))
+            
+            elif effect_type == 'update_shared_data':
+                self._update_shared_data(effect_data['key'], effect_data['value'])
+            
+            elif effect_type == 'unlock_alternative':
+                self._unlock_alternative_mission(effect_data['alternative_mission_id'])
+            
+            elif effect_type == 'lock_location':
+                self._lock_location(effect_data['location'], 
+                                   effect_data.get('duration', 3600))  # 1 hour default
+            
+            elif effect_type == 'affect_npc_status':
+                self._affect_npc_status(effect_data['npc_id'], effect_data['status'])
+            
+            elif effect_type == 'trigger_event':
+                self._trigger_world_event(effect_data['event_type'], effect_data.get('event_data', {}))
+
+        except (TypeError, KeyError, AttributeError, ValueError) as e:
+            logger.error(f"❌ Failed to execute cascade rule {effect_type}: {e}")
     
     def _modify_faction_standing(self, faction: str, change: float, reason: str):
         """Modify faction standing due to mission failure"""
-        current_standing = self.shared_data.get('faction_standings', {})
-        if faction not in current_standing:
-            current_standing[faction] = 0.0
+        with self._shared_data_lock:
+            current_standing = self.shared_data.get('faction_standings', {})
+            if faction not in current_standing:
+                current_standing[faction] = 0.0
         
-        current_standing[faction] += change
-        current_standing[faction] = max(-100, min(100, current_standing[faction]))  # Clamp to [-100, 100]
+            current_standing[faction] += change
+            current_standing[faction] = max(-100, min(100, current_standing[faction]))  # Clamp to [-100, 100]
         
-        self.shared_data['faction_standings'] = current_standing
+            self.shared_data['faction_standings'] = current_standing
         
-        standing_change = "increased" if change > 0 else "decreased"
-        logger.info(f"📊 Faction standing {standing_change}: {faction} {change:+.1f} ({reason})")
+            standing_change = "increased" if change > 0 else "decreased"
+            logger.info(f"📊 Faction standing {standing_change}: {faction} {change:+.1f} ({reason})")
     
     def _update_shared_data(self, key: str, value: Any):
         """Update shared world state data"""
-        self.shared_data[key] = value
-        logger.debug(f"🔄 Updated shared data: {key} = {value}")
+        with self._shared_data_lock:
+            self.shared_data[key] = value
+            logger.debug(f"🔄 Updated shared data: {key} = {value}")
     
     def _unlock_alternative_mission(self, alternative_mission_id: str):
         """Unlock alternative mission path"""
@@ -111,33 +275,36 @@ class MissionCascadeHandler:
     def _lock_location(self, location: str, duration: int):
         """Lock a location due to mission failure"""
         import time
-        unlock_time = time.time() + duration
+        with self._shared_data_lock:
+            unlock_time = time.time() + duration
         
-        locked_locations = self.shared_data.get('locked_locations', {})
-        locked_locations[location] = unlock_time
-        self.shared_data['locked_locations'] = locked_locations
+            locked_locations = self.shared_data.get('locked_locations', {})
+            locked_locations[location] = unlock_time
+            self.shared_data['locked_locations'] = locked_locations
         
-        logger.warning(f"🔒 Location locked: {location} (for {duration} seconds)")
+            logger.warning(f"🔒 Location locked: {location} (for {duration} seconds)")
     
     def _affect_npc_status(self, npc_id: str, status: str):
         """Affect NPC status due to mission failure"""
-        npc_statuses = self.shared_data.get('npc_statuses', {})
-        npc_statuses[npc_id] = status
-        self.shared_data['npc_statuses'] = npc_statuses
+        with self._shared_data_lock:
+            npc_statuses = self.shared_data.get('npc_statuses', {})
+            npc_statuses[npc_id] = status
+            self.shared_data['npc_statuses'] = npc_statuses
         
-        logger.info(f"👤 NPC status changed: {npc_id} → {status}")
+            logger.info(f"👤 NPC status changed: {npc_id} → {status}")
     
     def _trigger_world_event(self, event_type: str, event_data: Dict[str, Any]):
         """Trigger a world event due to mission failure"""
-        world_events = self.shared_data.get('triggered_events', [])
-        world_events.append({
-            'type': event_type,
-            'data': event_data,
-            'timestamp': logger.info(f"🌍 World event triggered: {event_type}")
-        })
-        self.shared_data['triggered_events'] = world_events
+        with self._shared_data_lock:
+            world_events = self.shared_data.get('triggered_events', [])
+            world_events.append({
+                'type': event_type,
+                'data': event_data,
+                'timestamp': logger.info(f"🌍 World event triggered: {event_type}")
+            })
+            self.shared_data['triggered_events'] = world_events
         
-        logger.info(f"🌍 World event triggered: {event_type}")
+            logger.info(f"🌍 World event triggered: {event_type}")
     
     def _register_default_cascade_rules(self):
         """Register default cascade rules for common mission types"""
@@ -239,19 +406,20 @@ class MissionCascadeHandler:
     def is_location_locked(self, location: str) -> bool:
         """Check if location is currently locked"""
         import time
-        locked_locations = self.shared_data.get('locked_locations', {})
+        with self._shared_data_lock:
+            locked_locations = self.shared_data.get('locked_locations', {})
         
-        if location not in locked_locations:
-            return False
+            if location not in locked_locations:
+                return False
         
-        unlock_time = locked_locations[location]
-        if time.time() > unlock_time:
-            # Location should be unlocked now
-            del locked_locations[location]
-            self.shared_data['locked_locations'] = locked_locations
-            return False
+            unlock_time = locked_locations[location]
+            if time.time() > unlock_time:
+                # Location should be unlocked now
+                del locked_locations[location]
+                self.shared_data['locked_locations'] = locked_locations
+                return False
         
-        return True
+            return True
     
     def get_faction_standing(self, faction: str) -> float:
         """Get current faction standing"""
@@ -269,5 +437,7 @@ class MissionCascadeHandler:
             'shared_data_keys': len(self.shared_data),
             'faction_standings': self.shared_data.get('faction_standings', {}),
             'locked_locations': list(self.shared_data.get('locked_locations', {}).keys()),
-            'active_world_events': len(self.shared_data.get('triggered_events', []))
+            'active_world_events': len(self.shared_data.get('triggered_events', [])),
+            'botch_graph_edges': sum(len(edges) for edges in self.botch_graph.values()),
+            'cascade_cycles': [list(cycle) for cycle in self.cycles]
         }
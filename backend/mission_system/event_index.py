@@ -0,0 +1,138 @@
+"""
+Mission Event Index
+Subscription index routing game events to the missions they can progress
+
+Every mission that can react to a game event subscribes under
+(event type, target key), e.g. ('enemy_destroyed', 'pirate_fighter') for
+an accepted elimination mission hunting pirate fighters. A subscription
+also records the IDs of the objectives the event progresses, found once
+by keyword instead of on every event. Delivering an event then reads one
+bucket instead of scanning and matching every active mission.
+
+MissionManager keeps subscriptions current from its reindex hook (state,
+botched and save changes) and from the missions' fields listener
+(objective and custom field changes).
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .mission import Mission, MissionState, Objective
+
+# Event type -> (mission types, subscribed states, objective keyword,
+#                mission target key, event target key)
+EVENT_SUBSCRIPTIONS: Dict[str, Tuple[tuple, tuple, str, Callable[[Mission], Any], Callable[[Dict[str, Any]], Any]]] = {
+    'enemy_destroyed': (
+        ('elimination',), (MissionState.ACCEPTED,), 'eliminate',
+        lambda mission: mission.custom_fields.get('target_enemy_type'),
+        lambda event: event.get('enemy_type')
+    ),
+    'location_reached': (
+        ('exploration', 'reconnaissance'), (MissionState.ACCEPTED,), 'explore',
+        lambda mission: mission.custom_fields.get('target_location'),
+        lambda event: event.get('location')
+    ),
+    'cargo_delivered': (
+        ('delivery',), (MissionState.ACCEPTED, MissionState.ACHIEVED), 'deliver',
+        lambda mission: (mission.custom_fields.get('cargo_type'), mission.custom_fields.get('destination')),
+        lambda event: (event.get('cargo_type'), event.get('delivery_location') or event.get('location'))
+    ),
+    'cargo_loaded': (
+        ('delivery',), (MissionState.ACCEPTED,), 'load',
+        lambda mission: mission.custom_fields.get('cargo_type'),
+        lambda event: event.get('cargo_type')
+    ),
+}
+
+# States in which a mission can hold any subscription
+SUBSCRIBED_STATES = frozenset(state for spec in EVENT_SUBSCRIPTIONS.values() for state in spec[1])
+
+
+def _keyword_objective_ids(mission: Mission, keyword: str) -> Tuple[str, ...]:
+    return tuple(obj.id for obj in mission.objectives if keyword in obj.description.lower())
+
+
+class MissionEventIndex:
+    """(event type, target key) -> subscribed mission IDs"""
+
+    def __init__(self):
+        # Bucket values are insertion-ordered dicts used as sets
+        self._subscribers: Dict[Tuple[str, Any], Dict[str, None]] = defaultdict(dict)
+        # Mission ID -> event type -> (target key, objective IDs)
+        self._subscriptions: Dict[str, Dict[str, Tuple[Any, Tuple[str, ...]]]] = {}
+
+    def _wanted_subscriptions(self, mission: Mission) -> Dict[str, Tuple[Any, Tuple[str, ...]]]:
+        if mission.is_botched or mission.state not in SUBSCRIBED_STATES:
+            return {}
+        wanted = {}
+        for event_type, (mission_types, states, keyword, mission_key, _) in EVENT_SUBSCRIPTIONS.items():
+            if mission.mission_type in mission_types and mission.state in states:
+                key = mission_key(mission)
+                try:
+                    hash(key)
+                except TypeError:
+                    continue
+                wanted[event_type] = (key, _keyword_objective_ids(mission, keyword))
+        return wanted
+
+    def update(self, mission: Mission):
+        """Bring a mission's subscriptions in line with its state, type, targets and objectives"""
+        wanted = self._wanted_subscriptions(mission)
+        current = self._subscriptions.get(mission.id, {})
+        if wanted == current:
+            return
+
+        for event_type, (key, _) in current.items():
+            if event_type not in wanted or wanted[event_type][0] != key:
+                self._discard(event_type, key, mission.id)
+        for event_type, (key, _) in wanted.items():
+            self._subscribers[(event_type, key)][mission.id] = None
+
+        if wanted:
+            self._subscriptions[mission.id] = wanted
+        else:
+            self._subscriptions.pop(mission.id, None)
+
+    def remove(self, mission_id: str):
+        for event_type, (key, _) in self._subscriptions.pop(mission_id, {}).items():
+            self._discard(event_type, key, mission_id)
+
+    def _discard(self, event_type: str, key: Any, mission_id: str):
+        bucket = self._subscribers.get((event_type, key))
+        if bucket is not None:
+            bucket.pop(mission_id, None)
+            if not bucket:
+                del self._subscribers[(event_type, key)]
+
+    def subscribers(self, event_type: str, event_data: Dict[str, Any]) -> List[str]:
+        """IDs of missions subscribed to an event, in subscription order"""
+        spec = EVENT_SUBSCRIPTIONS.get(event_type)
+        if spec is None:
+            return []
+        try:
+            bucket = self._subscribers.get((event_type, spec[4](event_data)))
+        except TypeError:
+            # Unhashable target value in the event payload
+            return []
+        return list(bucket) if bucket else []
+
+    def objectives_for(self, mission: Mission, event_type: str) -> List[Objective]:
+        """
+        Objectives of a mission that an event type progresses
+
+        Uses the IDs recorded at subscription time; missions without a
+        subscription fall back to the keyword match.
+        """
+        subscription = self._subscriptions.get(mission.id, {}).get(event_type)
+        if subscription is not None:
+            objective_ids = subscription[1]
+        else:
+            objective_ids = _keyword_objective_ids(mission, EVENT_SUBSCRIPTIONS[event_type][2])
+        by_id = {obj.id: obj for obj in mission.objectives} if objective_ids else {}
+        return [by_id[objective_id] for objective_id in objective_ids if objective_id in by_id]
+
+    def subscription_count(self, mission_id: Optional[str] = None) -> int:
+        """Subscriptions of one mission, or of all missions"""
+        if mission_id is not None:
+            return len(self._subscriptions.get(mission_id, {}))
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
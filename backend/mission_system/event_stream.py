@@ -0,0 +1,173 @@
+"""
+Mission Event Stream
+Broadcast of mission changes to connected frontends
+
+MissionTriggerSystem passes every fired trigger to its listeners; the
+stream is one of them. Each trigger becomes one small event (mission ID,
+state, progress counters and the trigger's hook payloads) that is JSON
+encoded once and kept in a bounded buffer under an increasing ID. SSE
+connections and long-poll requests read the buffer from the last ID they
+saw, so clients are told what changed instead of polling and
+re-serializing whole missions.
+
+A client that falls further behind than the buffer reaches gets a reset
+marker and should reload mission state once.
+
+The buffer lives in the process that fired the triggers. Under a multi
+process server (gunicorn --workers N) a client only sees events raised by
+the worker serving its connection, so deployments that rely on the stream
+must route mission requests and streams to a single worker process.
+Each open SSE connection also holds a server thread, so the number of
+concurrent streams is capped (max_clients); clients over the cap use the
+long-poll endpoint.
+"""
+
+import itertools
+import json
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from backend.constants import MISSION_STREAM_BUFFER_SIZE, MISSION_STREAM_MAX_CLIENTS
+
+logger = logging.getLogger(__name__)
+
+
+class MissionStreamEvent:
+    """One published change; `data` is the JSON text sent to clients"""
+
+    __slots__ = ('id', 'event', 'mission_id', 'data')
+
+    def __init__(self, event_id: int, event: str, mission_id: Optional[str], data: str):
+        self.id = event_id
+        self.event = event
+        self.mission_id = mission_id
+        self.data = data
+
+    def to_sse(self) -> str:
+        """Server-Sent Events frame"""
+        return f"id: {self.id}\nevent: {self.event}\ndata: {self.data}\n\n"
+
+    def to_json(self) -> str:
+        """{"id", "event", "data"} object reusing the encoded payload"""
+        return f'{{"id":{self.id},"event":{json.dumps(self.event)},"data":{self.data}}}'
+
+
+def mission_event_payload(event_type: str, mission_data: Any, context: Optional[Dict[str, Any]],
+                          hooks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Client payload of a fired trigger"""
+    payload: Dict[str, Any] = {'mission_id': getattr(mission_data, 'id', None)}
+    if hasattr(mission_data, 'get_progress'):
+        payload['progress'] = mission_data.get_progress()
+    if context:
+        for key in ('objective_id', 'reason'):
+            if context.get(key) is not None:
+                payload[key] = context[key]
+    if hooks:
+        payload['hooks'] = hooks
+    return payload
+
+
+class MissionEventStream:
+    """Bounded, ID-ordered buffer of mission events with blocking reads"""
+
+    def __init__(self, buffer_size: int = MISSION_STREAM_BUFFER_SIZE,
+                 max_clients: int = MISSION_STREAM_MAX_CLIENTS):
+        """
+        Args:
+            buffer_size: Recent events kept for resuming and polling clients
+            max_clients: Concurrent streaming connections allowed in this process
+        """
+        self.max_clients = max(0, max_clients)
+        self._clients = 0
+        self._events: Deque[MissionStreamEvent] = deque(maxlen=max(1, buffer_size))
+        self._last_id = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self.stats = {'published': 0, 'dropped': 0}
+
+    def open_client(self) -> bool:
+        """Claim a streaming connection slot; False if max_clients streams are open"""
+        with self._condition:
+            if self._clients >= self.max_clients:
+                return False
+            self._clients += 1
+            return True
+
+    def close_client(self):
+        """Release a slot claimed by open_client()"""
+        with self._condition:
+            self._clients = max(0, self._clients - 1)
+
+    @property
+    def client_count(self) -> int:
+        with self._condition:
+            return self._clients
+
+    @property
+    def last_event_id(self) -> int:
+        with self._condition:
+            return self._last_id
+
+    def publish(self, event_type: str, mission_data: Any, context: Optional[Dict[str, Any]],
+                hooks: List[Dict[str, Any]]):
+        """Trigger listener: encode a fired trigger once and wake waiting clients"""
+        try:
+            data = json.dumps(mission_event_payload(event_type, mission_data, context, hooks),
+                              separators=(',', ':'), default=str)
+        except (TypeError, ValueError) as e:
+            logger.error(f"❌ Could not encode mission stream event {event_type}: {e}")
+            self.stats['dropped'] += 1
+            return
+
+        with self._condition:
+            self._last_id += 1
+            self._events.append(MissionStreamEvent(self._last_id, event_type,
+                                                   getattr(mission_data, 'id', None), data))
+            self.stats['published'] += 1
+            self._condition.notify_all()
+
+    def events_after(self, last_id: int, timeout: Optional[float] = None,
+                     mission_id: Optional[str] = None) -> Tuple[List[MissionStreamEvent], bool, int]:
+        """
+        Events published after last_id, waiting up to timeout for the first one
+
+        Args:
+            last_id: ID of the last event the client received
+            timeout: Seconds to block while there is nothing new, None waits indefinitely
+            mission_id: Only return events of this mission
+
+        Returns:
+            (events, reset, new last ID) where reset is True if events after
+            last_id were already dropped from the buffer
+        """
+        with self._condition:
+            if last_id > self._last_id:
+                # ID from before a restart
+                return [], True, self._last_id
+            self._condition.wait_for(lambda: self._last_id > last_id or self._closed, timeout)
+            if self._last_id <= last_id:
+                return [], False, last_id
+
+            oldest_id = self._events[0].id
+            reset = last_id < oldest_id - 1
+            # IDs are consecutive, so the buffer position follows from the ID
+            start = max(0, last_id - oldest_id + 1)
+            events = list(itertools.islice(self._events, start, None))
+            new_last_id = self._last_id
+
+        if mission_id is not None:
+            events = [event for event in events if event.mission_id == mission_id]
+        return events, reset, new_last_id
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self):
+        """Wake every waiting client so open streams can end"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
@@ -0,0 +1,204 @@
+"""
+Mission Job Queue
+Background execution of trigger callbacks and cascade effects
+
+Work that does not shape an API response (background trigger callbacks,
+botch cascades) is submitted as a job keyed by mission ID instead of
+running inside the request. A small pool of worker threads runs jobs with
+bounded concurrency; jobs with the same key run one at a time in
+submission order, so effects on one mission never interleave. A job that
+raises is retried with a growing delay before it is reported as failed.
+
+With zero workers jobs run inline on the submitting thread, which keeps
+behaviour synchronous (and deterministic) where that is preferred.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from backend.constants import (
+    MISSION_JOB_MAX_RETRIES,
+    MISSION_JOB_RETRY_DELAY,
+    MISSION_JOB_WORKERS
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MissionJob:
+    """A submitted unit of work; wait() blocks until it succeeded or gave up"""
+
+    def __init__(self, key: str, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any],
+                 description: Optional[str] = None):
+        self.key = key
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.description = description or getattr(func, '__name__', 'job')
+        self.attempts = 0
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finished; False on timeout"""
+        return self._done.wait(timeout)
+
+
+class MissionJobQueue:
+    """
+    Worker pool running jobs with per-key ordering and retries
+
+    Usage:
+        queue = MissionJobQueue(workers=2)
+        queue.submit(mission.id, cascade_handler.handle_mission_botched, mission.id, context)
+        queue.wait()  # e.g. in tests
+    """
+
+    def __init__(self, workers: int = MISSION_JOB_WORKERS,
+                 max_retries: int = MISSION_JOB_MAX_RETRIES,
+                 retry_delay: float = MISSION_JOB_RETRY_DELAY):
+        """
+        Args:
+            workers: Worker threads (maximum concurrent jobs), 0 runs jobs inline
+            max_retries: Extra attempts for a job that raises
+            retry_delay: Seconds before the first retry, doubled for each further one
+        """
+        self.workers = max(0, workers)
+        self.max_retries = max(0, max_retries)
+        self.retry_delay = retry_delay
+
+        # Key -> jobs waiting behind the one running for that key
+        self._pending: Dict[str, Deque[MissionJob]] = {}
+        # Keys with a job ready to run, in the order they became ready
+        self._ready: Deque[str] = deque()
+        self._unfinished = 0
+        self._condition = threading.Condition()
+        self._threads = []
+        self._closed = False
+
+        self.stats = {'submitted': 0, 'completed': 0, 'retries': 0, 'failed': 0}
+
+    def submit(self, key: str, func: Callable[..., Any], *args,
+               description: Optional[str] = None, **kwargs) -> MissionJob:
+        """
+        Queue func(*args, **kwargs) behind earlier jobs with the same key
+
+        Args:
+            key: Ordering key, normally the mission ID
+            func: Callable to run
+            description: Name used in logs, defaults to the function name
+        """
+        job = MissionJob(key, func, args, kwargs, description)
+        with self._condition:
+            self.stats['submitted'] += 1
+            self._unfinished += 1
+            inline = self.workers == 0 or self._closed
+            if not inline:
+                queue = self._pending.get(key)
+                if queue is None:
+                    # No job of this key is queued or running
+                    self._pending[key] = deque([job])
+                    self._ready.append(key)
+                    self._condition.notify_all()
+                else:
+                    queue.append(job)
+
+        if inline:
+            self._execute(job)
+        else:
+            self._ensure_threads()
+        return job
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every submitted job has finished
+
+        Returns:
+            False if the timeout expired first
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._unfinished == 0, timeout)
+
+    @property
+    def pending_count(self) -> int:
+        """Jobs submitted but not finished"""
+        with self._condition:
+            return self._unfinished
+
+    def close(self, timeout: Optional[float] = None):
+        """Finish queued jobs and stop the workers; later submissions run inline"""
+        self.wait(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        if self._threads:
+            atexit.unregister(self.close)
+        self._threads = []
+
+    def _ensure_threads(self):
+        with self._condition:
+            if self._threads or self._closed:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'mission-jobs-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        atexit.register(self.close)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._ready or self._closed)
+                if not self._ready:
+                    return
+                key = self._ready.popleft()
+                job = self._pending[key][0]
+
+            self._execute(job)
+
+            with self._condition:
+                queue = self._pending[key]
+                queue.popleft()
+                if queue:
+                    self._ready.append(key)
+                    self._condition.notify_all()
+                else:
+                    del self._pending[key]
+
+    def _execute(self, job: MissionJob):
+        """Run a job with retries, then mark it finished"""
+        delay = self.retry_delay
+        while True:
+            job.attempts += 1
+            try:
+                job.result = job.func(*job.args, **job.kwargs)
+                job.error = None
+                break
+            except Exception as e:
+                job.error = e
+                if job.attempts > self.max_retries:
+                    logger.error(f"❌ Mission job {job.description} for {job.key} failed "
+                                 f"after {job.attempts} attempts: {e}")
+                    break
+                logger.warning(f"⚠️ Mission job {job.description} for {job.key} failed, retrying: {e}")
+                with self._condition:
+                    self.stats['retries'] += 1
+                time.sleep(delay)
+                delay *= 2
+
+        job._done.set()
+        with self._condition:
+            self.stats['failed' if job.error is not None else 'completed'] += 1
+            self._unfinished -= 1
+            self._condition.notify_all()
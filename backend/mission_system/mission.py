@@ -4,13 +4,17 @@ Implementation of Mission, MissionState, and Objective classes
 Following docs/mission_spec.md specification exactly
 """
 
+import copy
 import json
+import sys
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Dict, Any, Optional, Union
+from typing import Callable, List, Dict, Any, Optional, Union
 import logging
 
+from .atomic_io import DirectorySyncGroup, atomic_write_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +29,23 @@ def parse_iso_datetime(date_string: str) -> datetime:
     return datetime.fromisoformat(date_string)
 
 
+# 'format' marker of compact storage documents (Mission.to_storage_dict)
+STORAGE_FORMAT = 2
+
+
+def _intern(value: Any) -> Any:
+    """Interned copy of a string, other values unchanged"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _to_epoch(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value is not None else None
+
+
+def _from_epoch(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value, timezone.utc) if value is not None else None
+
+
 class MissionState(Enum):
     """Mission state enumeration - forward progression only"""
     UNKNOWN = "Unknown"
@@ -46,20 +67,106 @@ class MissionState(Enum):
             MissionState.COMPLETED
         ]
         return order.index(self) < order.index(other)
+    
+    @property
+    def ordinal(self) -> int:
+        """Position in the forward progression, used by the compact storage format"""
+        return _STATE_ORDINALS[self]
+    
+    @classmethod
+    def from_ordinal(cls, ordinal: int) -> 'MissionState':
+        return _STATES_BY_ORDINAL[ordinal]
+
+
+_STATES_BY_ORDINAL = tuple(MissionState)
+_STATE_ORDINALS = {state: i for i, state in enumerate(_STATES_BY_ORDINAL)}
+
+
+class CustomFields(dict):
+    """
+    Mission.custom_fields: a dict that reports its changes to the mission
+    
+    Subscription targets such as target_enemy_type live here, so writes run
+    the mission's fields listener (MissionManager event reindexing). Copies
+    are plain dicts.
+    """
+    
+    __slots__ = ('_mission',)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._mission: Optional['Mission'] = None
+    
+    def _changed(self):
+        if self._mission is not None:
+            self._mission._notify_fields_listener()
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(_intern(key), value)
+        self._changed()
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+    
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+    
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self._changed()
+        return value
+    
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+    
+    def clear(self):
+        super().clear()
+        self._changed()
+    
+    def copy(self) -> Dict[str, Any]:
+        return dict(self)
+    
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+    
+    def __deepcopy__(self, memo) -> Dict[str, Any]:
+        return copy.deepcopy(dict(self), memo)
+    
+    def __reduce__(self):
+        return (dict, (dict(self),))
 
 
 class Objective:
     """Individual mission objective"""
     
+    __slots__ = ('id', 'description', 'is_achieved', 'is_optional', 'is_ordered',
+                 'achieved_at', 'progress', '_mission')
+    
     def __init__(self, id: Union[str, int], description: str, 
                  is_optional: bool = False, is_ordered: bool = False):
-        self.id = str(id)
+        self.id = _intern(str(id))
         self.description = description
         self.is_achieved = False
         self.is_optional = is_optional
         self.is_ordered = is_ordered
         self.achieved_at = None
         self.progress = 0.0  # Progress between 0.0 and 1.0
+        # Owning mission, whose progress counters achieve() updates
+        self._mission: Optional['Mission'] = None
         
     def achieve(self):
         """Mark objective as achieved"""
@@ -67,6 +174,8 @@ class Objective:
             self.is_achieved = True
             self.progress = 1.0
             self.achieved_at = datetime.now(timezone.utc)
+            if self._mission is not None:
+                self._mission._count_achieved(self)
             logger.info(f"📋 Objective achieved: {self.description}")
     
     def to_dict(self) -> Dict[str, Any]:
@@ -81,9 +190,21 @@ class Objective:
             'achieved_at': self.achieved_at.isoformat() if self.achieved_at else None
         }
     
+    def to_storage_dict(self) -> Dict[str, Any]:
+        """Compact form for Mission.to_storage_dict (epoch achieved_at)"""
+        return {
+            'id': self.id,
+            'description': self.description,
+            'is_achieved': self.is_achieved,
+            'is_optional': self.is_optional,
+            'is_ordered': self.is_ordered,
+            'progress': self.progress,
+            'achieved_at': _to_epoch(self.achieved_at)
+        }
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Objective':
-        """Create objective from dictionary"""
+        """Create objective from dictionary (verbose or compact storage form)"""
         obj = cls(
             id=data['id'],
             description=data['description'],
@@ -92,13 +213,37 @@ class Objective:
         )
         obj.is_achieved = data.get('is_achieved', False)
         obj.progress = data.get('progress', 0.0)
-        if data.get('achieved_at'):
-            obj.achieved_at = parse_iso_datetime(data['achieved_at'])
+        achieved_at = data.get('achieved_at')
+        if isinstance(achieved_at, (int, float)):
+            obj.achieved_at = _from_epoch(achieved_at)
+        elif achieved_at:
+            obj.achieved_at = parse_iso_datetime(achieved_at)
         return obj
 
 
 class Mission:
-    """Core Mission class following specification exactly"""
+    """
+    Core Mission class following specification exactly
+    
+    Missions are kept resident by the tens of thousands, so attributes live in
+    __slots__ (no per-instance __dict__) and the low-cardinality strings
+    (type, location, faction, client) are interned to share one copy.
+    
+    Objective counts behind get_progress() and check_completion() are kept
+    up to date by add_objective(), Objective.achieve() and assignments to
+    objectives, so progress is O(1); call recount_objectives() after
+    changing objectives any other way.
+    
+    add_objective(), assignments to objectives or custom_fields and writes
+    to custom_fields run the fields listener, so MissionManager's event
+    subscriptions follow target and objective changes without a save.
+    """
+    
+    __slots__ = ('id', 'title', 'description', 'mission_type', 'location', 'faction',
+                 'reward_package_id', 'client', 'state', 'is_botched', '_objectives',
+                 'created_at', 'updated_at', '_custom_fields', 'triggers', '_state_listener',
+                 '_fields_listener',
+                 '_achieved_count', '_required_count', '_achieved_required_count')
     
     def __init__(self, mission_id: str, title: str, description: str, 
                  mission_type: str = "exploration", location: str = "unknown",
@@ -106,16 +251,19 @@ class Mission:
         self.id = mission_id
         self.title = title
         self.description = description
-        self.mission_type = mission_type
-        self.location = location
-        self.faction = faction
+        self.mission_type = _intern(mission_type)
+        self.location = _intern(location)
+        self.faction = _intern(faction)
         self.reward_package_id = reward_package_id
-        self.client = client or "Mission Control"
+        self.client = _intern(client or "Mission Control")
         
         # Core state management (from spec)
         self.state = MissionState.UNKNOWN
         self.is_botched = False
         
+        # Called after objective or custom field changes (MissionManager reindexing)
+        self._fields_listener: Optional[Callable[['Mission'], None]] = None
+        
         # Objectives system
         self.objectives: List[Objective] = []
         
@@ -129,6 +277,9 @@ class Mission:
         # Trigger data for event system
         self.triggers: Dict[str, Any] = {}
         
+        # Called after state or botched changes (MissionManager reindexing)
+        self._state_listener: Optional[Callable[['Mission'], None]] = None
+        
     def set_state(self, new_state: Union[str, MissionState], objective_id: Optional[str] = None) -> bool:
         """
         Advance mission state (forward progression only)
@@ -181,8 +332,64 @@ class Mission:
                 self.state = MissionState.COMPLETED
                 logger.info(f"🎉 Mission {self.id} auto-completed!")
         
+        self._notify_state_listener()
         return True
     
+    @property
+    def objectives(self) -> List[Objective]:
+        return self._objectives
+    
+    @objectives.setter
+    def objectives(self, objectives: List[Objective]):
+        self._objectives = objectives
+        self.recount_objectives()
+        self._notify_fields_listener()
+    
+    @property
+    def custom_fields(self) -> CustomFields:
+        return self._custom_fields
+    
+    @custom_fields.setter
+    def custom_fields(self, fields: Dict[str, Any]):
+        self._custom_fields = CustomFields({_intern(key): value for key, value in fields.items()})
+        self._custom_fields._mission = self
+        self._notify_fields_listener()
+    
+    def recount_objectives(self):
+        """Rebuild the progress counters from the objectives list"""
+        self._achieved_count = self._required_count = self._achieved_required_count = 0
+        for objective in self._objectives:
+            objective._mission = self
+            self._count_objective(objective)
+    
+    def _count_objective(self, objective: Objective):
+        if not objective.is_optional:
+            self._required_count += 1
+        if objective.is_achieved:
+            self._count_achieved(objective)
+    
+    def _count_achieved(self, objective: Objective):
+        """Counter update for a newly achieved objective (Objective.achieve)"""
+        self._achieved_count += 1
+        if not objective.is_optional:
+            self._achieved_required_count += 1
+    
+    def set_state_listener(self, listener: Optional[Callable[['Mission'], None]]):
+        """Register a callback run after every state or botched change"""
+        self._state_listener = listener
+    
+    def _notify_state_listener(self):
+        if self._state_listener is not None:
+            self._state_listener(self)
+    
+    def set_fields_listener(self, listener: Optional[Callable[['Mission'], None]]):
+        """Register a callback run after objectives or custom_fields change"""
+        self._fields_listener = listener
+    
+    def _notify_fields_listener(self):
+        if self._fields_listener is not None:
+            self._fields_listener(self)
+    
     def get_state(self) -> str:
         """
         Get current state string
@@ -204,6 +411,7 @@ class Mission:
         self.is_botched = True
         self.updated_at = datetime.now(timezone.utc)
         logger.warning(f"💥 Mission {self.id} botched!")
+        self._notify_state_listener()
         return True
     
     def unbotch(self) -> bool:
@@ -215,6 +423,7 @@ class Mission:
             self.is_botched = False
             self.updated_at = datetime.now(timezone.utc)
             logger.info(f"🔄 Mission {self.id} unbotched (redemption arc)")
+            self._notify_state_listener()
             return True
         return False
     
@@ -260,34 +469,28 @@ class Mission:
         Check if mission can be auto-advanced to completed
         From spec: check_completion() - Auto-advance if all non-optional objectives achieved
         """
-        if not self.objectives:
-            return True  # No objectives means completion depends on state only
-        
-        required_objectives = [obj for obj in self.objectives if not obj.is_optional]
-        if not required_objectives:
-            return True  # Only optional objectives
-        
-        return all(obj.is_achieved for obj in required_objectives)
+        # No objectives, or only optional ones, means completion depends on state only
+        return self._achieved_required_count == self._required_count
     
     def add_objective(self, objective: Objective):
         """Add objective to mission"""
-        self.objectives.append(objective)
+        self._objectives.append(objective)
+        objective._mission = self
+        self._count_objective(objective)
         self.updated_at = datetime.now(timezone.utc)
         logger.debug(f"📋 Added objective to mission {self.id}: {objective.description}")
+        self._notify_fields_listener()
     
     def get_progress(self) -> Dict[str, Any]:
-        """Get mission progress summary"""
-        total_objectives = len(self.objectives)
-        achieved_objectives = len([obj for obj in self.objectives if obj.is_achieved])
-        required_objectives = len([obj for obj in self.objectives if not obj.is_optional])
-        achieved_required = len([obj for obj in self.objectives 
-                                if obj.is_achieved and not obj.is_optional])
+        """Get mission progress summary (from the maintained objective counters)"""
+        required_objectives = self._required_count
+        achieved_required = self._achieved_required_count
         
         return {
             'state': self.get_state(),
             'is_botched': self.is_botched,
-            'total_objectives': total_objectives,
-            'achieved_objectives': achieved_objectives,
+            'total_objectives': len(self._objectives),
+            'achieved_objectives': self._achieved_count,
             'required_objectives': required_objectives,
             'achieved_required': achieved_required,
             'completion_percentage': (achieved_required / required_objectives * 100) if required_objectives > 0 else 100
@@ -312,14 +515,42 @@ class Mission:
             'objectives': [obj.to_dict() for obj in self.objectives],
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
-            'custom_fields': self.custom_fields,
+            'custom_fields': dict(self.custom_fields),
             'triggers': self.triggers,
             'progress': self.get_progress()
         }
     
+    def to_storage_dict(self) -> Dict[str, Any]:
+        """
+        Compact mission document for persistence
+        
+        Unlike to_dict (the API representation) the state is stored as its
+        ordinal, timestamps as epoch seconds and the derived progress
+        summary is omitted. from_dict reads both forms.
+        """
+        return {
+            'format': STORAGE_FORMAT,
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'mission_type': self.mission_type,
+            'location': self.location,
+            'faction': self.faction,
+            'reward_package_id': self.reward_package_id,
+            'client': self.client,
+            'state': self.state.ordinal,
+            'is_botched': self.is_botched,
+            'objectives': [obj.to_storage_dict() for obj in self.objectives],
+            'created_at': self.created_at.timestamp(),
+            'updated_at': self.updated_at.timestamp(),
+            'custom_fields': dict(self.custom_fields),
+            'triggers': self.triggers
+        }
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Mission':
-        """Create mission from dictionary (loading from JSON)"""
+        """Create mission from dictionary (loading from JSON, verbose or compact storage form)"""
+        compact = data.get('format') == STORAGE_FORMAT
         mission = cls(
             mission_id=data['id'],
             title=data['title'],
@@ -332,7 +563,10 @@ class Mission:
         )
         
         # Restore state
-        mission.state = MissionState(data.get('state', 'Unknown'))
+        if compact:
+            mission.state = MissionState.from_ordinal(data['state'])
+        else:
+            mission.state = MissionState(data.get('state', 'Unknown'))
         mission.is_botched = data.get('is_botched', False)
         
         # Restore objectives
@@ -342,28 +576,23 @@ class Mission:
         ]
         
         # Restore metadata
-        if data.get('created_at'):
+        if compact:
+            mission.created_at = _from_epoch(data['created_at'])
+            mission.updated_at = _from_epoch(data['updated_at'])
+        elif data.get('created_at'):
             mission.created_at = parse_iso_datetime(data['created_at'])
-        if data.get('updated_at'):
+        if not compact and data.get('updated_at'):
             mission.updated_at = parse_iso_datetime(data['updated_at'])
         
         # Restore custom fields and triggers
-        mission.custom_fields = data.get('custom_fields', {})
+        mission.custom_fields = data.get('custom_fields') or {}
         mission.triggers = data.get('triggers', {})
         
         return mission
     
     def save_to_file(self, directory: str) -> str:
         """Save mission to JSON file (one mission per file as per spec)"""
-        import os
-        os.makedirs(directory, exist_ok=True)
-        
-        filepath = os.path.join(directory, f"{self.id}.json")
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
-        
-        logger.debug(f"💾 Mission {self.id} saved to {filepath}")
-        return filepath
+        return write_mission_file(directory, self.to_storage_dict())
     
     @classmethod
     def load_from_file(cls, filepath: str) -> 'Mission':
@@ -374,3 +603,40 @@ class Mission:
         mission = cls.from_dict(data)
         logger.debug(f"📂 Mission {mission.id} loaded from {filepath}")
         return mission
+
+
+def write_mission_file(directory: str, mission_data: Dict[str, Any],
+                       sync_group: Optional[DirectorySyncGroup] = None) -> str:
+    """
+    Atomically write serialized mission data to <directory>/<mission id>.json
+
+    Args:
+        directory: Target directory, created if missing
+        mission_data: Output of Mission.to_storage_dict() (or to_dict())
+        sync_group: Defers the directory fsync to the group's commit()
+
+    Returns:
+        Path of the written file
+    """
+    import os
+    os.makedirs(directory, exist_ok=True)
+
+    filepath = os.path.join(directory, f"{mission_data['id']}.json")
+    atomic_write_json(filepath, mission_data, indent=None, sync_group=sync_group)
+
+    logger.debug(f"💾 Mission {mission_data['id']} saved to {filepath}")
+    return filepath
+
+
+def compact_mission_data(mission_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Storage form of serialized mission data in either format"""
+    if mission_data.get('format') == STORAGE_FORMAT:
+        return mission_data
+    return Mission.from_dict(mission_data).to_storage_dict()
+
+
+def expand_mission_data(mission_data: Dict[str, Any]) -> Dict[str, Any]:
+    """API (to_dict) form of serialized mission data in either format"""
+    if mission_data.get('format') != STORAGE_FORMAT:
+        return mission_data
+    return Mission.from_dict(mission_data).to_dict()
@@ -0,0 +1,124 @@
+"""
+Mission Cache
+Mission collection that hydrates Mission objects on first access
+
+MissionManager keeps its missions in a MissionCache. Every known mission
+ID is listed, but a Mission object is only built when the mission is
+first read. Resident missions are kept in LRU order and, above the
+capacity, the least recently used evictable ones are dropped again; the
+manager decides which missions are evictable (cold completed missions
+with no pending write).
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, MutableMapping, Optional
+
+from .mission import Mission
+
+logger = logging.getLogger(__name__)
+
+
+class MissionCache(MutableMapping):
+    """
+    Mapping of mission ID -> Mission with lazy hydration and bounded residency
+    """
+
+    def __init__(self, loader: Callable[[str], Optional[Mission]],
+                 capacity: Optional[int] = None,
+                 can_evict: Optional[Callable[[Mission], bool]] = None,
+                 on_hydrate: Optional[Callable[[Mission], None]] = None,
+                 on_evict: Optional[Callable[[Mission], None]] = None):
+        """
+        Args:
+            loader: Builds the Mission for a known ID, None if it cannot be loaded
+            capacity: Resident missions kept before evicting, None for no limit
+            can_evict: Whether a resident mission may be dropped
+            on_hydrate: Called with every mission built by the loader
+            on_evict: Called with every evicted mission
+        """
+        self.loader = loader
+        self.capacity = capacity
+        self.can_evict = can_evict or (lambda mission: True)
+        self.on_hydrate = on_hydrate
+        self.on_evict = on_evict
+
+        # Every known ID, in registration order
+        self._known: Dict[str, None] = {}
+        # Hydrated missions, least recently used first
+        self._resident: 'OrderedDict[str, Mission]' = OrderedDict()
+
+        self.stats = {'hydrated': 0, 'evicted': 0}
+
+    def add_known(self, mission_id: str):
+        """Register a mission that exists in storage without loading it"""
+        self._known.setdefault(mission_id, None)
+
+    def peek(self, mission_id: str) -> Optional[Mission]:
+        """Resident Mission for an ID without loading it or touching LRU order"""
+        return self._resident.get(mission_id)
+
+    def is_resident(self, mission_id: str) -> bool:
+        return mission_id in self._resident
+
+    @property
+    def resident_count(self) -> int:
+        return len(self._resident)
+
+    def __getitem__(self, mission_id: str) -> Mission:
+        mission = self._resident.get(mission_id)
+        if mission is not None:
+            self._resident.move_to_end(mission_id)
+            return mission
+
+        if mission_id not in self._known:
+            raise KeyError(mission_id)
+
+        mission = self.loader(mission_id)
+        if mission is None:
+            raise KeyError(mission_id)
+
+        self._resident[mission_id] = mission
+        self.stats['hydrated'] += 1
+        if self.on_hydrate is not None:
+            self.on_hydrate(mission)
+        self._evict(keep=mission_id)
+        return mission
+
+    def __setitem__(self, mission_id: str, mission: Mission):
+        self._known.setdefault(mission_id, None)
+        self._resident[mission_id] = mission
+        self._resident.move_to_end(mission_id)
+        self._evict(keep=mission_id)
+
+    def __delitem__(self, mission_id: str):
+        del self._known[mission_id]
+        self._resident.pop(mission_id, None)
+
+    def __contains__(self, mission_id) -> bool:
+        return mission_id in self._known
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._known))
+
+    def __len__(self) -> int:
+        return len(self._known)
+
+    def _evict(self, keep: str):
+        """Drop least recently used evictable missions, except keep, while above capacity"""
+        if self.capacity is None or len(self._resident) <= self.capacity:
+            return
+
+        # Each resident mission is examined at most once; pinned missions are
+        # moved behind the scan so later evictions skip them quickly
+        for mission_id in list(self._resident):
+            if len(self._resident) <= self.capacity:
+                break
+            mission = self._resident[mission_id]
+            if mission_id != keep and self.can_evict(mission):
+                del self._resident[mission_id]
+                self.stats['evicted'] += 1
+                if self.on_evict is not None:
+                    self.on_evict(mission)
+            else:
+                self._resident.move_to_end(mission_id)
@@ -0,0 +1,247 @@
+"""
+Mission Journal
+Append-only NDJSON log of mission mutations
+
+Saving a mission used to mean rewriting its whole document. With the
+journal enabled, MissionManager appends one line per save instead: the
+full document the first time a mission is saved after a snapshot, then
+only what changed (top-level fields such as state and updated_at,
+objective fields, custom_field keys set or removed). Mission files are
+brought up to date by periodic snapshots, after which the journal segment
+is rotated out and kept as an audit trail of recent mutations.
+
+On startup the current segment is replayed into the mission files before
+they are loaded, so no acknowledged save is lost if the process stopped
+between snapshots. A partially written last line (crash during an append)
+is ignored.
+"""
+
+import copy
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .atomic_io import fsync_directory
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = 'missions.ndjson'
+
+# Derived from other fields on load, never journaled
+DERIVED_FIELDS = ('progress',)
+
+
+def diff_mission(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Journal delta turning serialized mission old into new
+
+    Returns:
+        {'doc': new} if there is no previous document, None if nothing
+        changed, else a delta with any of 'set', 'custom_fields' and
+        'objectives'
+    """
+    if old is None:
+        return {'doc': {k: v for k, v in new.items() if k not in DERIVED_FIELDS}}
+
+    delta: Dict[str, Any] = {}
+    changed = {k: v for k, v in new.items()
+               if k not in DERIVED_FIELDS + ('custom_fields', 'objectives') and old.get(k) != v}
+
+    old_fields, new_fields = old.get('custom_fields') or {}, new.get('custom_fields') or {}
+    field_set = {k: v for k, v in new_fields.items() if k not in old_fields or old_fields[k] != v}
+    field_unset = [k for k in old_fields if k not in new_fields]
+    if field_set or field_unset:
+        delta['custom_fields'] = {'set': field_set, 'unset': field_unset}
+
+    old_objectives, new_objectives = old.get('objectives') or [], new.get('objectives') or []
+    if [o.get('id') for o in old_objectives] != [o.get('id') for o in new_objectives]:
+        # Objectives added, removed or reordered: journal the whole list
+        changed['objectives'] = new_objectives
+    else:
+        objective_changes = {}
+        for before, after in zip(old_objectives, new_objectives):
+            fields = {k: v for k, v in after.items() if before.get(k) != v}
+            if fields:
+                objective_changes[after['id']] = fields
+        if objective_changes:
+            delta['objectives'] = objective_changes
+
+    if changed:
+        delta['set'] = changed
+    return delta or None
+
+
+def apply_delta(document: Optional[Dict[str, Any]], record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Apply a journal record to a serialized mission
+
+    Returns:
+        The updated document, or None if the record is a delta and there
+        is no document to apply it to
+    """
+    if 'doc' in record:
+        return copy.deepcopy(record['doc'])
+    if document is None:
+        return None
+
+    document.update(copy.deepcopy(record.get('set', {})))
+
+    custom_fields = record.get('custom_fields')
+    if custom_fields:
+        fields = document.setdefault('custom_fields', {})
+        fields.update(copy.deepcopy(custom_fields.get('set', {})))
+        for key in custom_fields.get('unset', []):
+            fields.pop(key, None)
+
+    objective_changes = record.get('objectives')
+    if objective_changes:
+        for objective in document.get('objectives', []):
+            objective.update(objective_changes.get(objective.get('id'), {}))
+    return document
+
+
+class MissionJournal:
+    """Append-only mission mutation log with rotation after snapshots"""
+
+    def __init__(self, directory: str, fsync: bool = False, keep_segments: int = 5):
+        """
+        Args:
+            directory: Directory holding the current and rotated segments
+            fsync: fsync after every append instead of leaving it to the OS
+            keep_segments: Rotated segments kept as an audit trail
+        """
+        self.directory = directory
+        self.path = os.path.join(directory, JOURNAL_FILENAME)
+        self.fsync = fsync
+        self.keep_segments = max(0, keep_segments)
+
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._truncate_incomplete_record()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        # Records in the current segment, including ones left by a previous run
+        existing = list(self.replay())
+        self.record_count = len(existing)
+        self._seq = max((record.get('seq', 0) for record in existing), default=0)
+
+        self.stats = {'appended': 0, 'bytes': 0, 'rotations': 0}
+
+    def _truncate_incomplete_record(self):
+        """Cut a partially written last line so new records start on their own line"""
+        try:
+            with open(self.path, 'rb+') as f:
+                content = f.read()
+                if content and not content.endswith(b'\n'):
+                    f.truncate(content.rfind(b'\n') + 1)
+                    logger.warning(f"⚠️ Dropped incomplete last record of {self.path}")
+        except FileNotFoundError:
+            pass
+
+    def append(self, mission_id: str, delta: Dict[str, Any]) -> bool:
+        """
+        Append one mutation record
+
+        Args:
+            mission_id: Mission the delta applies to
+            delta: Result of diff_mission()
+        """
+        with self._lock:
+            self._seq += 1
+            record = {'seq': self._seq, 'ts': round(time.time(), 3), 'id': mission_id, **delta}
+            line = json.dumps(record, separators=(',', ':')) + '\n'
+            try:
+                self._file.write(line)
+                self._file.flush()
+                if self.fsync:
+                    os.fsync(self._file.fileno())
+            except (IOError, OSError, ValueError) as e:
+                logger.error(f"❌ Failed to journal mission {mission_id}: {e}")
+                return False
+
+            self.record_count += 1
+            self.stats['appended'] += 1
+            self.stats['bytes'] += len(line)
+            return True
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """Records of the current segment in append order"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.endswith('\n'):
+                        logger.warning(f"⚠️ Ignoring incomplete journal record at {self.path}:{line_number}")
+                        break
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        logger.error(f"❌ Skipping corrupt journal record at {self.path}:{line_number}: {e}")
+        except FileNotFoundError:
+            return
+
+    def replay_documents(self, load_document: Callable[[str], Optional[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fold the current segment into full mission documents
+
+        Args:
+            load_document: Returns a mission's last snapshot document (or
+                None) for deltas journaled without a preceding 'doc' record
+
+        Returns:
+            Mission ID -> document with every journaled mutation applied
+        """
+        documents: Dict[str, Optional[Dict[str, Any]]] = {}
+        for record in self.replay():
+            mission_id = record.get('id')
+            if mission_id is None:
+                continue
+            if mission_id not in documents and 'doc' not in record:
+                documents[mission_id] = load_document(mission_id)
+            document = apply_delta(documents.get(mission_id), record)
+            if document is None:
+                logger.warning(f"⚠️ Journal delta for unknown mission {mission_id} ignored")
+            documents[mission_id] = document
+        return {mission_id: document for mission_id, document in documents.items() if document is not None}
+
+    def rotate(self) -> Optional[str]:
+        """
+        Close the current segment after a snapshot and start an empty one
+
+        Only call once every journaled mutation is in the mission files.
+
+        Returns:
+            Path of the rotated segment, None if the journal was empty
+        """
+        with self._lock:
+            if self.record_count == 0:
+                return None
+
+            self._file.close()
+            stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')
+            rotated = os.path.join(self.directory, f"missions.{stamp}.ndjson")
+            os.replace(self.path, rotated)
+            self._file = open(self.path, 'a', encoding='utf-8')
+            fsync_directory(self.directory)
+
+            self.record_count = 0
+            self.stats['rotations'] += 1
+            self._prune_segments()
+            return rotated
+
+    def _prune_segments(self):
+        """Delete rotated segments beyond keep_segments, oldest first"""
+        segments = sorted(glob.glob(os.path.join(self.directory, 'missions.*.ndjson')))
+        for segment in segments[:len(segments) - self.keep_segments]:
+            try:
+                os.remove(segment)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not remove journal segment {segment}: {e}")
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
@@ -5,18 +5,49 @@ Following docs/mission_spec.md section 3.3 exactly
 """
 
 import os
+import copy
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime, timezone
 
-from .mission import Mission, MissionState, Objective
+from .mission import Mission, MissionState, Objective, compact_mission_data, write_mission_file
 from .triggers import MissionTriggerSystem
 from .cascade_handler import MissionCascadeHandler
 from .storage_manager import MissionStorageManager
+from .persistence_queue import MissionWriteBehindQueue
+from .query import DEFAULT_SORT_FIELD, normalize_filters, paginate, record_value, validate_sort_field
+from .mission_cache import MissionCache
+from .mission_manifest import SUMMARY_FIELDS, MissionManifest
+from .mission_journal import MissionJournal, diff_mission
+from .event_index import SUBSCRIBED_STATES, MissionEventIndex
+from .job_queue import MissionJobQueue
+from .event_stream import MissionEventStream
+from backend.constants import (
+    MISSION_CACHE_SIZE,
+    MISSION_JOURNAL_ENABLED,
+    MISSION_JOURNAL_KEEP_SEGMENTS,
+    MISSION_JOURNAL_SNAPSHOT_INTERVAL,
+    MISSION_JOB_MAX_RETRIES,
+    MISSION_JOB_RETRY_DELAY,
+    MISSION_JOB_WORKERS,
+    MISSION_LAZY_LOADING,
+    MISSION_SAVE_DURABILITY,
+    MISSION_SAVE_FLUSH_INTERVAL,
+    MISSION_SAVE_GROUP_COMMIT,
+    MISSION_SAVE_MAX_DIRTY,
+    MISSION_STREAM_BUFFER_SIZE,
+    MISSION_STREAM_MAX_CLIENTS
+)
 
 logger = logging.getLogger(__name__)
 
+# Mission attributes with a secondary index (attribute value -> mission IDs)
+INDEXED_FIELDS = ('state', 'mission_type', 'location', 'faction', 'is_botched')
+
 
 class MissionManager:
     """
@@ -34,13 +65,72 @@ class MissionManager:
         self.data_directory = data_directory
         self.config = config or {}
         
-        # Mission collection (keyed by mission ID)
-        self.missions: Dict[str, Mission] = {}
-        
-        # Initialize subsystems
-        self.trigger_system = MissionTriggerSystem()
+        # Guards the collection, its indexes, event subscriptions and saves.
+        # Job queue workers (cascades, background triggers) botch and save
+        # missions while request threads use the same structures
+        self._lock = threading.RLock()
+        
+        # Mission collection (keyed by mission ID). In lazy mode only index
+        # metadata is read at startup and Mission objects are built on first
+        # access, keeping at most mission_cache_size evictable ones resident
+        self.lazy_loading = self.config.get('lazy_loading', MISSION_LAZY_LOADING)
+        self.missions: MissionCache = MissionCache(
+            self._hydrate_mission,
+            capacity=self.config.get('mission_cache_size', MISSION_CACHE_SIZE) if self.lazy_loading else None,
+            can_evict=self._can_evict_mission,
+            on_hydrate=self._on_mission_hydrated,
+            on_evict=self._on_mission_evicted
+        )
+        # Manifest summaries of missions that are not resident (lazy mode)
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        
+        # Secondary indexes: field -> value -> mission IDs, plus the values
+        # each mission is currently indexed under
+        self._indexes: Dict[str, Dict[Any, set]] = {field: defaultdict(set) for field in INDEXED_FIELDS}
+        self._indexed_values: Dict[str, tuple] = {}
+        # Registration order, so indexed queries return missions in collection order
+        self._mission_order: Dict[str, int] = {}
+        
+        # Game event subscriptions of resident missions, plus non-resident
+        # (lazy) missions that may subscribe once hydrated
+        self.event_index = MissionEventIndex()
+        self._unsubscribed_ids: set = set()
+        
+        # Initialize subsystems. Cascade effects and background triggers run
+        # on the job queue, outside the request that caused them
+        self.job_queue = MissionJobQueue(
+            workers=self.config.get('job_workers', MISSION_JOB_WORKERS),
+            max_retries=self.config.get('job_max_retries', MISSION_JOB_MAX_RETRIES),
+            retry_delay=self.config.get('job_retry_delay', MISSION_JOB_RETRY_DELAY)
+        )
+        self.trigger_system = MissionTriggerSystem(job_queue=self.job_queue)
+        # Fired triggers (including mission_state_changed and
+        # objective_progress) are pushed to streaming clients
+        self.event_stream = MissionEventStream(
+            buffer_size=self.config.get('stream_buffer_size', MISSION_STREAM_BUFFER_SIZE),
+            max_clients=self.config.get('stream_max_clients', MISSION_STREAM_MAX_CLIENTS))
+        self.trigger_system.add_listener(self.event_stream.publish)
         self.cascade_handler = MissionCascadeHandler(self)
+        self.trigger_system.register_trigger('mission_botched', self.cascade_handler.on_mission_botched,
+                                             background=True)
         self.storage_manager = MissionStorageManager(self.config)
+        self.save_queue = MissionWriteBehindQueue(
+            write_mission_file,
+            flush_interval=self.config.get('save_flush_interval', MISSION_SAVE_FLUSH_INTERVAL),
+            max_dirty=self.config.get('save_max_dirty', MISSION_SAVE_MAX_DIRTY),
+            durability=self.config.get('save_durability', MISSION_SAVE_DURABILITY),
+            group_commit=self.config.get('save_group_commit', MISSION_SAVE_GROUP_COMMIT)
+        )
+        
+        # Optional mutation journal: saves append deltas, files are written on snapshot()
+        self.journal: Optional[MissionJournal] = None
+        self.journal_snapshot_interval = self.config.get(
+            'journal_snapshot_interval', MISSION_JOURNAL_SNAPSHOT_INTERVAL)
+        # Last journaled document and target directory of missions saved since the snapshot
+        self._journal_documents: Dict[str, Dict[str, Any]] = {}
+        self._journal_dirty: Dict[str, str] = {}
+        # Per thread: missions saved inside deferred_saves(), saved once when the block ends
+        self._local = threading.local()
         
         # Mission templates for generation (will be loaded)
         self.templates: Dict[str, Any] = {}
@@ -57,6 +147,15 @@ class MissionManager:
         # Ensure directory structure exists
         self._create_directory_structure()
         
+        # Bring mission files up to date with mutations journaled before a restart
+        if self.config.get('journal_enabled', MISSION_JOURNAL_ENABLED):
+            self.journal = MissionJournal(
+                os.path.join(self.data_directory, 'journal'),
+                fsync=self.save_queue.durability == 'sync',
+                keep_segments=self.config.get('journal_keep_segments', MISSION_JOURNAL_KEEP_SEGMENTS)
+            )
+            self._replay_journal()
+        
         # Load existing missions
         self.load_missions()
         
@@ -81,6 +180,9 @@ class MissionManager:
         Load missions from JSON files
         From spec: "Loads from JSON files on startup or on-demand"
         """
+        if self.lazy_loading:
+            return self._load_mission_index()
+        
         loaded_count = 0
         
         # Load active missions
@@ -91,7 +193,7 @@ class MissionManager:
                     try:
                         filepath = os.path.join(active_dir, filename)
                         mission = Mission.load_from_file(filepath)
-                        self.missions[mission.id] = mission
+                        self._register_mission(mission)
                         loaded_count += 1
                     except (IOError, OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
                         logger.error(f"❌ Failed to load mission from {filename}: {e}")
@@ -103,6 +205,86 @@ class MissionManager:
         logger.info(f"📂 Loaded {loaded_count} missions from storage")
         return loaded_count
     
+    def _replay_journal(self) -> int:
+        """Write missions journaled since the last snapshot to their files"""
+        documents = self.journal.replay_documents(self._read_mission_document)
+        for mission_id, document in documents.items():
+            self._journal_documents[mission_id] = document
+            self._journal_dirty[mission_id] = self._mission_directory(MissionState.from_ordinal(document['state']))
+        
+        if documents:
+            logger.info(f"📜 Replaying {len(documents)} journaled missions")
+        return self.snapshot()
+    
+    def _read_mission_document(self, mission_id: str) -> Optional[Dict[str, Any]]:
+        """Mission from its file in active/ or completed/, in storage form"""
+        for subdir in ('active', 'completed'):
+            filepath = os.path.join(self.data_directory, subdir, f"{mission_id}.json")
+            try:
+                with open(filepath, 'r') as f:
+                    return compact_mission_data(json.load(f))
+            except FileNotFoundError:
+                continue
+            except (IOError, OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                logger.error(f"❌ Failed to read mission {mission_id} from {filepath}: {e}")
+                return None
+        return None
+    
+    def _load_mission_index(self) -> int:
+        """Register active missions from the manifest without parsing mission files"""
+        loaded_count = 0
+        manifest = MissionManifest(self.data_directory)
+        
+        for mission_id, entry in manifest.entries().items():
+            # Same scope as eager loading: missions in active/
+            if entry['directory'] != 'active':
+                continue
+            try:
+                values = (MissionState(entry['state']),) + tuple(entry[field] for field in INDEXED_FIELDS[1:])
+            except (KeyError, ValueError) as e:
+                logger.error(f"❌ Invalid manifest entry for mission {mission_id}: {e}")
+                continue
+            
+            self.missions.add_known(mission_id)
+            self._summaries[mission_id] = entry
+            self._mission_order.setdefault(mission_id, len(self._mission_order))
+            self._set_index_values(mission_id, values)
+            if values[0] in SUBSCRIBED_STATES and not values[-1]:
+                self._unsubscribed_ids.add(mission_id)
+            loaded_count += 1
+        
+        self._load_templates()
+        
+        self.stats['missions_loaded'] = loaded_count
+        logger.info(f"📂 Indexed {loaded_count} missions from storage (lazy loading)")
+        return loaded_count
+    
+    def _hydrate_mission(self, mission_id: str) -> Optional[Mission]:
+        """Build a known mission from its file (MissionCache loader)"""
+        summary = self._summaries.get(mission_id, {})
+        filepath = os.path.join(self.data_directory, summary.get('directory', 'active'), f"{mission_id}.json")
+        try:
+            return Mission.load_from_file(filepath)
+        except (IOError, OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.error(f"❌ Failed to load mission from {filepath}: {e}")
+            return None
+    
+    def _on_mission_hydrated(self, mission: Mission):
+        self._summaries.pop(mission.id, None)
+        mission.set_state_listener(self._on_mission_state_changed)
+        mission.set_fields_listener(self._on_mission_fields_changed)
+        self._reindex_mission(mission)
+    
+    def _can_evict_mission(self, mission: Mission) -> bool:
+        """Only cold completed missions whose latest state is on disk may be dropped"""
+        return (mission.state == MissionState.COMPLETED and not self.save_queue.is_pending(mission.id)
+                and mission.id not in self._journal_dirty)
+    
+    def _on_mission_evicted(self, mission: Mission):
+        summary = {field: record_value(mission, field) for field in SUMMARY_FIELDS}
+        summary['directory'] = 'completed'
+        self._summaries[mission.id] = summary
+    
     def _load_templates(self):
         """Load mission templates for generation"""
         templates_dir = os.path.join(self.data_directory, 'templates')
@@ -124,30 +306,308 @@ class MissionManager:
         """
         Save mission to appropriate directory based on state
         From spec: "Saves mission data to JSON files for persistence"
+
+        The mission is serialized immediately but, unless the manager runs
+        with save_durability 'sync', written later by the write-behind
+        queue; call flush() to force pending writes to disk. With the
+        journal enabled only the changes since the previous save are
+        appended to the journal and files are written by snapshot().
         """
-        try:
-            # Determine target directory based on mission state
-            if mission.state == MissionState.COMPLETED:
-                target_dir = os.path.join(self.data_directory, 'completed')
-            else:
-                target_dir = os.path.join(self.data_directory, 'active')
+        with self._lock:
+            if self._deferred_saves is not None:
+                self._deferred_saves[mission.id] = mission
+                self._register_mission(mission)
+                return True
+        
+            try:
+                # Determine target directory based on mission state
+                target_dir = self._mission_directory(mission.state)
             
-            # Save mission
-            mission.save_to_file(target_dir)
+                if self.journal is not None:
+                    if not self._journal_mission(mission, target_dir):
+                        return False
+                # Queue a snapshot so later in-memory changes don't race the writer.
+                # Deep copy: to_storage_dict shares custom_fields and triggers with the mission
+                elif not self.save_queue.enqueue(mission.id, target_dir, copy.deepcopy(mission.to_storage_dict())):
+                    return False
             
-            # Update in memory collection
-            self.missions[mission.id] = mission
+                # Update in memory collection
+                self._register_mission(mission)
             
-            logger.debug(f"💾 Mission {mission.id} saved successfully")
-            return True
+                logger.debug(f"💾 Mission {mission.id} saved successfully")
+                return True
 
-        except (IOError, OSError, TypeError) as e:
-            logger.error(f"❌ Failed to save mission {mission.id}: {e}")
+            except (IOError, OSError, TypeError) as e:
+                logger.error(f"❌ Failed to save mission {mission.id}: {e}")
+                return False
+    
+    @property
+    def _deferred_saves(self) -> Optional[Dict[str, Mission]]:
+        return getattr(self._local, 'deferred_saves', None)
+    
+    @_deferred_saves.setter
+    def _deferred_saves(self, missions: Optional[Dict[str, Mission]]):
+        self._local.deferred_saves = missions
+    
+    @contextmanager
+    def deferred_saves(self) -> Iterator[None]:
+        """
+        Coalesce saves made inside the block into one save per mission at its end
+        
+        Only saves made by the calling thread are deferred; background jobs
+        running meanwhile save immediately.
+        
+        Usage:
+            with manager.deferred_saves():
+                for event in events:
+                    manager.process_game_event(event)
+        """
+        if self._deferred_saves is not None:
+            # Nested: the outermost block saves
+            yield
+            return
+        
+        self._deferred_saves = {}
+        try:
+            yield
+        finally:
+            missions, self._deferred_saves = self._deferred_saves, None
+            for mission in missions.values():
+                self.save_mission(mission)
+    
+    def _mission_directory(self, state: MissionState) -> str:
+        """Directory a mission in the given state is saved to"""
+        if state == MissionState.COMPLETED:
+            return os.path.join(self.data_directory, 'completed')
+        return os.path.join(self.data_directory, 'active')
+    
+    def _journal_mission(self, mission: Mission, target_dir: str) -> bool:
+        """Append a mission's changes since its last journaled save"""
+        # Deep copy: to_storage_dict shares custom_fields and triggers with the mission
+        document = copy.deepcopy(mission.to_storage_dict())
+        delta = diff_mission(self._journal_documents.get(mission.id), document)
+        if delta is not None and not self.journal.append(mission.id, delta):
             return False
+        
+        self._journal_documents[mission.id] = document
+        self._journal_dirty[mission.id] = target_dir
+        if self.journal.record_count >= self.journal_snapshot_interval:
+            self.snapshot()
+        return True
+    
+    def snapshot(self) -> int:
+        """
+        Write journaled missions to their files and rotate the journal
+        
+        Returns:
+            Number of mission files written
+        """
+        with self._lock:
+            if self.journal is None:
+                return self.save_queue.flush()
+        
+            dirty, self._journal_dirty = self._journal_dirty, {}
+            for mission_id, target_dir in dirty.items():
+                self.save_queue.enqueue(mission_id, target_dir, self._journal_documents[mission_id])
+            written = self.save_queue.flush()
+        
+            if self.save_queue.pending_count:
+                # Keep the journal: it still holds the only copy of the failed writes
+                self._journal_dirty = {**dirty, **self._journal_dirty}
+                logger.error(f"❌ Mission snapshot incomplete, {self.save_queue.pending_count} writes failed")
+                return written
+        
+            # Later saves start from a full document in the new segment
+            self._journal_documents.clear()
+            self.journal.rotate()
+            logger.debug(f"📜 Mission snapshot wrote {written} missions")
+            return written
+    
+    def _register_mission(self, mission: Mission):
+        """Add or replace a mission in the collection and its indexes"""
+        with self._lock:
+            existing = self.missions.peek(mission.id)
+            if existing is not None and existing is not mission:
+                existing.set_state_listener(None)
+                existing.set_fields_listener(None)
+        
+            self._summaries.pop(mission.id, None)
+            self.missions[mission.id] = mission
+            self._mission_order.setdefault(mission.id, len(self._mission_order))
+            mission.set_state_listener(self._on_mission_state_changed)
+            mission.set_fields_listener(self._on_mission_fields_changed)
+            self._reindex_mission(mission)
+    
+    def _unregister_mission(self, mission_id: str):
+        """Remove a mission from the collection and its indexes"""
+        with self._lock:
+            mission = self.missions.peek(mission_id)
+            if mission is not None:
+                mission.set_state_listener(None)
+                mission.set_fields_listener(None)
+            if mission_id in self.missions:
+                del self.missions[mission_id]
+            self._summaries.pop(mission_id, None)
+            self.event_index.remove(mission_id)
+            self._unsubscribed_ids.discard(mission_id)
+        
+            old_values = self._indexed_values.pop(mission_id, None)
+            if old_values is not None:
+                for field, value in zip(INDEXED_FIELDS, old_values):
+                    self._discard_from_index(field, value, mission_id)
+            self._mission_order.pop(mission_id, None)
+    
+    def _on_mission_state_changed(self, mission: Mission):
+        """State listener of registered missions: reindex and announce the transition"""
+        self._reindex_mission(mission)
+        self.trigger_system.fire_trigger('mission_state_changed', mission, {})
+    
+    def _on_mission_fields_changed(self, mission: Mission):
+        """Fields listener of registered missions: follow new targets and objectives"""
+        with self._lock:
+            self.event_index.update(mission)
+    
+    def _reindex_mission(self, mission: Mission):
+        """Move a mission to the index buckets and event subscriptions matching its current fields"""
+        with self._lock:
+            self._set_index_values(mission.id, tuple(getattr(mission, field) for field in INDEXED_FIELDS))
+            self.event_index.update(mission)
+            self._unsubscribed_ids.discard(mission.id)
+    
+    def _set_index_values(self, mission_id: str, new_values: tuple):
+        """Index a mission under the given INDEXED_FIELDS values"""
+        old_values = self._indexed_values.get(mission_id)
+        if new_values == old_values:
+            return
+        
+        for i, field in enumerate(INDEXED_FIELDS):
+            if old_values is not None:
+                if old_values[i] == new_values[i]:
+                    continue
+                self._discard_from_index(field, old_values[i], mission_id)
+            self._indexes[field][new_values[i]].add(mission_id)
+        self._indexed_values[mission_id] = new_values
+    
+    def _discard_from_index(self, field: str, value: Any, mission_id: str):
+        bucket = self._indexes[field].get(value)
+        if bucket is not None:
+            bucket.discard(mission_id)
+            if not bucket:
+                del self._indexes[field][value]
+    
+    def _indexed_ids(self, field: str, values: Iterable[Any]) -> set:
+        """Union of the index buckets of several values of one field"""
+        with self._lock:
+            index = self._indexes[field]
+            ids = set()
+            for value in values:
+                ids.update(index.get(value, ()))
+            return ids
+    
+    def _missions_in_order(self, mission_ids: Iterable[str]) -> List[Mission]:
+        """Resolve mission IDs to missions in collection order"""
+        with self._lock:
+            missions = (self.missions.get(mission_id)
+                        for mission_id in sorted(mission_ids, key=self._mission_order.__getitem__))
+            return [mission for mission in missions if mission is not None]
+    
+    def query_missions(self, filters: Optional[Dict[str, Any]] = None,
+                       sort_by: str = DEFAULT_SORT_FIELD, limit: Optional[int] = None,
+                       cursor: Optional[str] = None, offset: int = 0,
+                       predicate: Optional[Callable[[Mission], bool]] = None) -> Dict[str, Any]:
+        """
+        Query one page of missions using the in-memory indexes
+        
+        Takes the same filters, sort fields and cursors as
+        MissionStorageManager.query_page; only missions in the matching index
+        buckets are examined.
+        
+        Args:
+            filters: Field -> value (or list of values), see QUERY_FILTER_FIELDS
+            sort_by: One of QUERY_SORT_FIELDS, ties broken by ID
+            limit: Page size, None for all remaining matches
+            cursor: next_cursor of the previous page
+            offset: Matches to skip (after the cursor)
+            predicate: Extra per-mission condition for non-indexed criteria
+        
+        Returns:
+            {'missions': [Mission, ...], 'total': matches ignoring the cursor, 'next_cursor': str or None}
+        
+        Raises:
+            ValueError: For unknown filter or sort fields, states and invalid cursors
+        """
+        with self._lock:
+            validate_sort_field(sort_by)
+            mission_ids = None
+            for field, values in normalize_filters(filters).items():
+                if field == 'state':
+                    values = [MissionState(value) for value in values]
+                ids = self._indexed_ids(field, values)
+                mission_ids = ids if mission_ids is None else mission_ids & ids
+        
+            if mission_ids is None:
+                mission_ids = list(self.missions)
+        
+            # Sort on resident missions or, for lazily loaded ones, their manifest
+            # summaries so only the returned page has to be hydrated
+            records = [self.missions.peek(mission_id) or self._summaries.get(mission_id) or self.missions[mission_id]
+                       for mission_id in mission_ids]
+            if predicate is not None:
+                mission_predicate = predicate
+                predicate = lambda record: mission_predicate(self._as_mission(record))
+        
+            result = paginate(records, sort_by, limit, cursor, offset, predicate)
+            result['missions'] = [self._as_mission(record) for record in result['missions']]
+            return result
+    
+    def _as_mission(self, record: Any) -> Mission:
+        return record if isinstance(record, Mission) else self.missions[record['id']]
+    
+    def get_missions_by_type_and_states(self, mission_type: str,
+                                        states: Iterable[MissionState]) -> List[Mission]:
+        """
+        Get missions of a type in any of the given states, excluding botched ones
+        
+        Args:
+            mission_type: Mission type, e.g. 'delivery'
+            states: Accepted mission states
+        
+        Returns:
+            Matching missions, in collection order
+        """
+        with self._lock:
+            of_type = self._indexes['mission_type'].get(mission_type)
+            if not of_type:
+                return []
+        
+            in_states = self._indexed_ids('state', states)
+            botched = self._indexes['is_botched'].get(True, set())
+            return self._missions_in_order((of_type & in_states) - botched)
+    
+    def get_active_missions_by_type(self, mission_type: str) -> List[Mission]:
+        """Get accepted, non-botched missions of a type (event handler fan-out)"""
+        return self.get_missions_by_type_and_states(mission_type, [MissionState.ACCEPTED])
+    
+    def flush(self) -> int:
+        """Write all missions with pending saves to disk, returns the count written"""
+        if self.journal is not None:
+            return self.snapshot()
+        return self.save_queue.flush()
+    
+    def shutdown(self):
+        """Stop background persistence after writing pending saves"""
+        self.event_stream.close()
+        # Background jobs may still save missions
+        self.job_queue.close()
+        if self.journal is not None:
+            self.snapshot()
+            self.journal.close()
+        self.save_queue.close()
     
     def get_mission(self, mission_id: str) -> Optional[Mission]:
         """Get mission by ID"""
-        return self.missions.get(mission_id)
+        with self._lock:
+            return self.missions.get(mission_id)
     
     def get_available_missions(self, location: str = None, 
                              faction_standing: Dict[str, float] = None) -> List[Mission]:
@@ -157,16 +617,18 @@ class MissionManager:
         """
         available = []
         
-        for mission in self.missions.values():
+        with self._lock:
             # Skip completed, botched, or already accepted missions
-            if (mission.state in [MissionState.COMPLETED, MissionState.ACCEPTED] or 
-                mission.is_botched):
-                continue
+            candidate_ids = self._indexed_ids(
+                'state', [MissionState.UNKNOWN, MissionState.MENTIONED, MissionState.ACHIEVED]
+            )
+            candidate_ids -= self._indexes['is_botched'].get(True, set())
             
             # Location filter
-            if location and mission.location not in [location, 'any', 'unknown']:
-                continue
-            
+            if location:
+                candidate_ids &= self._indexed_ids('location', [location, 'any', 'unknown'])
+        
+        for mission in self._missions_in_order(candidate_ids):
             # Faction standing filter (basic implementation)
             if faction_standing and mission.faction in faction_standing:
                 required_standing = mission.custom_fields.get('required_faction_standing', 0)
@@ -182,12 +644,11 @@ class MissionManager:
         """
         Get missions that are currently active/accepted by the player
         """
-        active = []
-        
-        for mission in self.missions.values():
-            # Include both accepted and achieved missions that aren't botched
-            if mission.state in [MissionState.ACCEPTED, MissionState.ACHIEVED] and not mission.is_botched:
-                active.append(mission)
+        # Include both accepted and achieved missions that aren't botched
+        with self._lock:
+            active_ids = self._indexed_ids('state', [MissionState.ACCEPTED, MissionState.ACHIEVED])
+            active_ids -= self._indexes['is_botched'].get(True, set())
+        active = self._missions_in_order(active_ids)
         
         logger.debug(f"🎯 Found {len(active)} active missions")
         return active
@@ -200,8 +661,9 @@ class MissionManager:
         """
         cleared_count = 0
         
-        for mission in self.missions.values():
-            if mission.state == MissionState.ACCEPTED and not mission.is_botched:
+        accepted_ids = self._indexed_ids('state', [MissionState.ACCEPTED])
+        for mission in self._missions_in_order(accepted_ids):
+            if not mission.is_botched:
                 # Mark as completed to remove from active missions
                 # Since mission states can only progress forward, we complete them
                 mission.set_state(MissionState.COMPLETED)
@@ -243,15 +705,17 @@ class MissionManager:
         return False
     
     def update_mission_progress(self, mission_id: str, objective_id: str = None, 
-                              event_data: Dict[str, Any] = None) -> bool:
+                              event_data: Dict[str, Any] = None) -> Optional[Mission]:
         """
         Update mission progress (achieve objectives or advance state)
         From spec: API endpoint for progress updates
+        
+        Returns the updated mission, or None if nothing changed
         """
         mission = self.get_mission(mission_id)
         if not mission:
             logger.error(f"❌ Mission not found: {mission_id}")
-            return False
+            return None
         
         # If specific objective provided, try to achieve it
         if objective_id:
@@ -271,17 +735,107 @@ class MissionManager:
                     
                     self.stats['objectives_completed'] += 1
                     if mission.state == MissionState.COMPLETED and old_state != MissionState.COMPLETED:
+                        self.trigger_system.fire_trigger('mission_completed', mission, event_data)
                         logger.info(f"🎉 Mission completed: {mission.title}")
                     
-                    return True
+                    return mission
         
         # General progress update based on event data
         elif event_data:
             # This would contain game-specific logic for updating missions
             # based on events like enemy_destroyed, location_reached, etc.
-            return self._process_game_event(mission, event_data)
+            if self._apply_game_event(mission, event_data) is None:
+                return None
+            return mission
         
-        return False
+        return None
+    
+    def get_event_subscribers(self, event_data: Dict[str, Any]) -> List[Mission]:
+        """Missions subscribed to a game event (see event_index.EVENT_SUBSCRIPTIONS)"""
+        with self._lock:
+            # Lazily indexed missions subscribe when hydrated; do that before the first lookup
+            for mission_id in list(self._unsubscribed_ids):
+                self.missions.get(mission_id)
+            self._unsubscribed_ids.clear()
+        
+            return self._missions_in_order(self.event_index.subscribers(event_data.get('type'), event_data))
+    
+    def process_game_event(self, event_data: Dict[str, Any]) -> List[Mission]:
+        """
+        Deliver a game event to the missions subscribed to it
+        
+        Args:
+            event_data: Event payload with a 'type' (enemy_destroyed,
+                location_reached, cargo_delivered, cargo_loaded)
+        
+        Returns:
+            Missions the event progressed
+        """
+        updated_missions = []
+        for mission in self.get_event_subscribers(event_data):
+            updated_mission = self.update_mission_progress(mission.id, event_data=event_data)
+            if updated_mission:
+                updated_missions.append(updated_mission)
+        return updated_missions
+    
+    def process_game_events(self, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Deliver an ordered batch of game events in one pass
+        
+        Events are applied in order with saves coalesced to one per mission.
+        
+        Returns:
+            Per event: {'type', 'updated_missions': [Mission], 'hooks': [hook data]}
+            where hooks come from objectives the event achieved and missions
+            it completed
+        """
+        results = []
+        with self.deferred_saves():
+            for event_data in events:
+                updated_missions, hooks = [], []
+                for mission in self.get_event_subscribers(event_data):
+                    mission_hooks = self._apply_game_event(mission, event_data)
+                    if mission_hooks is None:
+                        continue
+                    updated_missions.append(mission)
+                    hooks.extend(mission_hooks)
+                
+                results.append({
+                    'type': event_data.get('type'),
+                    'updated_missions': updated_missions,
+                    'hooks': hooks
+                })
+        return results
+    
+    def _apply_game_event(self, mission: Mission, event_data: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Apply one game event to one mission and fire the triggers it causes
+        
+        Shared by process_game_event and process_game_events so both fire
+        objective_completed for each objective the event achieved and
+        mission_completed when it completed the mission.
+        
+        Returns:
+            Foreground hook data, or None if the event did not progress the mission
+        """
+        old_state = mission.state
+        achieved_before = {obj.id for obj in mission.objectives if obj.is_achieved}
+        if not self._process_game_event(mission, event_data):
+            return None
+        
+        hooks = []
+        for obj in mission.objectives:
+            if obj.is_achieved and obj.id not in achieved_before:
+                self.stats['objectives_completed'] += 1
+                hooks.extend(self.trigger_system.fire_trigger('objective_completed', mission, {
+                    'objective_id': obj.id,
+                    'event_data': event_data
+                }))
+        if mission.state == MissionState.COMPLETED and old_state != MissionState.COMPLETED:
+            hooks.extend(self.trigger_system.fire_trigger('mission_completed', mission, event_data))
+            logger.info(f"🎉 Mission completed: {mission.title}")
+        self.trigger_system.fire_trigger('objective_progress', mission, event_data)
+        return hooks
     
     def _process_game_event(self, mission: Mission, event_data: Dict[str, Any]) -> bool:
         """Process game events for mission progress"""
@@ -317,8 +871,8 @@ class MissionManager:
             logger.info(f"🎯 Mission {mission.id}: Kill progress {kill_count}/{required_kills}")
             
             # Find elimination objective and update progress
-            for obj in mission.objectives:
-                if 'eliminate' in obj.description.lower() and not obj.is_achieved:
+            for obj in self.event_index.objectives_for(mission, 'enemy_destroyed'):
+                if not obj.is_achieved:
                     # Update objective progress
                     obj.progress = min(kill_count / required_kills, 1.0)
                     
@@ -345,8 +899,8 @@ class MissionManager:
         
         if location == target_location:
             # Find exploration objective
-            for obj in mission.objectives:
-                if 'explore' in obj.description.lower() and not obj.is_achieved:
+            for obj in self.event_index.objectives_for(mission, 'location_reached'):
+                if not obj.is_achieved:
                     return mission.set_state(MissionState.ACHIEVED, obj.id)
         
         return False
@@ -404,9 +958,9 @@ class MissionManager:
             
             # Find delivery objective and update progress
             logger.info(f"🚛 Looking for delivery objective in {len(mission.objectives)} objectives")
-            for i, obj in enumerate(mission.objectives):
-                logger.info(f"🚛 Objective {i+1}: '{obj.description}' (achieved: {obj.is_achieved})")
-                if 'deliver' in obj.description.lower() and not obj.is_achieved:
+            for obj in self.event_index.objectives_for(mission, 'cargo_delivered'):
+                logger.info(f"🚛 Objective {obj.id}: '{obj.description}' (achieved: {obj.is_achieved})")
+                if not obj.is_achieved:
                     logger.info(f"🚛 Found delivery objective: '{obj.description}'")
                     # Update objective progress
                     obj.progress = min(delivered_so_far / required_quantity, 1.0)
@@ -467,8 +1021,8 @@ class MissionManager:
             logger.info(f"🚛 Mission {mission.id}: Cargo loading progress {loaded_so_far}/{required_quantity}")
             
             # Find loading objective and update progress
-            for obj in mission.objectives:
-                if 'load' in obj.description.lower() and not obj.is_achieved:
+            for obj in self.event_index.objectives_for(mission, 'cargo_loaded'):
+                if not obj.is_achieved:
                     # Update objective progress
                     obj.progress = min(loaded_so_far / required_quantity, 1.0)
                     
@@ -514,10 +1068,8 @@ class MissionManager:
         
         success = mission.botch()
         if success:
-            # Handle cascade effects
-            self.cascade_handler.handle_mission_botched(mission_id, context or {})
-            
-            # Fire triggers for mission botched
+            # Fire triggers for mission botched; the cascade is a background
+            # trigger, run on the job queue after earlier jobs of this mission
             hooks = self.trigger_system.fire_trigger('mission_botched', mission, {
                 'reason': reason,
                 'context': context
@@ -731,11 +1283,11 @@ class MissionManager:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get mission system statistics"""
-        active_missions = len([m for m in self.missions.values() 
-                              if m.state == MissionState.ACCEPTED])
-        completed_missions = len([m for m in self.missions.values() 
-                                 if m.state == MissionState.COMPLETED])
-        botched_missions = len([m for m in self.missions.values() if m.is_botched])
+        with self._lock:
+            by_state = self._indexes['state']
+            active_missions = len(by_state.get(MissionState.ACCEPTED, ()))
+            completed_missions = len(by_state.get(MissionState.COMPLETED, ()))
+            botched_missions = len(self._indexes['is_botched'].get(True, ()))
         
         return {
             'total_missions': len(self.missions),
@@ -753,16 +1305,20 @@ class MissionManager:
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
         archived_count = 0
         
-        for mission_id, mission in list(self.missions.items()):
-            if (mission.state == MissionState.COMPLETED and 
-                mission.updated_at < cutoff_date):
+        # Pending writes must land before files are moved out from under them
+        self.flush()
+        
+        completed_ids = self._indexed_ids('state', [MissionState.COMPLETED])
+        for mission in self._missions_in_order(completed_ids):
+            mission_id = mission.id
+            if mission.updated_at < cutoff_date:
                 
                 # Move to archived directory
                 archived_dir = os.path.join(self.data_directory, 'archived')
                 mission.save_to_file(archived_dir)
                 
                 # Remove from active collection
-                del self.missions[mission_id]
+                self._unregister_mission(mission_id)
                 
                 # Remove from active directory
                 active_file = os.path.join(self.data_directory, 'active', f"{mission_id}.json")
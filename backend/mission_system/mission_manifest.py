@@ -0,0 +1,193 @@
+"""
+Mission Manifest
+Summary index of the mission files of the JSON storage backend
+
+manifest.json in the data directory maps every mission ID to the
+subdirectory holding its file plus the fields used to filter and sort
+missions (state, type, location, updated_at, ...) and the file's size and
+mtime. Lookups and queries read the manifest instead of probing
+directories and parsing every mission body.
+
+The manifest is a cache: mission files remain the source of truth.
+Files written by other writers (MissionManager, other workers) are picked
+up by refresh(), which re-stats the mission directories when their
+mtime changed and re-parses only files whose size or mtime differ from
+their entry.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .atomic_io import atomic_write_json
+from .mission import expand_mission_data
+from .query import QUERY_FILTER_FIELDS, QUERY_SORT_FIELDS
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# Searched in order; an ID found in an earlier directory wins
+MISSION_SUBDIRECTORIES = ('active', 'completed')
+
+SUMMARY_FIELDS = tuple(dict.fromkeys(('id',) + QUERY_SORT_FIELDS + QUERY_FILTER_FIELDS))
+
+
+def summarize(mission_data: Dict[str, Any], subdir: str, stat: os.stat_result) -> Dict[str, Any]:
+    """Manifest entry for a mission file (API-form values for either storage format)"""
+    mission_data = expand_mission_data(mission_data)
+    entry = {field: mission_data.get(field) for field in SUMMARY_FIELDS}
+    entry['directory'] = subdir
+    entry['size'] = stat.st_size
+    entry['mtime_ns'] = stat.st_mtime_ns
+    return entry
+
+
+class MissionManifest:
+    """Persistent mission ID -> summary index for a JSON mission directory"""
+
+    def __init__(self, data_directory: str):
+        self.data_directory = data_directory
+        self.path = os.path.join(data_directory, MANIFEST_FILENAME)
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # Subdirectory -> mtime_ns when it was last scanned
+        self._directory_mtimes: Dict[str, int] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                self._entries = manifest['missions']
+                self._directory_mtimes = manifest['directories']
+        except FileNotFoundError:
+            pass
+        except (IOError, OSError, json.JSONDecodeError, KeyError, AttributeError) as e:
+            logger.warning(f"⚠️ Rebuilding unreadable mission manifest {self.path}: {e}")
+
+    def _save(self):
+        try:
+            atomic_write_json(self.path, {
+                'version': MANIFEST_VERSION,
+                'directories': self._directory_mtimes,
+                'missions': self._entries
+            }, indent=None)
+        except (IOError, OSError, TypeError) as e:
+            # The manifest is rebuilt from the mission files if it is lost
+            logger.error(f"❌ Failed to write mission manifest: {e}")
+
+    def _directory_mtime(self, subdir: str) -> Optional[int]:
+        try:
+            return os.stat(os.path.join(self.data_directory, subdir)).st_mtime_ns
+        except OSError:
+            return None
+
+    def refresh(self) -> bool:
+        """
+        Bring entries in line with the mission files
+
+        Directories whose mtime is unchanged since their last scan are
+        skipped; atomic writes and deletions always change it.
+
+        Returns:
+            True if any entry changed
+        """
+        with self._lock:
+            changed = self._rescan()
+            if changed is None:
+                return False
+            self._save()
+            return changed
+
+    def _rescan(self) -> Optional[bool]:
+        """Rebuild entries from a directory scan; None if no directory changed"""
+        mtimes = {subdir: self._directory_mtime(subdir) for subdir in MISSION_SUBDIRECTORIES}
+        if mtimes == self._directory_mtimes:
+            return None
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        changed = False
+        for subdir in MISSION_SUBDIRECTORIES:
+            if mtimes[subdir] is None:
+                continue
+            with os.scandir(os.path.join(self.data_directory, subdir)) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith('.json') or dir_entry.name.startswith('.'):
+                        continue
+                    mission_id = dir_entry.name[:-len('.json')]
+                    if mission_id in entries:
+                        continue
+                    entry = self._current_entry(mission_id, subdir, dir_entry)
+                    if entry is None:
+                        continue
+                    changed = changed or entry is not self._entries.get(mission_id)
+                    entries[mission_id] = entry
+
+        changed = changed or entries.keys() != self._entries.keys()
+        self._entries = entries
+        self._directory_mtimes = mtimes
+        return changed
+
+    def _current_entry(self, mission_id: str, subdir: str,
+                       dir_entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+        """Existing entry if the file is unchanged, else one parsed from the file"""
+        try:
+            stat = dir_entry.stat()
+        except OSError:
+            return None
+
+        entry = self._entries.get(mission_id)
+        if (entry is not None and entry.get('directory') == subdir and
+                entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns):
+            return entry
+
+        try:
+            with open(dir_entry.path, 'r') as f:
+                return summarize(json.load(f), subdir, stat)
+        except (IOError, OSError, json.JSONDecodeError, AttributeError) as e:
+            logger.error(f"❌ Failed to index {dir_entry.path}: {e}")
+            return None
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Current mission ID -> entry map (do not mutate)"""
+        self.refresh()
+        return self._entries
+
+    def path_for(self, mission_id: str) -> Optional[str]:
+        """Path of a mission's file, or None if there is none"""
+        entry = self.entries().get(mission_id)
+        if entry is None:
+            return None
+        return os.path.join(self.data_directory, entry['directory'], f"{mission_id}.json")
+
+    def record(self, saved: Iterable[Tuple[Dict[str, Any], str]]):
+        """
+        Update entries for missions just written, then persist once
+
+        Args:
+            saved: (mission data, subdirectory) pairs
+        """
+        with self._lock:
+            for mission_data, subdir in saved:
+                path = os.path.join(self.data_directory, subdir, f"{mission_data['id']}.json")
+                try:
+                    self._entries[mission_data['id']] = summarize(mission_data, subdir, os.stat(path))
+                except OSError:
+                    continue
+            # Picks up other writers' changes; our files match their new entries
+            # and are not parsed again
+            self._rescan()
+            self._save()
+
+    def remove(self, mission_ids: Iterable[str]):
+        """Drop entries of deleted missions, then persist once"""
+        with self._lock:
+            for mission_id in mission_ids:
+                self._entries.pop(mission_id, None)
+            self._rescan()
+            self._save()
@@ -0,0 +1,197 @@
+"""
+Mission Persistence Queue
+Write-behind batching for mission saves
+
+Mission state changes (accepting, each kill, each partial delivery) used to
+rewrite the mission file on the request thread. The queue records the latest
+serialized state of each dirty mission instead and a background thread
+writes them in batches, so a burst of updates to one mission costs a single
+file write.
+"""
+
+import atexit
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from backend.constants import (
+    MISSION_SAVE_DURABILITY,
+    MISSION_SAVE_FLUSH_INTERVAL,
+    MISSION_SAVE_GROUP_COMMIT,
+    MISSION_SAVE_MAX_DIRTY
+)
+from .atomic_io import DirectorySyncGroup
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_WRITE_BEHIND = 'write_behind'
+DURABILITY_SYNC = 'sync'
+DURABILITY_MODES = (DURABILITY_WRITE_BEHIND, DURABILITY_SYNC)
+
+# Writes one mission: (target directory, serialized mission data, sync_group=...)
+MissionWriter = Callable[..., Any]
+
+
+class MissionWriteBehindQueue:
+    """
+    Coalesces dirty missions and writes them in batches
+
+    In write-behind mode enqueue() only records the mission; a daemon thread
+    flushes every flush_interval seconds, or sooner once max_dirty missions
+    are pending. In sync mode enqueue() writes immediately. flush() writes
+    everything pending and is also run at interpreter exit.
+    """
+
+    def __init__(self, writer: MissionWriter,
+                 flush_interval: float = MISSION_SAVE_FLUSH_INTERVAL,
+                 max_dirty: int = MISSION_SAVE_MAX_DIRTY,
+                 durability: str = MISSION_SAVE_DURABILITY,
+                 group_commit: bool = MISSION_SAVE_GROUP_COMMIT):
+        """
+        Args:
+            writer: Function writing one mission's data to a directory
+            flush_interval: Maximum seconds a dirty mission waits for its write
+            max_dirty: Pending mission count that triggers an early flush
+            durability: 'write_behind' or 'sync'
+            group_commit: Pass the writer a DirectorySyncGroup so a batch
+                fsyncs each directory once instead of once per file
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown mission save durability: {durability}")
+
+        self.writer = writer
+        self.flush_interval = flush_interval
+        self.max_dirty = max(1, max_dirty)
+        self.durability = durability
+        self.group_commit = group_commit
+
+        self._dirty: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self.stats = {
+            'enqueued': 0,
+            'written': 0,
+            'coalesced': 0,
+            'flushes': 0,
+            'failures': 0
+        }
+
+    @property
+    def pending_count(self) -> int:
+        """Number of missions waiting to be written"""
+        with self._lock:
+            return len(self._dirty)
+
+    def enqueue(self, mission_id: str, target_dir: str, mission_data: Dict[str, Any]) -> bool:
+        """
+        Record the latest state of a mission for writing
+
+        Args:
+            mission_id: Mission ID, the coalescing key
+            target_dir: Directory the mission file belongs in
+            mission_data: Serialized mission, must not be mutated afterwards
+
+        Returns:
+            True if queued (write-behind) or written (sync)
+        """
+        with self._lock:
+            if mission_id in self._dirty:
+                self.stats['coalesced'] += 1
+            self._dirty[mission_id] = (target_dir, mission_data)
+            self.stats['enqueued'] += 1
+            pending = len(self._dirty)
+
+        if self.durability == DURABILITY_SYNC or self._closed:
+            self.flush()
+            return not self.is_pending(mission_id)
+
+        self._ensure_thread()
+        if pending >= self.max_dirty:
+            self._wakeup.set()
+        return True
+
+    def is_pending(self, mission_id: str) -> bool:
+        """Whether a mission has changes that are not written yet"""
+        with self._lock:
+            return mission_id in self._dirty
+
+    def flush(self) -> int:
+        """
+        Write every pending mission
+
+        Missions whose write fails stay queued for the next flush unless a
+        newer state was enqueued meanwhile.
+
+        Returns:
+            Number of missions written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._dirty = self._dirty, {}
+            if not batch:
+                return 0
+
+            written = 0
+            failed = {}
+            sync_group = DirectorySyncGroup() if self.group_commit else None
+            for mission_id, (target_dir, mission_data) in batch.items():
+                try:
+                    self.writer(target_dir, mission_data, sync_group=sync_group)
+                    written += 1
+                except Exception as e:
+                    # Any failure keeps the mission queued; the writer thread must survive it
+                    logger.error(f"❌ Failed to write mission {mission_id}: {e}")
+                    failed[mission_id] = (target_dir, mission_data)
+            if sync_group is not None:
+                sync_group.commit()
+
+            with self._lock:
+                for mission_id, entry in failed.items():
+                    self._dirty.setdefault(mission_id, entry)
+                self.stats['written'] += written
+                self.stats['failures'] += len(failed)
+                self.stats['flushes'] += 1
+
+            logger.debug(f"💾 Flushed {written}/{len(batch)} missions")
+            return written
+
+    def close(self):
+        """Stop the background thread and write everything pending"""
+        self._closed = True
+        thread = self._thread
+        if thread is not None:
+            self._wakeup.set()
+            thread.join()
+            self._thread = None
+            atexit.unregister(self.close)
+        self.flush()
+
+    def _ensure_thread(self):
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            return
+        with self._lock:
+            if (self._thread is not None and self._thread.is_alive()) or self._closed:
+                return
+            if self._thread is not None:
+                logger.warning("⚠️ Mission write-behind thread stopped, restarting it")
+            self._thread = threading.Thread(
+                target=self._run, name='mission-write-behind', daemon=True
+            )
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._closed:
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"❌ Mission write-behind flush failed: {e}")
@@ -0,0 +1,127 @@
+"""
+Mission Queries
+Shared filter, sort and cursor handling for paginated mission queries
+
+A query is a set of equality filters (a list value matches any of its
+entries), a sort key and a page size. Pages are continued with an opaque
+cursor holding the sort value and ID of the last returned mission (keyset
+pagination), so every backend can resume with an indexed range scan
+instead of skipping rows.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Fields usable in query filters; all are indexed columns in the SQL backends
+QUERY_FILTER_FIELDS = ('state', 'mission_type', 'location', 'faction', 'is_botched')
+
+# Fields missions can be sorted by; ties are broken by mission ID
+QUERY_SORT_FIELDS = ('id', 'created_at', 'updated_at', 'title', 'state',
+                     'mission_type', 'location', 'faction')
+
+DEFAULT_SORT_FIELD = 'created_at'
+
+
+def _plain(value: Any) -> Any:
+    """Convert enum and datetime values to their stored (JSON) form"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def normalize_filters(filters: Optional[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Validate filters and turn every value into a list of stored-form values
+
+    Raises:
+        ValueError: For fields that cannot be filtered on
+    """
+    normalized = {}
+    for field, value in (filters or {}).items():
+        if field not in QUERY_FILTER_FIELDS:
+            raise ValueError(f"Cannot filter missions by '{field}'")
+        values = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+        normalized[field] = [_plain(v) for v in values]
+    return normalized
+
+
+def validate_sort_field(sort_by: str) -> str:
+    if sort_by not in QUERY_SORT_FIELDS:
+        raise ValueError(f"Cannot sort missions by '{sort_by}'")
+    return sort_by
+
+
+def record_value(record: Any, field: str) -> Any:
+    """Read a field from serialized mission data or a Mission object"""
+    if isinstance(record, dict):
+        return record.get(field)
+    return _plain(getattr(record, field, None))
+
+
+def sort_key(record: Any, sort_by: str) -> Tuple[str, str]:
+    """Total order used by every backend: (sort value or '', mission ID)"""
+    value = record_value(record, sort_by)
+    return ('' if value is None else str(value), str(record_value(record, 'id')))
+
+
+def encode_cursor(sort_by: str, last_key: Tuple[str, str]) -> str:
+    """Opaque cursor resuming after the mission with the given sort key"""
+    payload = json.dumps([sort_by, last_key[0], last_key[1]], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str, sort_by: str) -> Tuple[str, str]:
+    """
+    Decode a cursor from encode_cursor()
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort key
+    """
+    try:
+        cursor_sort, value, mission_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid query cursor")
+    if cursor_sort != sort_by:
+        raise ValueError("Query cursor was issued for a different sort order")
+    return str(value), str(mission_id)
+
+
+def matches_filters(record: Any, filters: Dict[str, List[Any]]) -> bool:
+    """Whether a record satisfies normalized filters"""
+    return all(record_value(record, field) in values for field, values in filters.items())
+
+
+def paginate(records: Iterable[Any], sort_by: str, limit: Optional[int],
+             cursor: Optional[str] = None, offset: int = 0,
+             predicate: Optional[Callable[[Any], bool]] = None) -> Dict[str, Any]:
+    """
+    Sort and page already-filtered records in Python
+
+    Used by backends without native query support and by MissionManager's
+    in-memory indexes.
+
+    Returns:
+        {'missions': page, 'total': matches, 'next_cursor': cursor or None}
+    """
+    keyed = [(sort_key(record, sort_by), record) for record in records
+             if predicate is None or predicate(record)]
+    total = len(keyed)
+    if cursor:
+        after = decode_cursor(cursor, sort_by)
+        keyed = [entry for entry in keyed if entry[0] > after]
+    keyed.sort(key=lambda entry: entry[0])
+
+    end = None if limit is None else offset + limit
+    page = keyed[offset:end]
+    more = end is not None and len(keyed) > end
+    return {
+        'missions': [record for _, record in page],
+        'total': total,
+        'next_cursor': encode_cursor(sort_by, page[-1][0]) if more and page else None
+    }
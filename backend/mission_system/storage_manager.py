@@ -7,12 +7,30 @@ Following spec section 6.1 - Performance Considerations
 import os
 import json
 import logging
+import sqlite3
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional
 from datetime import datetime, timezone
 
+from backend.constants import (
+    MISSION_SQLITE_BUSY_TIMEOUT,
+    MISSION_SQLITE_MMAP_SIZE,
+    MISSION_SQLITE_SYNCHRONOUS
+)
+from .atomic_io import DirectorySyncGroup, atomic_write_json
+from .mission import compact_mission_data, expand_mission_data
+from .mission_manifest import MISSION_SUBDIRECTORIES, SUMMARY_FIELDS, MissionManifest
+from .query import (
+    DEFAULT_SORT_FIELD, decode_cursor, encode_cursor, matches_filters,
+    normalize_filters, paginate, validate_sort_field
+)
+
 logger = logging.getLogger(__name__)
 
+SQLITE_SYNCHRONOUS_MODES = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+SQLITE_STATEMENT_CACHE_SIZE = 64  # Prepared statements kept per connection
+
 
 class MissionPerformanceMonitor:
     """Monitor mission system performance for scaling decisions"""
@@ -114,6 +132,18 @@ class MissionStorageManager:
             logger.error(f"❌ Failed to save mission: {e}")
             return False
     
+    def save_missions(self, missions: Iterable[Dict[str, Any]]) -> int:
+        """Save many missions in one transaction (or directory pass), returns the count saved"""
+        start_time = time.time()
+        
+        try:
+            result = self.storage_backend.save_missions(missions)
+            self.performance_monitor.record_save_time(time.time() - start_time)
+            return result
+        except (IOError, OSError, TypeError, KeyError, ValueError) as e:
+            logger.error(f"❌ Failed to save missions: {e}")
+            return 0
+    
     def load_mission(self, mission_id: str) -> Optional[Dict[str, Any]]:
         """Load mission with performance monitoring"""
         start_time = time.time()
@@ -127,6 +157,18 @@ class MissionStorageManager:
             logger.error(f"❌ Failed to load mission {mission_id}: {e}")
             return None
     
+    def load_missions(self, mission_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Load many missions with one query (or directory pass); missing IDs are skipped"""
+        start_time = time.time()
+        
+        try:
+            result = list(self.storage_backend.load_missions(mission_ids))
+            self.performance_monitor.record_load_time(time.time() - start_time)
+            return result
+        except (IOError, OSError, json.JSONDecodeError, KeyError, TypeError, sqlite3.Error) as e:
+            logger.error(f"❌ Failed to load missions: {e}")
+            return []
+    
     def load_all_missions(self) -> List[Dict[str, Any]]:
         """Load all missions with performance monitoring"""
         start_time = time.time()
@@ -153,6 +195,39 @@ class MissionStorageManager:
             logger.error(f"❌ Failed to query missions: {e}")
             return []
     
+    def query_page(self, filters: Optional[Dict[str, Any]] = None, sort_by: str = DEFAULT_SORT_FIELD,
+                   limit: Optional[int] = None, cursor: Optional[str] = None,
+                   offset: int = 0) -> Dict[str, Any]:
+        """
+        Query one page of missions, filtered and sorted by the backend
+        
+        Args:
+            filters: Field -> value (or list of values), see QUERY_FILTER_FIELDS
+            sort_by: One of QUERY_SORT_FIELDS, ties broken by ID
+            limit: Page size, None for all remaining matches
+            cursor: next_cursor of the previous page
+            offset: Matches to skip (after the cursor)
+        
+        Returns:
+            {'missions': [...], 'total': matches ignoring the cursor, 'next_cursor': str or None}
+        
+        Raises:
+            ValueError: For unknown filter or sort fields and invalid cursors
+        """
+        start_time = time.time()
+        filters = normalize_filters(filters)
+        validate_sort_field(sort_by)
+        if cursor:
+            decode_cursor(cursor, sort_by)
+        
+        try:
+            result = self.storage_backend.query_page(filters, sort_by, limit, cursor, offset)
+            self.performance_monitor.record_query_time(time.time() - start_time)
+            return result
+        except (TypeError, KeyError, sqlite3.Error) as e:
+            logger.error(f"❌ Failed to query missions: {e}")
+            return {'missions': [], 'total': 0, 'next_cursor': None}
+    
     def delete_mission(self, mission_id: str) -> bool:
         """Delete mission"""
         try:
@@ -161,6 +236,14 @@ class MissionStorageManager:
             logger.error(f"❌ Failed to delete mission {mission_id}: {e}")
             return False
     
+    def delete_missions(self, mission_ids: Iterable[str]) -> int:
+        """Delete many missions in one transaction (or directory pass), returns the count deleted"""
+        try:
+            return max(0, self.storage_backend.delete_missions(mission_ids))
+        except (IOError, OSError) as e:
+            logger.error(f"❌ Failed to delete missions: {e}")
+            return 0
+    
     def migrate_to_database(self) -> bool:
         """
         Migrate from JSON files to database when threshold reached
@@ -185,11 +268,11 @@ class MissionStorageManager:
             else:
                 db_backend = PostgreSQLStorage(new_config)
             
-            # Migrate all missions
-            migrated_count = 0
-            for mission_data in json_missions:
-                if db_backend.save_mission(mission_data):
-                    migrated_count += 1
+            # Migrate all missions in one transaction
+            migrated_count = db_backend.save_missions(json_missions)
+            if migrated_count != len(json_missions):
+                logger.error("❌ Migration aborted: database batch save failed, keeping JSON storage")
+                return False
             
             # Update storage backend
             self.storage_backend = db_backend
@@ -244,11 +327,17 @@ class MissionStorageManager:
 
 
 class JSONFileStorage:
-    """JSON file storage backend for small scale (< 50 missions)"""
+    """
+    JSON file storage backend for small scale (< 50 missions)
+    
+    A MissionManifest next to the mission directories answers lookups,
+    listings and queries without parsing mission bodies.
+    """
     
     def __init__(self, config: Dict[str, Any]):
         self.data_directory = config.get('data_directory', 'missions')
         self._ensure_directories()
+        self.manifest = MissionManifest(self.data_directory)
     
     def _ensure_directories(self):
         """Ensure required directories exist"""
@@ -256,67 +345,85 @@ class JSONFileStorage:
             path = os.path.join(self.data_directory, subdir)
             os.makedirs(path, exist_ok=True)
     
+    def _target_subdirectory(self, mission_data: Dict[str, Any]) -> str:
+        """Subdirectory a mission file belongs in, based on its state"""
+        return 'completed' if mission_data.get('state', 'Unknown') == 'Completed' else 'active'
+    
     def save_mission(self, mission_data: Dict[str, Any]) -> bool:
         """Save mission to JSON file"""
+        return self.save_missions([mission_data]) == 1
+    
+    def save_missions(self, missions: Iterable[Dict[str, Any]]) -> int:
+        """
+        Save many missions, syncing each directory and the manifest once for the whole batch
+        
+        Files are written in the compact storage format (Mission.to_storage_dict).
+        
+        Returns:
+            Number of missions saved
+        """
+        saved = []
+        sync_group = DirectorySyncGroup()
+        for mission_data in missions:
+            try:
+                subdir = self._target_subdirectory(expand_mission_data(mission_data))
+                filepath = os.path.join(self.data_directory, subdir, f"{mission_data['id']}.json")
+                atomic_write_json(filepath, compact_mission_data(mission_data), indent=None,
+                                  sync_group=sync_group)
+                saved.append((mission_data, subdir))
+            except (IOError, OSError, TypeError, KeyError, ValueError) as e:
+                logger.error(f"❌ JSON save failed: {e}")
+        sync_group.commit()
+        if saved:
+            self.manifest.record(saved)
+        return len(saved)
+    
+    def _read(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """Mission file contents in API (to_dict) form"""
         try:
-            mission_id = mission_data['id']
-            state = mission_data.get('state', 'Unknown')
-            
-            # Determine directory based on state
-            if state == 'Completed':
-                target_dir = os.path.join(self.data_directory, 'completed')
-            else:
-                target_dir = os.path.join(self.data_directory, 'active')
-            
-            filepath = os.path.join(target_dir, f"{mission_id}.json")
-            with open(filepath, 'w') as f:
-                json.dump(mission_data, f, indent=2)
-
-            return True
-
-        except (IOError, OSError, TypeError, KeyError) as e:
-            logger.error(f"❌ JSON save failed: {e}")
-            return False
+            with open(filepath, 'r') as f:
+                return expand_mission_data(json.load(f))
+        except (IOError, OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.error(f"❌ JSON load failed for {filepath}: {e}")
+            return None
     
     def load_mission(self, mission_id: str) -> Optional[Dict[str, Any]]:
         """Load mission from JSON file"""
-        # Check both active and completed directories
-        for subdir in ['active', 'completed']:
-            filepath = os.path.join(self.data_directory, subdir, f"{mission_id}.json")
-            if os.path.exists(filepath):
-                try:
-                    with open(filepath, 'r') as f:
-                        return json.load(f)
-                except (IOError, OSError, json.JSONDecodeError) as e:
-                    logger.error(f"❌ JSON load failed for {filepath}: {e}")
-        
-        return None
+        filepath = self.manifest.path_for(mission_id)
+        return self._read(filepath) if filepath else None
+    
+    def load_missions(self, mission_ids: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Stream missions with the given IDs; missing IDs are skipped"""
+        self.manifest.refresh()
+        for mission_id in mission_ids:
+            filepath = self.manifest.path_for(mission_id)
+            mission_data = self._read(filepath) if filepath else None
+            if mission_data is not None:
+                yield mission_data
     
     def load_all_missions(self) -> List[Dict[str, Any]]:
         """Load all missions from JSON files"""
-        missions = []
-        
-        for subdir in ['active', 'completed']:
-            dir_path = os.path.join(self.data_directory, subdir)
-            if os.path.exists(dir_path):
-                for filename in os.listdir(dir_path):
-                    if filename.endswith('.json'):
-                        filepath = os.path.join(dir_path, filename)
-                        try:
-                            with open(filepath, 'r') as f:
-                                mission_data = json.load(f)
-                                missions.append(mission_data)
-                        except (IOError, OSError, json.JSONDecodeError) as e:
-                            logger.error(f"❌ Failed to load {filepath}: {e}")
-        
-        return missions
+        return list(self.load_missions(list(self.manifest.entries())))
+    
+    def list_missions(self) -> List[Dict[str, Any]]:
+        """Summaries of all missions (manifest entries) without reading mission files"""
+        return list(self.manifest.entries().values())
     
     def query_missions(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Query missions with basic filtering"""
-        all_missions = self.load_all_missions()
+        if all(key in SUMMARY_FIELDS for key in filters):
+            # Filter on the manifest, then read only the matches
+            matching_ids = [
+                mission_id for mission_id, entry in self.manifest.entries().items()
+                if all(entry.get(key) == value for key, value in filters.items())
+            ]
+            candidates = self.load_missions(matching_ids)
+        else:
+            candidates = self.load_all_missions()
+        
         filtered = []
         
-        for mission in all_missions:
+        for mission in candidates:
             match = True
             
             for key, value in filters.items():
@@ -329,186 +436,350 @@ class JSONFileStorage:
         
         return filtered
     
+    def query_page(self, filters: Dict[str, List[Any]], sort_by: str, limit: Optional[int],
+                   cursor: Optional[str], offset: int) -> Dict[str, Any]:
+        """Filter and page manifest entries, then read only the page (see MissionStorageManager.query_page)"""
+        entries = (entry for entry in self.manifest.entries().values() if matches_filters(entry, filters))
+        result = paginate(entries, sort_by, limit, cursor, offset)
+        result['missions'] = list(self.load_missions([entry['id'] for entry in result['missions']]))
+        return result
+    
     def delete_mission(self, mission_id: str) -> bool:
         """Delete mission JSON file"""
-        for subdir in ['active', 'completed']:
-            filepath = os.path.join(self.data_directory, subdir, f"{mission_id}.json")
-            if os.path.exists(filepath):
-                try:
-                    os.remove(filepath)
-                    return True
-                except (IOError, OSError) as e:
-                    logger.error(f"❌ Failed to delete {filepath}: {e}")
+        filepath = self.manifest.path_for(mission_id)
+        if filepath is None:
+            return False
         
-        return False
+        try:
+            os.remove(filepath)
+        except (IOError, OSError) as e:
+            logger.error(f"❌ Failed to delete {filepath}: {e}")
+            return False
+        
+        self.manifest.remove([mission_id])
+        return True
+    
+    def delete_missions(self, mission_ids: Iterable[str]) -> int:
+        """
+        Delete the files of many missions in one directory pass
+        
+        Returns:
+            Number of mission files deleted
+        """
+        wanted = set(mission_ids)
+        deleted = 0
+        sync_group = DirectorySyncGroup()
+        for subdir in MISSION_SUBDIRECTORIES:
+            dir_path = os.path.join(self.data_directory, subdir)
+            if not os.path.exists(dir_path):
+                continue
+            for filename in os.listdir(dir_path):
+                if filename.endswith('.json') and filename[:-len('.json')] in wanted:
+                    try:
+                        os.remove(os.path.join(dir_path, filename))
+                        deleted += 1
+                        sync_group.add(dir_path)
+                    except (IOError, OSError) as e:
+                        logger.error(f"❌ Failed to delete {filename}: {e}")
+        sync_group.commit()
+        self.manifest.remove(wanted)
+        return deleted
+
+
+SQLITE_UPSERT_MISSION = '''
+    INSERT OR REPLACE INTO missions 
+    (id, title, description, mission_type, location, faction, state, 
+     is_botched, reward_package_id, created_at, updated_at, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQLITE_INSERT_OBJECTIVE = '''
+    INSERT INTO objectives 
+    (id, mission_id, description, is_achieved, is_optional, is_ordered, achieved_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+# Bound parameters per "IN (...)" query, below SQLite's historic limit of 999
+SQLITE_MAX_BATCH_PARAMS = 500
+
+
+def _mission_row(mission_data: Dict[str, Any], data: Any) -> tuple:
+    """Column values of a missions table row, data being the encoded blob"""
+    return (
+        mission_data['id'],
+        mission_data['title'],
+        mission_data['description'],
+        mission_data.get('mission_type'),
+        mission_data.get('location'),
+        mission_data.get('faction'),
+        mission_data['state'],
+        mission_data.get('is_botched', False),
+        mission_data.get('reward_package_id'),
+        mission_data.get('created_at'),
+        mission_data.get('updated_at'),
+        data
+    )
+
+
+def _objective_rows(mission_data: Dict[str, Any]) -> List[tuple]:
+    """Column values of the objectives table rows of a mission"""
+    return [
+        (
+            obj['id'],
+            mission_data['id'],
+            obj['description'],
+            obj.get('is_achieved', False),
+            obj.get('is_optional', False),
+            obj.get('is_ordered', False),
+            obj.get('achieved_at')
+        )
+        for obj in mission_data.get('objectives', [])
+    ]
+
+
+def _sql_page_query(filters: Dict[str, List[Any]], sort_by: str, limit: Optional[int],
+                    cursor: Optional[str], offset: int, placeholder: str,
+                    sort_expression: str) -> tuple:
+    """
+    Build (page SQL, page params, count SQL, count params) for query_page
+
+    The page query selects (data, sort value, id); rows are ordered by the
+    sort expression then id, and the cursor resumes with a range condition
+    on that pair. One extra row is fetched to tell whether a next page exists.
+    """
+    where_clauses = []
+    params: List[Any] = []
+    for field, values in filters.items():
+        where_clauses.append(f"{field} IN ({', '.join([placeholder] * len(values))})")
+        params.extend(values)
+    count_sql = f"SELECT COUNT(*) FROM missions WHERE {' AND '.join(where_clauses) or '1=1'}"
+    count_params = list(params)
+
+    if cursor:
+        after_value, after_id = decode_cursor(cursor, sort_by)
+        where_clauses.append(
+            f"({sort_expression} > {placeholder} OR ({sort_expression} = {placeholder} AND id > {placeholder}))"
+        )
+        params.extend([after_value, after_value, after_id])
+
+    sql = (f"SELECT data, {sort_expression}, id FROM missions "
+           f"WHERE {' AND '.join(where_clauses) or '1=1'} "
+           f"ORDER BY {sort_expression}, id")
+    if limit is not None:
+        sql += f" LIMIT {placeholder}"
+        params.append(limit + 1)
+    if offset:
+        if limit is None:
+            sql += " LIMIT ALL" if placeholder == '%s' else " LIMIT -1"
+        sql += f" OFFSET {placeholder}"
+        params.append(offset)
+    return sql, params, count_sql, count_params
+
+
+def _page_result(rows: List[tuple], limit: Optional[int], sort_by: str, total: int,
+                 decode: Callable[[Any], Dict[str, Any]]) -> Dict[str, Any]:
+    """Turn (data, sort value, id) rows of a page query into a query_page result"""
+    more = limit is not None and len(rows) > limit
+    rows = rows[:limit] if more else rows
+    next_cursor = encode_cursor(sort_by, (str(rows[-1][1]), str(rows[-1][2]))) if more and rows else None
+    return {
+        'missions': [decode(row[0]) for row in rows],
+        'total': total,
+        'next_cursor': next_cursor
+    }
+
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 
 class SQLiteStorage:
-    """SQLite storage backend for medium scale (50-100 missions)"""
+    """
+    SQLite storage backend for medium scale (50-100 missions)
+    
+    Each thread gets its own pooled connection in WAL mode, so readers do not
+    block the writer and statements stay in the connection's statement cache.
+    """
     
     def __init__(self, config: Dict[str, Any]):
         self.db_path = config.get('sqlite_path', 'missions.db')
+        self.synchronous = config.get('sqlite_synchronous', MISSION_SQLITE_SYNCHRONOUS)
+        self.mmap_size = int(config.get('sqlite_mmap_size', MISSION_SQLITE_MMAP_SIZE))
+        self.busy_timeout = float(config.get('sqlite_busy_timeout', MISSION_SQLITE_BUSY_TIMEOUT))
+        
+        if str(self.synchronous).upper() not in SQLITE_SYNCHRONOUS_MODES:
+            raise ValueError(f"Unknown SQLite synchronous mode: {self.synchronous}")
+        
+        # Thread ident -> connection owned by that thread
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._pool_lock = threading.Lock()
+        
         self._initialize_database()
     
+    def _connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use"""
+        thread_id = threading.get_ident()
+        conn = self._connections.get(thread_id)
+        if conn is not None:
+            return conn
+        
+        # check_same_thread is off only so close() and pruning can close
+        # connections of other threads; each connection serves one thread
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            check_same_thread=False,
+            cached_statements=SQLITE_STATEMENT_CACHE_SIZE
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(f'PRAGMA synchronous={str(self.synchronous).upper()}')
+        conn.execute(f'PRAGMA mmap_size={self.mmap_size}')
+        conn.execute('PRAGMA foreign_keys=ON')
+        
+        with self._pool_lock:
+            self._prune_connections()
+            self._connections[thread_id] = conn
+        return conn
+    
+    def _prune_connections(self):
+        """Close connections whose threads have exited (pool lock held)"""
+        live_threads = {thread.ident for thread in threading.enumerate()}
+        for thread_id in list(self._connections):
+            if thread_id not in live_threads:
+                self._connections.pop(thread_id).close()
+    
+    def close(self):
+        """Close every pooled connection"""
+        with self._pool_lock:
+            connections, self._connections = self._connections, {}
+        for conn in connections.values():
+            conn.close()
+    
     def _initialize_database(self):
         """Initialize SQLite database with mission tables"""
-        import sqlite3
-        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Create missions table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS missions (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    mission_type TEXT,
-                    location TEXT,
-                    faction TEXT,
-                    state TEXT,
-                    is_botched BOOLEAN,
-                    reward_package_id INTEGER,
-                    created_at TIMESTAMP,
-                    updated_at TIMESTAMP,
-                    data TEXT  -- JSON blob for full mission data
-                )
-            ''')
-            
-            # Create objectives table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS objectives (
-                    id TEXT,
-                    mission_id TEXT,
-                    description TEXT,
-                    is_achieved BOOLEAN,
-                    is_optional BOOLEAN,
-                    is_ordered BOOLEAN,
-                    achieved_at TIMESTAMP,
-                    PRIMARY KEY (id, mission_id),
-                    FOREIGN KEY (mission_id) REFERENCES missions (id)
-                )
-            ''')
+            conn = self._connection()
+            with conn:
+                # Create missions table
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS missions (
+                        id TEXT PRIMARY KEY,
+                        title TEXT NOT NULL,
+                        description TEXT,
+                        mission_type TEXT,
+                        location TEXT,
+                        faction TEXT,
+                        state TEXT,
+                        is_botched BOOLEAN,
+                        reward_package_id INTEGER,
+                        created_at TIMESTAMP,
+                        updated_at TIMESTAMP,
+                        data TEXT  -- JSON blob for full mission data
+                    )
+                ''')
+                
+                # Create objectives table
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS objectives (
+                        id TEXT,
+                        mission_id TEXT,
+                        description TEXT,
+                        is_achieved BOOLEAN,
+                        is_optional BOOLEAN,
+                        is_ordered BOOLEAN,
+                        achieved_at TIMESTAMP,
+                        PRIMARY KEY (id, mission_id),
+                        FOREIGN KEY (mission_id) REFERENCES missions (id)
+                    )
+                ''')
+                
+                # Create indexes for performance
+                conn.execute('CREATE INDEX IF NOT EXISTS idx_missions_state ON missions (state)')
+                conn.execute('CREATE INDEX IF NOT EXISTS idx_missions_location ON missions (location)')
+                conn.execute('CREATE INDEX IF NOT EXISTS idx_missions_faction ON missions (faction)')
+                conn.execute('CREATE INDEX IF NOT EXISTS idx_objectives_mission ON objectives (mission_id)')
+                conn.execute('CREATE INDEX IF NOT EXISTS idx_missions_type ON missions (mission_type)')
+                # Match the ORDER BY expressions of query_page's default sorts
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_missions_created ON missions (COALESCE(created_at, ''), id)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_missions_updated ON missions (COALESCE(updated_at, ''), id)")
             
-            # Create indexes for performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_missions_state ON missions (state)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_missions_location ON missions (location)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_missions_faction ON missions (faction)')
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"📊 SQLite database initialized: {self.db_path}")
+            logger.info(f"📊 SQLite database initialized: {self.db_path} (WAL, synchronous={self.synchronous})")
 
-        except (IOError, OSError) as e:
+        except (IOError, OSError, sqlite3.Error) as e:
             logger.error(f"❌ SQLite initialization failed: {e}")
             raise
     
     def save_mission(self, mission_data: Dict[str, Any]) -> bool:
         """Save mission to SQLite database"""
-        import sqlite3
+        return self.save_missions([mission_data]) == 1
+    
+    def save_missions(self, missions: Iterable[Dict[str, Any]]) -> int:
+        """
+        Save many missions in a single transaction
         
+        Returns:
+            Number of missions saved (all or none)
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            missions = list(missions)
+            mission_rows = [_mission_row(m, json.dumps(m)) for m in missions]
+            objective_rows = [row for m in missions for row in _objective_rows(m)]
             
-            # Insert or replace mission
-            cursor.execute('''
-                INSERT OR REPLACE INTO missions 
-                (id, title, description, mission_type, location, faction, state, 
-                 is_botched, reward_package_id, created_at, updated_at, data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                mission_data['id'],
-                mission_data['title'],
-                mission_data['description'],
-                mission_data.get('mission_type'),
-                mission_data.get('location'),
-                mission_data.get('faction'),
-                mission_data['state'],
-                mission_data.get('is_botched', False),
-                mission_data.get('reward_package_id'),
-                mission_data.get('created_at'),
-                mission_data.get('updated_at'),
-                json.dumps(mission_data)
-            ))
-            
-            # Save objectives
-            cursor.execute('DELETE FROM objectives WHERE mission_id = ?', (mission_data['id'],))
-            
-            for obj in mission_data.get('objectives', []):
-                cursor.execute('''
-                    INSERT INTO objectives 
-                    (id, mission_id, description, is_achieved, is_optional, is_ordered, achieved_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    obj['id'],
-                    mission_data['id'],
-                    obj['description'],
-                    obj.get('is_achieved', False),
-                    obj.get('is_optional', False),
-                    obj.get('is_ordered', False),
-                    obj.get('achieved_at')
-                ))
+            conn = self._connection()
+            with conn:
+                # Insert or replace missions
+                conn.executemany(SQLITE_UPSERT_MISSION, mission_rows)
+                
+                # Replace objectives
+                conn.executemany('DELETE FROM objectives WHERE mission_id = ?',
+                                 [(m['id'],) for m in missions])
+                conn.executemany(SQLITE_INSERT_OBJECTIVE, objective_rows)
             
-            conn.commit()
-            conn.close()
-            return True
+            return len(missions)
 
-        except (TypeError, KeyError, ValueError) as e:
+        except (TypeError, KeyError, ValueError, sqlite3.Error) as e:
             logger.error(f"❌ SQLite save failed: {e}")
-            return False
+            return 0
 
     def load_mission(self, mission_id: str) -> Optional[Dict[str, Any]]:
         """Load mission from SQLite database"""
-        import sqlite3
-        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT data FROM missions WHERE id = ?', (mission_id,))
-            row = cursor.fetchone()
-            
-            conn.close()
+            row = self._connection().execute(
+                'SELECT data FROM missions WHERE id = ?', (mission_id,)
+            ).fetchone()
             
             if row:
                 return json.loads(row[0])
 
             return None
 
-        except (json.JSONDecodeError, TypeError, KeyError) as e:
+        except (json.JSONDecodeError, TypeError, KeyError, sqlite3.Error) as e:
             logger.error(f"❌ SQLite load failed: {e}")
             return None
 
+    def load_missions(self, mission_ids: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Stream missions with the given IDs from the cursor; missing IDs are skipped"""
+        conn = self._connection()
+        for batch in _chunks(list(mission_ids), SQLITE_MAX_BATCH_PARAMS):
+            placeholders = ', '.join('?' * len(batch))
+            for row in conn.execute(f'SELECT data FROM missions WHERE id IN ({placeholders})', batch):
+                yield json.loads(row[0])
+
     def load_all_missions(self) -> List[Dict[str, Any]]:
         """Load all missions from SQLite database"""
-        import sqlite3
-        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT data FROM missions')
-            rows = cursor.fetchall()
-            
-            conn.close()
-
+            rows = self._connection().execute('SELECT data FROM missions')
             return [json.loads(row[0]) for row in rows]
 
-        except (json.JSONDecodeError, TypeError, KeyError) as e:
+        except (json.JSONDecodeError, TypeError, KeyError, sqlite3.Error) as e:
             logger.error(f"❌ SQLite load all failed: {e}")
             return []
 
     def query_missions(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Query missions with SQL filtering"""
-        import sqlite3
-        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             # Build WHERE clause
             where_clauses = []
             params = []
@@ -524,35 +795,73 @@ class SQLiteStorage:
             where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
             sql = f"SELECT data FROM missions WHERE {where_sql}"
             
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
-            
-            conn.close()
-
+            rows = self._connection().execute(sql, params)
             return [json.loads(row[0]) for row in rows]
 
-        except (json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
+        except (json.JSONDecodeError, TypeError, KeyError, ValueError, sqlite3.Error) as e:
             logger.error(f"❌ SQLite query failed: {e}")
             return []
 
+    def query_page(self, filters: Dict[str, List[Any]], sort_by: str, limit: Optional[int],
+                   cursor: Optional[str], offset: int) -> Dict[str, Any]:
+        """Indexed keyset query (normalized filters, see MissionStorageManager.query_page)"""
+        sql, params, count_sql, count_params = _sql_page_query(
+            filters, sort_by, limit, cursor, offset, '?', f"COALESCE({sort_by}, '')"
+        )
+        conn = self._connection()
+        total = conn.execute(count_sql, count_params).fetchone()[0]
+        rows = conn.execute(sql, params).fetchall()
+        return _page_result(rows, limit, sort_by, total, json.loads)
+
     def delete_mission(self, mission_id: str) -> bool:
         """Delete mission from SQLite database"""
-        import sqlite3
+        return self.delete_missions([mission_id]) >= 0
 
+    def delete_missions(self, mission_ids: Iterable[str]) -> int:
+        """
+        Delete many missions in a single transaction
+        
+        Returns:
+            Number of missions deleted, or -1 on failure
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            params = [(mission_id,) for mission_id in mission_ids]
+            conn = self._connection()
+            with conn:
+                conn.executemany('DELETE FROM objectives WHERE mission_id = ?', params)
+                cursor = conn.executemany('DELETE FROM missions WHERE id = ?', params)
+            return cursor.rowcount
 
-            cursor.execute('DELETE FROM objectives WHERE mission_id = ?', (mission_id,))
-            cursor.execute('DELETE FROM missions WHERE id = ?', (mission_id,))
+        except (IOError, OSError, sqlite3.Error) as e:
+            logger.error(f"❌ SQLite delete failed: {e}")
+            return -1
 
-            conn.commit()
-            conn.close()
-            return True
 
-        except (IOError, OSError) as e:
-            logger.error(f"❌ SQLite delete failed: {e}")
-            return False
+POSTGRES_UPSERT_MISSION = '''
+    INSERT INTO missions 
+    (id, title, description, mission_type, location, faction, state, 
+     is_botched, reward_package_id, created_at, updated_at, data)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        description = EXCLUDED.description,
+        mission_type = EXCLUDED.mission_type,
+        location = EXCLUDED.location,
+        faction = EXCLUDED.faction,
+        state = EXCLUDED.state,
+        is_botched = EXCLUDED.is_botched,
+        reward_package_id = EXCLUDED.reward_package_id,
+        updated_at = EXCLUDED.updated_at,
+        data = EXCLUDED.data
+'''
+
+POSTGRES_INSERT_OBJECTIVE = '''
+    INSERT INTO objectives 
+    (id, mission_id, description, is_achieved, is_optional, is_ordered, achieved_at)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+'''
+
+POSTGRES_STREAM_BATCH_SIZE = 500  # Rows fetched per round trip by streaming loads
 
 
 class PostgreSQLStorage:
@@ -615,6 +924,9 @@ class PostgreSQLStorage:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_missions_location ON missions (location)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_missions_faction ON missions (faction)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_missions_data_gin ON missions USING GIN (data)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_missions_type ON missions (mission_type)')
+            cursor.execute('''CREATE INDEX IF NOT EXISTS idx_missions_created
+                              ON missions ((COALESCE(CAST(created_at AS TEXT), '') COLLATE "C"), id)''')
             
             conn.commit()
             conn.close()
@@ -630,70 +942,43 @@ class PostgreSQLStorage:
     
     def save_mission(self, mission_data: Dict[str, Any]) -> bool:
         """Save mission to PostgreSQL database"""
+        return self.save_missions([mission_data]) == 1
+
+    def save_missions(self, missions: Iterable[Dict[str, Any]]) -> int:
+        """
+        Save many missions in a single transaction
+        
+        Returns:
+            Number of missions saved (all or none)
+        """
         try:
             import psycopg2
             import psycopg2.extras
             
-            conn = psycopg2.connect(**self.connection_params)
-            cursor = conn.cursor()
+            missions = list(missions)
+            mission_ids = [m['id'] for m in missions]
             
-            # Use UPSERT for mission
-            cursor.execute('''
-                INSERT INTO missions 
-                (id, title, description, mission_type, location, faction, state, 
-                 is_botched, reward_package_id, created_at, updated_at, data)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (id) DO UPDATE SET
-                    title = EXCLUDED.title,
-                    description = EXCLUDED.description,
-                    mission_type = EXCLUDED.mission_type,
-                    location = EXCLUDED.location,
-                    faction = EXCLUDED.faction,
-                    state = EXCLUDED.state,
-                    is_botched = EXCLUDED.is_botched,
-                    reward_package_id = EXCLUDED.reward_package_id,
-                    updated_at = EXCLUDED.updated_at,
-                    data = EXCLUDED.data
-            ''', (
-                mission_data['id'],
-                mission_data['title'],
-                mission_data['description'],
-                mission_data.get('mission_type'),
-                mission_data.get('location'),
-                mission_data.get('faction'),
-                mission_data['state'],
-                mission_data.get('is_botched', False),
-                mission_data.get('reward_package_id'),
-                mission_data.get('created_at'),
-                mission_data.get('updated_at'),
-                psycopg2.extras.Json(mission_data)
-            ))
-            
-            # Handle objectives
-            cursor.execute('DELETE FROM objectives WHERE mission_id = %s', (mission_data['id'],))
-            
-            for obj in mission_data.get('objectives', []):
-                cursor.execute('''
-                    INSERT INTO objectives 
-                    (id, mission_id, description, is_achieved, is_optional, is_ordered, achieved_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ''', (
-                    obj['id'],
-                    mission_data['id'],
-                    obj['description'],
-                    obj.get('is_achieved', False),
-                    obj.get('is_optional', False),
-                    obj.get('is_ordered', False),
-                    obj.get('achieved_at')
-                ))
+            conn = psycopg2.connect(**self.connection_params)
+            try:
+                with conn, conn.cursor() as cursor:
+                    # Use UPSERT for missions
+                    psycopg2.extras.execute_batch(cursor, POSTGRES_UPSERT_MISSION, [
+                        _mission_row(m, psycopg2.extras.Json(m)) for m in missions
+                    ])
+                    
+                    # Replace objectives
+                    cursor.execute('DELETE FROM objectives WHERE mission_id = ANY(%s)', (mission_ids,))
+                    psycopg2.extras.execute_batch(cursor, POSTGRES_INSERT_OBJECTIVE, [
+                        row for m in missions for row in _objective_rows(m)
+                    ])
+            finally:
+                conn.close()
             
-            conn.commit()
-            conn.close()
-            return True
+            return len(missions)
 
         except (TypeError, KeyError, ValueError) as e:
             logger.error(f"❌ PostgreSQL save failed: {e}")
-            return False
+            return 0
 
     def load_mission(self, mission_id: str) -> Optional[Dict[str, Any]]:
         """Load mission from PostgreSQL database"""
@@ -717,6 +1002,20 @@ class PostgreSQLStorage:
             logger.error(f"❌ PostgreSQL load failed: {e}")
             return None
 
+    def load_missions(self, mission_ids: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Stream missions with the given IDs through a server-side cursor"""
+        import psycopg2
+        
+        conn = psycopg2.connect(**self.connection_params)
+        try:
+            with conn.cursor(name='planetz_load_missions') as cursor:
+                cursor.itersize = POSTGRES_STREAM_BATCH_SIZE
+                cursor.execute('SELECT data FROM missions WHERE id = ANY(%s)', (list(mission_ids),))
+                for row in cursor:
+                    yield row[0]  # JSONB is automatically decoded
+        finally:
+            conn.close()
+
     def load_all_missions(self) -> List[Dict[str, Any]]:
         """Load all missions from PostgreSQL database"""
         try:
@@ -776,21 +1075,50 @@ class PostgreSQLStorage:
             logger.error(f"❌ PostgreSQL query failed: {e}")
             return []
 
+    def query_page(self, filters: Dict[str, List[Any]], sort_by: str, limit: Optional[int],
+                   cursor: Optional[str], offset: int) -> Dict[str, Any]:
+        """Indexed keyset query (normalized filters, see MissionStorageManager.query_page)"""
+        import psycopg2
+        
+        sql, params, count_sql, count_params = _sql_page_query(
+            filters, sort_by, limit, cursor, offset, '%s',
+            f'COALESCE(CAST({sort_by} AS TEXT), \'\') COLLATE "C"'
+        )
+        conn = psycopg2.connect(**self.connection_params)
+        try:
+            with conn.cursor() as db_cursor:
+                db_cursor.execute(count_sql, count_params)
+                total = db_cursor.fetchone()[0]
+                db_cursor.execute(sql, params)
+                rows = db_cursor.fetchall()
+        finally:
+            conn.close()
+        # JSONB is automatically decoded
+        return _page_result(rows, limit, sort_by, total, lambda data: data)
+
     def delete_mission(self, mission_id: str) -> bool:
         """Delete mission from PostgreSQL database"""
+        return self.delete_missions([mission_id]) >= 0
+
+    def delete_missions(self, mission_ids: Iterable[str]) -> int:
+        """
+        Delete many missions in a single transaction
+        
+        Returns:
+            Number of missions deleted, or -1 on failure
+        """
         try:
             import psycopg2
 
             conn = psycopg2.connect(**self.connection_params)
-            cursor = conn.cursor()
-
-            # Objectives will be deleted automatically due to CASCADE
-            cursor.execute('DELETE FROM missions WHERE id = %s', (mission_id,))
-
-            conn.commit()
-            conn.close()
-            return True
+            try:
+                with conn, conn.cursor() as cursor:
+                    # Objectives will be deleted automatically due to CASCADE
+                    cursor.execute('DELETE FROM missions WHERE id = ANY(%s)', (list(mission_ids),))
+                    return cursor.rowcount
+            finally:
+                conn.close()
 
         except (IOError, OSError) as e:
             logger.error(f"❌ PostgreSQL delete failed: {e}")
-            return False
+            return -1
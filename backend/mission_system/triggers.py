@@ -7,6 +7,8 @@ Following spec section 4.3 - Events/Callbacks
 import logging
 from typing import Dict, List, Any, Callable, Optional
 
+from .job_queue import MissionJobQueue
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,26 +18,76 @@ class MissionTriggerSystem:
     Handles mission state changes, objective completion, and frontend notifications
     """
     
-    def __init__(self):
+    def __init__(self, job_queue: Optional[MissionJobQueue] = None):
+        """
+        Args:
+            job_queue: Runs background callbacks; without one they run inline
+        """
         self.triggers: Dict[str, List[Callable]] = {}
+        # Callbacks whose results are not part of the API response
+        self.background_triggers: Dict[str, List[Callable]] = {}
+        # listener(event_type, mission_data, context, hooks) for every fired trigger
+        self.listeners: List[Callable] = []
+        self.job_queue = job_queue
         self._register_default_triggers()
     
-    def register_trigger(self, event_type: str, callback: Callable):
+    def register_trigger(self, event_type: str, callback: Callable, background: bool = False):
         """
         Register a callback for a specific mission event
         From spec: Events/Callbacks system for frontend integration
+        
+        Args:
+            event_type: Event the callback reacts to
+            callback: callback(mission_data, context); foreground callbacks
+                return hook data for the API response
+            background: Run the callback on the job queue after the response
+                instead of inside fire_trigger; its return value is discarded
         """
-        if event_type not in self.triggers:
-            self.triggers[event_type] = []
+        triggers = self.background_triggers if background else self.triggers
+        if event_type not in triggers:
+            triggers[event_type] = []
         
-        self.triggers[event_type].append(callback)
-        logger.debug(f"🔗 Registered trigger for event: {event_type}")
+        triggers[event_type].append(callback)
+        logger.debug(f"🔗 Registered {'background ' if background else ''}trigger for event: {event_type}")
+    
+    def add_listener(self, listener: Callable):
+        """
+        Register a listener called after every fired trigger
+        
+        Args:
+            listener: listener(event_type, mission_data, context, hooks),
+                e.g. MissionEventStream.publish
+        """
+        self.listeners.append(listener)
     
     def fire_trigger(self, event_type: str, mission_data: Any, 
                     context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Fire all callbacks for an event type
         Returns list of hook data for API responses
+        
+        Call once per occurrence: listeners are notified and background
+        callbacks queued every time. Use collect_hooks() to rebuild the
+        response hooks of an occurrence that was already fired.
+        """
+        response_hooks = self.collect_hooks(event_type, mission_data, context)
+        
+        for listener in self.listeners:
+            try:
+                listener(event_type, mission_data, context, response_hooks)
+            except (TypeError, KeyError, AttributeError, ValueError) as e:
+                logger.error(f"❌ Trigger listener failed for {event_type}: {e}")
+        
+        self._submit_background(event_type, mission_data, context)
+        return response_hooks
+    
+    def collect_hooks(self, event_type: str, mission_data: Any,
+                      context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Run only the foreground callbacks of an event and return their hook data
+        
+        Listeners and background callbacks are not involved, so this has no
+        side effects beyond the callbacks themselves.
         """
         callbacks = self.triggers.get(event_type, [])
         response_hooks = []
@@ -50,9 +102,21 @@ class MissionTriggerSystem:
         
         if response_hooks:
             logger.debug(f"🔥 Fired {len(callbacks)} triggers for {event_type}")
-        
         return response_hooks
     
+    def _submit_background(self, event_type: str, mission_data: Any, context: Optional[Dict[str, Any]]):
+        """Queue the background callbacks of an event, ordered per mission"""
+        key = getattr(mission_data, 'id', None) or event_type
+        for callback in self.background_triggers.get(event_type, []):
+            if self.job_queue is not None:
+                self.job_queue.submit(key, callback, mission_data, context,
+                                      description=f"{event_type} trigger")
+                continue
+            try:
+                callback(mission_data, context)
+            except (TypeError, KeyError, AttributeError, ValueError) as e:
+                logger.error(f"❌ Background trigger callback failed for {event_type}: {e}")
+    
     def _register_default_triggers(self):
         """Register default triggers for common events"""
         
@@ -10,11 +10,23 @@ classes, and diplomacy states.
 import json
 import os
 import logging
+import time
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+from backend.constants import REFERENCE_DATA_RELOAD_INTERVAL
+from backend.file_monitor import ChangeMonitor, file_signature
+
 logger = logging.getLogger(__name__)
 
+# Reference data files, keyed by the attribute they are exposed as
+REFERENCE_FILES = {
+    'factions': 'factions.json',
+    'object_types': 'object_types.json',
+    'planet_classes': 'planet_classes.json',
+    'diplomacy_states': 'diplomacy_states.json',
+}
+
 
 class ReferenceDataManager:
     """
@@ -22,54 +34,153 @@ class ReferenceDataManager:
 
     Loads and provides access to all static reference data used by the game,
     including factions, object types, planet classes, and diplomacy states.
+
+    Files are checked for changes at most once every reload_interval seconds.
+    Only files whose signature changed are parsed again, and the new data is
+    swapped in as a whole so readers never see a half-updated set.
     """
 
-    def __init__(self):
-        """Initialize the reference data manager."""
-        self._data_dir = Path(__file__).parent.parent / 'data' / 'reference'
+    def __init__(self, data_dir: Optional[Path] = None,
+                 reload_interval: Optional[float] = REFERENCE_DATA_RELOAD_INTERVAL):
+        """
+        Initialize the reference data manager.
 
-        # Core data stores
-        self.factions: Dict[str, Any] = {}
-        self.object_types: Dict[str, Any] = {}
-        self.planet_classes: Dict[str, Any] = {}
-        self.diplomacy_states: Dict[str, Any] = {}
+        Args:
+            data_dir (Path, optional): Reference data directory, defaults to
+                the repository data/reference directory
+            reload_interval (float, optional): Minimum seconds between file
+                change checks, or None to disable automatic reloads
+        """
+        self._data_dir = Path(data_dir) if data_dir else Path(__file__).parent.parent / 'data' / 'reference'
 
-        # Metadata
-        self.metadata: Dict[str, Any] = {}
+        # Current data set: one entry per REFERENCE_FILES key plus 'metadata'
+        self._snapshot: Dict[str, Dict[str, Any]] = {key: {} for key in REFERENCE_FILES}
+        self._snapshot['metadata'] = {}
+        self._signatures: Dict[str, Any] = {}
+        self._monitor = ChangeMonitor(reload_interval)
 
         # Load all reference data
         self._load_all_data()
 
+    @property
+    def factions(self) -> Dict[str, Any]:
+        return self._current()['factions']
+
+    @property
+    def object_types(self) -> Dict[str, Any]:
+        return self._current()['object_types']
+
+    @property
+    def planet_classes(self) -> Dict[str, Any]:
+        return self._current()['planet_classes']
+
+    @property
+    def diplomacy_states(self) -> Dict[str, Any]:
+        return self._current()['diplomacy_states']
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self._current()['metadata']
+
+    def get_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current data set as one consistent version.
+
+        Each property fetches the current data set on its own, so a reload
+        can land between two property reads. Callers that combine several
+        data sets should read them all from one snapshot.
+
+        Returns:
+            dict: One entry per REFERENCE_FILES key plus 'metadata'; never mutate it
+        """
+        return self._current()
+
+    def _current(self) -> Dict[str, Dict[str, Any]]:
+        """Return the current data set, picking up changed files first if a check is due."""
+        if self._monitor.due():
+            self.check_for_changes()
+        return self._snapshot
+
     def _load_all_data(self) -> None:
-        """Load all reference data files."""
+        """Load all reference data files; unreadable files load as empty data sets."""
+        self._load_files(list(REFERENCE_FILES), strict=False)
+
+    def check_for_changes(self) -> List[str]:
+        """
+        Reload reference data files that changed since they were loaded.
+
+        Returns:
+            list: Keys of the reloaded data sets (e.g. ['factions'])
+        """
+        if not self._monitor.try_begin_reload():
+            return []
+        try:
+            changed = [
+                key for key, filename in REFERENCE_FILES.items()
+                if file_signature(self._data_dir / filename) != self._signatures.get(key)
+            ]
+            if changed:
+                logger.info(f"Reference data changed on disk, reloading: {', '.join(changed)}")
+                if not self._load_files(changed):
+                    return []
+            return changed
+        finally:
+            self._monitor.end_reload()
+
+    def _load_files(self, keys: List[str], strict: bool = True) -> bool:
+        """
+        Parse the given reference files and swap in a new data set.
+
+        Args:
+            keys (list): REFERENCE_FILES keys to load
+            strict (bool): Keep the previous data set if any file cannot be
+                read or parsed, instead of loading that file as empty data.
+                The file's signature is not recorded, so it is retried on
+                the next check.
+
+        Returns:
+            bool: True if the new data set was swapped in
+        """
+        snapshot = dict(self._snapshot)
+        signatures = {}
         try:
-            self.factions = self._load_json_file('factions.json')
-            self.object_types = self._load_json_file('object_types.json')
-            self.planet_classes = self._load_json_file('planet_classes.json')
-            self.diplomacy_states = self._load_json_file('diplomacy_states.json')
+            for key in keys:
+                filename = REFERENCE_FILES[key]
+                # Take the signature first so a write racing the read is seen on the next check
+                signatures[key] = file_signature(self._data_dir / filename)
+                snapshot[key] = self._load_json_file(filename, strict)
 
             # Extract metadata
-            self.metadata = {
-                'factions_count': len(self.factions.get('factions', {})),
-                'object_types_count': len(self.object_types.get('objectTypes', {})),
-                'planet_classes_count': len(self.planet_classes.get('planetClasses', {})),
-                'diplomacy_states_count': len(self.diplomacy_states.get('diplomacyStates', {})),
+            snapshot['metadata'] = {
+                'factions_count': len(snapshot['factions'].get('factions', {})),
+                'object_types_count': len(snapshot['object_types'].get('objectTypes', {})),
+                'planet_classes_count': len(snapshot['planet_classes'].get('planetClasses', {})),
+                'diplomacy_states_count': len(snapshot['diplomacy_states'].get('diplomacyStates', {})),
                 'last_updated': self._get_latest_update_time()
             }
 
-        except (IOError, OSError, json.JSONDecodeError, TypeError, KeyError) as e:
-            logger.error(f"Error loading reference data: {e}")
-            # Continue with empty data structures
+        except (IOError, OSError, json.JSONDecodeError, TypeError, KeyError, AttributeError) as e:
+            logger.error(f"Error loading reference data, keeping the previous data set: {e}")
+            return False
+
+        self._snapshot = snapshot
+        self._signatures.update(signatures)
+        return True
 
-    def _load_json_file(self, filename: str) -> Dict[str, Any]:
+    def _load_json_file(self, filename: str, strict: bool = False) -> Dict[str, Any]:
         """
         Load a JSON file from the reference data directory.
 
         Args:
             filename (str): Name of the JSON file to load
+            strict (bool): Raise read and parse errors instead of returning {}
 
         Returns:
             dict: Loaded JSON data, or empty dict if file not found/error
+
+        Raises:
+            json.JSONDecodeError, OSError: In strict mode, if the file is
+                broken or unreadable (e.g. half written)
         """
         file_path = self._data_dir / filename
 
@@ -82,16 +193,20 @@ class ReferenceDataManager:
                 return json.load(f)
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing {filename}: {e}")
+            if strict:
+                raise
             return {}
         except (IOError, OSError) as e:
             logger.error(f"Error loading {filename}: {e}")
+            if strict:
+                raise
             return {}
 
     def _get_latest_update_time(self) -> Optional[str]:
         """Get the latest update time from all reference files."""
         latest_time = None
 
-        for filename in ['factions.json', 'object_types.json', 'planet_classes.json', 'diplomacy_states.json']:
+        for filename in REFERENCE_FILES.values():
             file_path = self._data_dir / filename
             if file_path.exists():
                 try:
@@ -102,7 +217,6 @@ class ReferenceDataManager:
                     continue
 
         if latest_time:
-            import time
             return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(latest_time))
 
         return None
@@ -118,7 +232,7 @@ class ReferenceDataManager:
         Returns:
             dict or None: Faction information if found
         """
-        factions = self.factions.get('factions', {})
+        factions = self._current()['factions'].get('factions', {})
         return factions.get(faction_id)
 
     def get_all_factions(self) -> List[str]:
@@ -128,7 +242,7 @@ class ReferenceDataManager:
         Returns:
             list: List of faction identifiers
         """
-        factions = self.factions.get('factions', {})
+        factions = self._current()['factions'].get('factions', {})
         return list(factions.keys())
 
     def get_faction_color(self, faction_id: str) -> str:
@@ -155,7 +269,7 @@ class ReferenceDataManager:
         Returns:
             dict or None: Object type information if found
         """
-        object_types = self.object_types.get('objectTypes', {})
+        object_types = self._current()['object_types'].get('objectTypes', {})
         return object_types.get(object_type)
 
     def get_all_object_types(self) -> List[str]:
@@ -165,7 +279,7 @@ class ReferenceDataManager:
         Returns:
             list: List of object type identifiers
         """
-        object_types = self.object_types.get('objectTypes', {})
+        object_types = self._current()['object_types'].get('objectTypes', {})
         return list(object_types.keys())
 
     def get_object_types_by_category(self, category: str) -> List[str]:
@@ -178,7 +292,7 @@ class ReferenceDataManager:
         Returns:
             list: List of object types in the category
         """
-        categories = self.object_types.get('categories', {})
+        categories = self._current()['object_types'].get('categories', {})
         return categories.get(category, [])
 
     # Planet class methods
@@ -192,7 +306,7 @@ class ReferenceDataManager:
         Returns:
             dict or None: Planet class information if found
         """
-        planet_classes = self.planet_classes.get('planetClasses', {})
+        planet_classes = self._current()['planet_classes'].get('planetClasses', {})
         return planet_classes.get(planet_class)
 
     def get_all_planet_classes(self) -> List[str]:
@@ -202,7 +316,7 @@ class ReferenceDataManager:
         Returns:
             list: List of planet class identifiers
         """
-        planet_classes = self.planet_classes.get('planetClasses', {})
+        planet_classes = self._current()['planet_classes'].get('planetClasses', {})
         return list(planet_classes.keys())
 
     def get_planet_class_params(self, planet_class: str) -> Optional[Dict[str, Any]]:
@@ -229,7 +343,7 @@ class ReferenceDataManager:
         Returns:
             dict or None: Diplomacy state information if found
         """
-        diplomacy_states = self.diplomacy_states.get('diplomacyStates', {})
+        diplomacy_states = self._current()['diplomacy_states'].get('diplomacyStates', {})
         return diplomacy_states.get(state)
 
     def get_all_diplomacy_states(self) -> List[str]:
@@ -239,7 +353,7 @@ class ReferenceDataManager:
         Returns:
             list: List of diplomacy state identifiers
         """
-        diplomacy_states = self.diplomacy_states.get('diplomacyStates', {})
+        diplomacy_states = self._current()['diplomacy_states'].get('diplomacyStates', {})
         return list(diplomacy_states.keys())
 
     def get_diplomacy_transitions(self, from_state: str) -> Optional[Dict[str, Any]]:
@@ -252,7 +366,7 @@ class ReferenceDataManager:
         Returns:
             dict or None: Transition information if found
         """
-        transitions = self.diplomacy_states.get('transitions', {})
+        transitions = self._current()['diplomacy_states'].get('transitions', {})
         return transitions.get(from_state)
 
     def can_transition_diplomacy(self, from_state: str, to_state: str) -> bool:
@@ -274,9 +388,15 @@ class ReferenceDataManager:
         return to_state in can_transition_to
 
     # Utility methods
-    def reload_data(self) -> None:
-        """Reload all reference data from files."""
-        self._load_all_data()
+    def reload_data(self) -> bool:
+        """
+        Reload all reference data from files.
+
+        Returns:
+            bool: True if reloaded; False if a file was broken and the
+                previous data set was kept
+        """
+        return self._load_files(list(REFERENCE_FILES))
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -285,19 +405,15 @@ class ReferenceDataManager:
         Returns:
             dict: Reference data statistics
         """
+        data = self._current()
         return {
-            'metadata': self.metadata,
-            'files_loaded': {
-                'factions': bool(self.factions),
-                'object_types': bool(self.object_types),
-                'planet_classes': bool(self.planet_classes),
-                'diplomacy_states': bool(self.diplomacy_states)
-            },
+            'metadata': data['metadata'],
+            'files_loaded': {key: bool(data[key]) for key in REFERENCE_FILES},
             'data_counts': {
-                'factions': len(self.factions.get('factions', {})),
-                'object_types': len(self.object_types.get('objectTypes', {})),
-                'planet_classes': len(self.planet_classes.get('planetClasses', {})),
-                'diplomacy_states': len(self.diplomacy_states.get('diplomacyStates', {}))
+                'factions': len(data['factions'].get('factions', {})),
+                'object_types': len(data['object_types'].get('objectTypes', {})),
+                'planet_classes': len(data['planet_classes'].get('planetClasses', {})),
+                'diplomacy_states': len(data['diplomacy_states'].get('diplomacyStates', {}))
             }
         }
 
@@ -309,28 +425,31 @@ class ReferenceDataManager:
             list: List of validation errors (empty if all valid)
         """
         errors = []
+        data = self._current()
+        factions_data = data['factions']
+        planet_classes_data = data['planet_classes']
 
         # Check that required data is loaded
-        if not self.factions:
+        if not factions_data:
             errors.append("Factions data not loaded")
-        if not self.object_types:
+        if not data['object_types']:
             errors.append("Object types data not loaded")
-        if not self.planet_classes:
+        if not planet_classes_data:
             errors.append("Planet classes data not loaded")
-        if not self.diplomacy_states:
+        if not data['diplomacy_states']:
             errors.append("Diplomacy states data not loaded")
 
         # Check for required faction references
-        if self.factions and 'factions' in self.factions:
-            factions = self.factions['factions']
+        if factions_data and 'factions' in factions_data:
+            factions = factions_data['factions']
             required_factions = ['friendly', 'neutral', 'enemy', 'unknown']
             for faction in required_factions:
                 if faction not in factions:
                     errors.append(f"Required faction '{faction}' not found")
 
         # Check for required planet classes
-        if self.planet_classes and 'planetClasses' in self.planet_classes:
-            planet_classes = self.planet_classes['planetClasses']
+        if planet_classes_data and 'planetClasses' in planet_classes_data:
+            planet_classes = planet_classes_data['planetClasses']
             required_classes = ['Class-M', 'Class-L', 'Class-H', 'Class-D', 'Class-J', 'Class-K', 'Class-N', 'Class-Y']
             for planet_class in required_classes:
                 if planet_class not in planet_classes:
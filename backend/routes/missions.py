@@ -5,18 +5,22 @@ Following docs/mission_spec.md section 3.3 API specifications
 """
 
 import logging
-from flask import Blueprint, jsonify, request, current_app
+from flask import Blueprint, Response, jsonify, request, current_app, stream_with_context
 from typing import Dict, List, Any, Optional
 
 from backend.mission_system import MissionManager, Mission, MissionState, Objective
+from backend.mission_system.query import DEFAULT_SORT_FIELD, QUERY_SORT_FIELDS
 from backend.mission_integration import MissionIntegration
 from backend.game_state import GameStateManager
 from backend.auth import require_admin_key
 from backend import limiter
-from backend.constants import RATE_LIMIT_STANDARD, RATE_LIMIT_ADMIN
+from backend.constants import (
+    MAX_MISSION_EVENT_BATCH, MISSION_STREAM_HEARTBEAT, MISSION_STREAM_POLL_TIMEOUT,
+    RATE_LIMIT_STANDARD, RATE_LIMIT_ADMIN
+)
 from backend.validation import (
     ValidationError, handle_validation_errors,
-    validate_mission_id, validate_string, validate_int, validate_dict,
+    validate_mission_id, validate_string, validate_int, validate_dict, validate_list,
     validate_enum, validate_float, validate_cargo_type, validate_enemy_type,
     validate_location, validate_entity_id, validate_quantity, validate_integrity,
     validate_cargo_value, TEMPLATE_ID_PATTERN
@@ -103,6 +107,28 @@ def list_response(items, total=None, page=None, per_page=None, **kwargs):
     response.update(kwargs)
     return jsonify(response)
 
+def query_mission_page(filters, page, per_page, predicate=None):
+    """
+    Fetch one page of missions for a list endpoint.
+
+    Reads the optional 'sort' and 'cursor' query parameters. With a cursor
+    the page continues after the previous one; otherwise page selects it.
+    """
+    sort_by = validate_enum(request.args.get('sort', DEFAULT_SORT_FIELD), 'sort', list(QUERY_SORT_FIELDS))
+    cursor = validate_string(request.args.get('cursor'), 'cursor', max_length=1000, required=False)
+    try:
+        return mission_manager.query_missions(
+            filters,
+            sort_by=sort_by,
+            limit=per_page,
+            cursor=cursor,
+            offset=0 if cursor else (page - 1) * per_page,
+            predicate=predicate
+        )
+    except ValueError as e:
+        raise ValidationError(str(e), 'cursor')
+
+
 # Global mission system instances (will be initialized in app factory)
 mission_manager: Optional[MissionManager] = None
 game_state_manager: Optional[GameStateManager] = None
@@ -170,6 +196,8 @@ def get_available_missions():
     - faction_standings: JSON object of faction standings (optional)
     - page: Page number (default: 1, max: 1000)
     - per_page: Items per page (default: 50, max: 100)
+    - sort: Sort field (default: created_at)
+    - cursor: next_cursor of the previous page (optional, replaces page)
     """
     try:
         location = request.args.get('location')
@@ -188,27 +216,32 @@ def get_available_missions():
                 logger.warning(f"Invalid faction_standings JSON: {e}")
                 return error_response('Invalid faction_standings JSON format', 400)
 
-        available_missions = mission_manager.get_available_missions(
-            location=location,
-            faction_standing=faction_standings
-        )
+        # Same criteria as MissionManager.get_available_missions, resolved
+        # through the mission indexes so only the requested page is built
+        filters = {
+            'state': [MissionState.UNKNOWN, MissionState.MENTIONED, MissionState.ACHIEVED],
+            'is_botched': False
+        }
+        if location:
+            filters['location'] = [location, 'any', 'unknown']
 
-        # Get total count before pagination
-        total = len(available_missions)
+        def meets_faction_standing(mission):
+            if faction_standings and mission.faction in faction_standings:
+                required_standing = mission.custom_fields.get('required_faction_standing', 0)
+                return faction_standings[mission.faction] >= required_standing
+            return True
 
-        # Apply pagination
-        start = (page - 1) * per_page
-        end = start + per_page
-        paginated_missions = available_missions[start:end]
+        result = query_mission_page(filters, page, per_page, predicate=meets_faction_standing)
 
         # Convert missions to dict format for JSON response
-        missions_data = [mission.to_dict() for mission in paginated_missions]
+        missions_data = [mission.to_dict() for mission in result['missions']]
 
         return list_response(
             missions_data,
-            total=total,
+            total=result['total'],
             page=page,
             per_page=per_page,
+            next_cursor=result['next_cursor'],
             location=location
         )
 
@@ -228,33 +261,29 @@ def get_active_missions():
     Query parameters:
     - page: Page number (default: 1, max: 1000)
     - per_page: Items per page (default: 50, max: 100)
+    - sort: Sort field (default: created_at)
+    - cursor: next_cursor of the previous page (optional, replaces page)
     """
     try:
         # Pagination parameters with validation
         page = validate_int(request.args.get('page', 1), 'page', min_val=1, max_val=1000)
         per_page = validate_int(request.args.get('per_page', 50), 'per_page', min_val=1, max_val=100)
 
-        # Get player context from request if needed
-        player_context = {}
-
-        active_missions = mission_manager.get_active_missions(player_context)
-
-        # Get total count before pagination
-        total = len(active_missions)
-
-        # Apply pagination
-        start = (page - 1) * per_page
-        end = start + per_page
-        paginated_missions = active_missions[start:end]
+        # Same criteria as MissionManager.get_active_missions
+        result = query_mission_page(
+            {'state': [MissionState.ACCEPTED, MissionState.ACHIEVED], 'is_botched': False},
+            page, per_page
+        )
 
         # Convert missions to dict format for JSON response
-        missions_data = [mission.to_dict() for mission in paginated_missions]
+        missions_data = [mission.to_dict() for mission in result['missions']]
 
         return list_response(
             missions_data,
-            total=total,
+            total=result['total'],
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            next_cursor=result['next_cursor']
         )
 
     except ValidationError as e:
@@ -334,8 +363,8 @@ def accept_mission_legacy(mission_id: str):
         if success:
             mission = mission_manager.get_mission(mission_id)
 
-            # Fire triggers and get response hooks
-            hooks = mission_manager.trigger_system.fire_trigger(
+            # Response hooks of the acceptance the manager already fired
+            hooks = mission_manager.trigger_system.collect_hooks(
                 'mission_accepted', mission, player_context
             )
 
@@ -372,9 +401,9 @@ def update_mission_progress(mission_id: str):
         )
 
         if updated_mission:
-            # Fire appropriate triggers
+            # Response hooks of the triggers the manager already fired
             if objective_id:
-                hooks = mission_manager.trigger_system.fire_trigger(
+                hooks = mission_manager.trigger_system.collect_hooks(
                     'objective_completed', updated_mission, {
                         'objective_id': objective_id,
                         'event_data': event_data
@@ -385,7 +414,7 @@ def update_mission_progress(mission_id: str):
 
             # Check if mission was completed
             if updated_mission.state == MissionState.COMPLETED:
-                completion_hooks = mission_manager.trigger_system.fire_trigger(
+                completion_hooks = mission_manager.trigger_system.collect_hooks(
                     'mission_completed', updated_mission, event_data
                 )
                 hooks.extend(completion_hooks)
@@ -422,8 +451,8 @@ def botch_mission(mission_id: str):
         if success:
             mission = mission_manager.get_mission(mission_id)
 
-            # Fire botch triggers
-            hooks = mission_manager.trigger_system.fire_trigger(
+            # Response hooks of the botch the manager already fired
+            hooks = mission_manager.trigger_system.collect_hooks(
                 'mission_botched', mission, {
                     'reason': reason,
                     'context': context
@@ -443,6 +472,26 @@ def botch_mission(mission_id: str):
         return error_response('Internal server error', 500)
 
 
+@missions_bp.route('/api/missions/<mission_id>/botch/preview', methods=['GET'])
+@limiter.limit(RATE_LIMIT_STANDARD)
+@require_mission_manager
+def preview_botch_mission(mission_id: str):
+    """
+    Dry run of botching a mission
+    Returns every mission its cascade would botch and every effect it would apply
+    """
+    try:
+        if not mission_manager.get_mission(mission_id):
+            return error_response(f'Mission not found: {mission_id}', 404)
+
+        impact = mission_manager.cascade_handler.preview_botch(mission_id)
+        return success_response(**impact)
+
+    except (TypeError, KeyError, AttributeError) as e:
+        logger.error(f"❌ Preview botch failed: {e}")
+        return error_response('Internal server error', 500)
+
+
 @missions_bp.route('/api/missions/<mission_id>/unbotch', methods=['POST'])
 @limiter.limit(RATE_LIMIT_STANDARD)
 @require_mission_manager
@@ -618,6 +667,68 @@ def get_mission_stats():
 
 # Game Event Endpoints (for mission progress integration)
 
+def validate_enemy_destroyed_event(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Mission event payload of an enemy_destroyed request"""
+    return {
+        'type': 'enemy_destroyed',
+        'enemy_type': validate_enemy_type(data.get('enemy_type'), required=True),
+        'enemy_id': validate_entity_id(data.get('enemy_id'), 'enemy_id', required=False),
+        'location': validate_location(data.get('location'), required=False)
+    }
+
+
+def validate_location_reached_event(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Mission event payload of a location_reached request"""
+    return {
+        'type': 'location_reached',
+        'location': validate_location(data.get('location'), required=True),
+        'coordinates': validate_dict(data.get('coordinates'), 'coordinates', required=False) or {}
+    }
+
+
+def validate_cargo_delivered_event(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Mission event payload of a cargo_delivered request"""
+    delivery_location = validate_location(data.get('delivery_location'), required=True)
+    return {
+        'type': 'cargo_delivered',
+        'cargo_type': validate_cargo_type(data.get('cargo_type'), required=True),
+        'delivery_location': delivery_location,
+        'location': delivery_location,
+        'quantity': validate_quantity(data.get('quantity'), required=False) or 0,
+        'integrity': validate_integrity(data.get('integrity'), required=False) or 1.0,
+        'source': validate_string(data.get('source'), 'source', max_length=100, required=False) or 'unknown',
+        'cargo_value': validate_cargo_value(data.get('cargo_value'), required=False) or 0
+    }
+
+
+def validate_cargo_loaded_event(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Mission event payload of a cargo_loaded request"""
+    return {
+        'type': 'cargo_loaded',
+        'cargo_type': validate_cargo_type(data.get('cargo_type'), required=True),
+        'quantity': validate_quantity(data.get('quantity'), required=False) or 0,
+        'location': validate_location(data.get('location'), required=False)
+    }
+
+
+GAME_EVENT_VALIDATORS = {
+    'enemy_destroyed': validate_enemy_destroyed_event,
+    'location_reached': validate_location_reached_event,
+    'cargo_delivered': validate_cargo_delivered_event,
+    'cargo_loaded': validate_cargo_loaded_event
+}
+
+
+def validate_game_event(value: Any, field_name: str) -> Dict[str, Any]:
+    """Validate one entry of an event batch; errors name the entry, e.g. events[2].cargo_type"""
+    event = validate_dict(value, field_name)
+    event_type = validate_enum(event.get('type'), f"{field_name}.type", list(GAME_EVENT_VALIDATORS))
+    try:
+        return GAME_EVENT_VALIDATORS[event_type](event)
+    except ValidationError as e:
+        raise ValidationError(e.message, f"{field_name}.{e.field}")
+
+
 @missions_bp.route('/api/missions/events/enemy_destroyed', methods=['POST'])
 @limiter.limit(RATE_LIMIT_STANDARD)
 @require_mission_manager
@@ -629,30 +740,11 @@ def handle_enemy_destroyed():
         data = request.get_json() or {}
 
         # Validate all input parameters
-        enemy_type = validate_enemy_type(data.get('enemy_type'), required=True)
-        enemy_id = validate_entity_id(data.get('enemy_id'), 'enemy_id', required=False)
-        location = validate_location(data.get('location'), required=False)
+        event = validate_enemy_destroyed_event(data)
         player_context = validate_dict(data.get('player_context'), 'player_context', required=False) or {}
         
-        # Check active elimination missions (O(1) lookup via index)
-        updated_missions = []
-
-        for mission in mission_manager.get_active_missions_by_type('elimination'):
-            # Check if this enemy type matches mission requirements
-            target_enemy = mission.custom_fields.get('target_enemy_type')
-            if enemy_type == target_enemy:
-                updated_mission = mission_manager.update_mission_progress(
-                    mission.id,
-                    event_data={
-                        'type': 'enemy_destroyed',
-                        'enemy_type': enemy_type,
-                        'enemy_id': enemy_id,
-                        'location': location
-                    }
-                )
-
-                if updated_mission:
-                    updated_missions.append(updated_mission.to_dict())
+        # Only accepted elimination missions targeting this enemy type are subscribed
+        updated_missions = [mission.to_dict() for mission in mission_manager.process_game_event(event)]
         
         return success_response(updated_missions=updated_missions, count=len(updated_missions))
 
@@ -674,34 +766,11 @@ def handle_location_reached():
         data = request.get_json() or {}
 
         # Validate all input parameters
-        location = validate_location(data.get('location'), required=True)
-        coordinates = validate_dict(data.get('coordinates'), 'coordinates', required=False) or {}
+        event = validate_location_reached_event(data)
         player_context = validate_dict(data.get('player_context'), 'player_context', required=False) or {}
         
-        # Check active exploration and reconnaissance missions (O(1) lookup via index)
-        updated_missions = []
-
-        # Query both mission types
-        active_missions = (
-            mission_manager.get_active_missions_by_type('exploration') +
-            mission_manager.get_active_missions_by_type('reconnaissance')
-        )
-
-        for mission in active_missions:
-            # Check if this location matches mission requirements
-            target_location = mission.custom_fields.get('target_location')
-            if location == target_location:
-                updated_mission = mission_manager.update_mission_progress(
-                    mission.id,
-                    event_data={
-                        'type': 'location_reached',
-                        'location': location,
-                        'coordinates': coordinates
-                    }
-                )
-
-                if updated_mission:
-                    updated_missions.append(updated_mission.to_dict())
+        # Only accepted exploration and reconnaissance missions targeting this location are subscribed
+        updated_missions = [mission.to_dict() for mission in mission_manager.process_game_event(event)]
 
         return success_response(updated_missions=updated_missions, count=len(updated_missions))
 
@@ -723,50 +792,14 @@ def handle_cargo_delivered():
         data = request.get_json() or {}
 
         # Validate all input parameters
-        cargo_type = validate_cargo_type(data.get('cargo_type'), required=True)
-        delivery_location = validate_location(data.get('delivery_location'), required=True)
-        cargo_value = validate_cargo_value(data.get('cargo_value'), required=False) or 0
-        quantity = validate_quantity(data.get('quantity'), required=False) or 0
-        integrity = validate_integrity(data.get('integrity'), required=False) or 1.0
-        source = validate_string(data.get('source'), 'source', max_length=100, required=False) or 'unknown'
+        event = validate_cargo_delivered_event(data)
         destination_station = validate_string(data.get('destination_station'), 'destination_station', max_length=100, required=False)
         mission_id = validate_mission_id(data.get('mission_id')) if data.get('mission_id') else None
         player_context = validate_dict(data.get('player_context'), 'player_context', required=False) or {}
         
-        # Check active delivery missions (O(1) lookup via index)
-        # Include both ACCEPTED and ACHIEVED states for delivery tracking
-        updated_missions = []
-
-        active_delivery_missions = mission_manager.get_missions_by_type_and_states(
-            'delivery', [MissionState.ACCEPTED, MissionState.ACHIEVED]
-        )
-
-        for mission in active_delivery_missions:
-            # Check if cargo and location match mission requirements
-            target_cargo = mission.custom_fields.get('cargo_type')
-            target_location = mission.custom_fields.get('destination')  # Use 'destination' not 'delivery_location'
-
-            logger.info(f"🚛 Checking mission {mission.id}: cargo={target_cargo}, destination={target_location}")
-            logger.info(f"🚛 Event: cargo={cargo_type}, delivery_location={delivery_location}, source={source}")
-            logger.info(f"🚛 Mission delivery_type: {mission.custom_fields.get('delivery_type', 'auto_delivery')}")
-
-            if cargo_type == target_cargo and delivery_location == target_location:
-                updated_mission = mission_manager.update_mission_progress(
-                    mission.id,
-                    event_data={
-                        'type': 'cargo_delivered',
-                        'cargo_type': cargo_type,
-                        'delivery_location': delivery_location,
-                        'location': delivery_location,
-                        'quantity': quantity,
-                        'integrity': integrity,
-                        'source': source,
-                        'cargo_value': cargo_value
-                    }
-                )
-
-                if updated_mission:
-                    updated_missions.append(updated_mission.to_dict())
+        # Accepted and achieved delivery missions for this cargo and destination are subscribed
+        logger.info(f"🚛 Event: cargo={event['cargo_type']}, delivery_location={event['delivery_location']}, source={event['source']}")
+        updated_missions = [mission.to_dict() for mission in mission_manager.process_game_event(event)]
 
         return success_response(updated_missions=updated_missions, count=len(updated_missions))
 
@@ -788,34 +821,14 @@ def handle_cargo_loaded():
         data = request.get_json() or {}
 
         # Validate all input parameters
-        cargo_type = validate_cargo_type(data.get('cargo_type'), required=True)
-        quantity = validate_quantity(data.get('quantity'), required=False) or 0
-        location = validate_location(data.get('location'), required=False)
+        event = validate_cargo_loaded_event(data)
         cargo_id = validate_entity_id(data.get('cargo_id'), 'cargo_id', required=False)
         player_context = validate_dict(data.get('player_context'), 'player_context', required=False) or {}
         
-        logger.info(f"🚛 Cargo loaded event: cargo={cargo_type}, quantity={quantity}, location={location}")
-
-        # Check active delivery missions (O(1) lookup via index)
-        updated_missions = []
-
-        for mission in mission_manager.get_active_missions_by_type('delivery'):
-            logger.info(f"🚛 Checking delivery mission {mission.id}: {mission.title}")
-            target_cargo = mission.custom_fields.get('cargo_type')
-            logger.info(f"🚛 Mission expects cargo: {target_cargo}, event has: {cargo_type}")
-
-            updated_mission = mission_manager.update_mission_progress(
-                mission.id,
-                event_data={
-                    'type': 'cargo_loaded',
-                    'cargo_type': cargo_type,
-                    'quantity': quantity,
-                    'location': location
-                }
-            )
+        logger.info(f"🚛 Cargo loaded event: cargo={event['cargo_type']}, quantity={event['quantity']}, location={event['location']}")
 
-            if updated_mission:
-                updated_missions.append(updated_mission.to_dict())
+        # Only accepted delivery missions for this cargo type are subscribed
+        updated_missions = [mission.to_dict() for mission in mission_manager.process_game_event(event)]
 
         return success_response(updated_missions=updated_missions, count=len(updated_missions))
 
@@ -826,6 +839,147 @@ def handle_cargo_loaded():
         return error_response('Internal server error', 500)
 
 
+@missions_bp.route('/api/missions/events/batch', methods=['POST'])
+@limiter.limit(RATE_LIMIT_STANDARD)
+@require_mission_manager
+@handle_validation_errors
+def handle_event_batch():
+    """
+    Handle an ordered batch of game events in one request
+    
+    Body: {'events': [{'type': 'enemy_destroyed', ...}, {'type': 'cargo_loaded', ...}]}
+    with each event taking the fields of its single-event endpoint. Events
+    are applied in order and each mission is saved once for the batch.
+    """
+
+    try:
+        data = request.get_json() or {}
+
+        events = validate_list(data.get('events'), 'events', max_length=MAX_MISSION_EVENT_BATCH,
+                               item_validator=validate_game_event)
+        player_context = validate_dict(data.get('player_context'), 'player_context', required=False) or {}
+
+        results = mission_manager.process_game_events(events)
+
+        # Serialize each updated mission once, however many events touched it
+        missions = {
+            mission.id: mission for result in results for mission in result['updated_missions']
+        }
+        return success_response(
+            results=[
+                {
+                    'type': result['type'],
+                    'updated_missions': [mission.id for mission in result['updated_missions']],
+                    'hooks': result['hooks']
+                }
+                for result in results
+            ],
+            missions={mission_id: mission.to_dict() for mission_id, mission in missions.items()},
+            count=len(results)
+        )
+
+    except ValidationError:
+        raise
+    except (TypeError, KeyError, AttributeError) as e:
+        logger.error(f"❌ Handle event batch failed: {e}")
+        return error_response('Internal server error', 500)
+
+
+# Mission Event Stream (pushes fired triggers instead of clients polling missions)
+
+def _stream_cursor(value: Any) -> int:
+    """Last event ID a client has seen; without one it only receives new events"""
+    last_id = validate_int(value, 'last_event_id', min_val=0, required=False)
+    return mission_manager.event_stream.last_event_id if last_id is None else last_id
+
+
+@missions_bp.route('/api/missions/stream', methods=['GET'])
+@limiter.limit(RATE_LIMIT_STANDARD)
+@require_mission_manager
+@handle_validation_errors
+def stream_mission_events():
+    """
+    Server-Sent Events stream of mission state changes, objective progress and trigger hooks
+    Reconnecting clients resume from the Last-Event-ID header (or last_event_id query arg)
+
+    Each open stream holds a server thread, so only MISSION_STREAM_MAX_CLIENTS
+    streams are served per process; further clients get 503 and should use
+    /api/missions/stream/poll. Events are buffered per process: a client only
+    sees events raised in the worker process serving it.
+    """
+    last_id = _stream_cursor(request.headers.get('Last-Event-ID') or request.args.get('last_event_id'))
+    mission_id = request.args.get('mission_id')
+    if mission_id is not None:
+        mission_id = validate_mission_id(mission_id)
+    stream = mission_manager.event_stream
+
+    if not stream.open_client():
+        response = jsonify({
+            'status': 'error',
+            'message': 'Too many open mission streams, use long polling',
+            'fallback': '/api/missions/stream/poll'
+        })
+        response.headers['Retry-After'] = str(int(MISSION_STREAM_POLL_TIMEOUT))
+        return response, 503
+
+    released = []
+
+    def release():
+        # Runs from the generator and from response close, whichever comes first
+        if not released:
+            released.append(True)
+            stream.close_client()
+
+    def generate():
+        try:
+            cursor = last_id
+            yield ': connected\n\n'
+            while not stream.closed:
+                events, reset, new_cursor = stream.events_after(cursor, MISSION_STREAM_HEARTBEAT, mission_id)
+                if reset:
+                    # Events were missed: the client should reload mission state
+                    reset_id = events[0].id - 1 if events else new_cursor
+                    yield f"id: {reset_id}\nevent: reset\ndata: {{}}\n\n"
+                if events:
+                    yield ''.join(event.to_sse() for event in events)
+                elif new_cursor == cursor:
+                    yield ': keepalive\n\n'
+                cursor = new_cursor
+        finally:
+            release()
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    # Releases the slot even if the client disconnects before the body is iterated
+    response.call_on_close(release)
+    return response
+
+
+@missions_bp.route('/api/missions/stream/poll', methods=['GET'])
+@limiter.limit(RATE_LIMIT_STANDARD)
+@require_mission_manager
+@handle_validation_errors
+def poll_mission_events():
+    """
+    Long-poll fallback of the mission event stream
+    Waits up to `timeout` seconds for events after `since`; pass the returned
+    last_event_id as `since` on the next request
+    """
+    last_id = _stream_cursor(request.args.get('since'))
+    timeout = validate_float(request.args.get('timeout', MISSION_STREAM_POLL_TIMEOUT), 'timeout',
+                             min_val=0, max_val=MISSION_STREAM_POLL_TIMEOUT)
+    mission_id = request.args.get('mission_id')
+    if mission_id is not None:
+        mission_id = validate_mission_id(mission_id)
+
+    events, reset, new_last_id = mission_manager.event_stream.events_after(last_id, timeout, mission_id)
+
+    # Event payloads are already JSON encoded; splice them in rather than re-encoding
+    body = (f'{{"status":"success","events":[{",".join(event.to_json() for event in events)}],'
+            f'"last_event_id":{new_last_id},"reset":{"true" if reset else "false"}}}')
+    return Response(body, mimetype='application/json')
+
+
 # Admin/Debug Endpoints
 
 @missions_bp.route('/api/missions/admin/cleanup', methods=['POST'])
@@ -0,0 +1,93 @@
+"""Star Charts API routes."""
+from flask import Blueprint, jsonify, request
+from pathlib import Path
+import logging
+import math
+import re
+from backend import limiter
+from backend.constants import RATE_LIMIT_STANDARD, STAR_CHARTS_MAX_PAGE_SIZE
+from backend.star_charts_adapter import StarChartsAdapter
+from backend.validation import (
+    ValidationError, handle_validation_errors,
+    validate_float, validate_int, validate_string, validate_sector_id,
+    MAX_COORDINATE, MIN_COORDINATE
+)
+
+logger = logging.getLogger(__name__)
+star_charts_bp = Blueprint('star_charts', __name__)
+
+# Shared adapter; data is loaded on first request and reloaded when the files change
+star_charts_adapter = StarChartsAdapter(
+    str(Path(__file__).parent.parent.parent / 'data' / 'star_charts' / 'objects.json')
+)
+
+FIELD_NAME_PATTERN = re.compile(r'^[a-zA-Z_]{1,30}$')
+MAX_FIELDS = 20
+BBOX_PARAMS = ('min_x', 'min_z', 'max_x', 'max_z')
+RADIUS_PARAMS = ('x', 'z', 'radius')
+
+
+def _validate_coordinate(name, min_val=MIN_COORDINATE, max_val=MAX_COORDINATE):
+    value = validate_float(request.args.get(name), name, min_val=min_val, max_val=max_val)
+    if math.isnan(value):
+        raise ValidationError(f"{name} must be a number", name)
+    return value
+
+
+def _validate_fields(fields_param):
+    """Validate a comma-separated list of object field names."""
+    if fields_param is None:
+        return None
+    fields = [field.strip() for field in fields_param.split(',') if field.strip()]
+    if len(fields) > MAX_FIELDS:
+        raise ValidationError(f"fields exceeds maximum of {MAX_FIELDS} entries", 'fields')
+    return [validate_string(field, 'fields', max_length=30, pattern=FIELD_NAME_PATTERN) for field in fields]
+
+
+@star_charts_bp.route('/api/star-charts/sectors/<sector_id>/objects', methods=['GET'])
+@limiter.limit(RATE_LIMIT_STANDARD)
+@handle_validation_errors
+def get_sector_objects_in_area(sector_id):
+    """
+    Get the objects of a sector inside a map area.
+
+    Query parameters:
+        min_x, min_z, max_x, max_z: Bounding box in map coordinates, or
+        x, z, radius: Circle in map coordinates (results nearest first)
+        fields: Comma-separated object fields to return (default: map fields)
+        offset: Number of matches to skip (default 0)
+        limit: Page size (default and maximum STAR_CHARTS_MAX_PAGE_SIZE)
+    """
+    try:
+        sector = validate_sector_id(sector_id)
+        fields = _validate_fields(request.args.get('fields'))
+        offset = validate_int(request.args.get('offset', 0), 'offset', min_val=0)
+        limit = validate_int(request.args.get('limit', STAR_CHARTS_MAX_PAGE_SIZE), 'limit',
+                             min_val=1, max_val=STAR_CHARTS_MAX_PAGE_SIZE)
+
+        if all(name in request.args for name in BBOX_PARAMS):
+            min_x, min_z, max_x, max_z = (_validate_coordinate(name) for name in BBOX_PARAMS)
+            if min_x > max_x or min_z > max_z:
+                raise ValidationError("Bounding box minimum must not exceed maximum", 'bbox')
+            page = star_charts_adapter.get_objects_in_bbox(
+                sector, min_x, min_z, max_x, max_z, fields=fields, offset=offset, limit=limit
+            )
+        elif all(name in request.args for name in RADIUS_PARAMS):
+            x, z = _validate_coordinate('x'), _validate_coordinate('z')
+            radius = _validate_coordinate('radius', min_val=0, max_val=MAX_COORDINATE - MIN_COORDINATE)
+            page = star_charts_adapter.get_objects_in_radius(
+                sector, x, z, radius, fields=fields, offset=offset, limit=limit
+            )
+        else:
+            raise ValidationError("Provide min_x, min_z, max_x, max_z or x, z, radius", 'area')
+
+        if page is None:
+            return jsonify({'error': f'Sector {sector} not found'}), 404
+
+        return jsonify({'status': 'success', 'sector': sector, **page})
+
+    except ValidationError:
+        raise
+    except (TypeError, ValueError, KeyError) as e:
+        logger.error(f"Error querying star charts area: {e}")
+        return jsonify({'error': 'Failed to query star charts'}), 500
@@ -0,0 +1,68 @@
+"""Routes serving precompressed, content-hashed static datasets."""
+from flask import Blueprint, jsonify, request, send_from_directory, url_for
+from werkzeug.exceptions import NotFound
+import logging
+from backend.constants import STATIC_DATA_MAX_AGE
+from backend.static_data import ENCODING_SUFFIXES, StaticDataManifest, select_encoding
+
+logger = logging.getLogger(__name__)
+static_data_bp = Blueprint('static_data', __name__)
+
+static_data_manifest = StaticDataManifest()
+
+
+@static_data_bp.route('/api/static-data/manifest', methods=['GET'])
+def get_static_data_manifest():
+    """Map logical dataset names to their current content-hashed URLs."""
+    datasets = {
+        name: {
+            'url': url_for('static_data.serve_static_data', filename=entry['file']),
+            'hash': entry['hash'],
+            'size': entry['size']
+        }
+        for name, entry in static_data_manifest.entries().items()
+    }
+    response = jsonify({'status': 'success', 'datasets': datasets})
+    # The manifest itself must be revalidated so new versions are seen
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+@static_data_bp.route('/static-data/<filename>', methods=['GET'])
+def serve_static_data(filename):
+    """Serve a hashed dataset file, precompressed when the client accepts it."""
+    entry = static_data_manifest.find_file(filename)
+    if entry is None:
+        return jsonify({'error': 'Not found'}), 404
+
+    if entry['hash'] in request.if_none_match:
+        return '', 304, _cache_headers(entry)
+
+    encoding = select_encoding(request.headers.get('Accept-Encoding'), list(entry['encodings']))
+    stored_name = filename + ENCODING_SUFFIXES[encoding] if encoding else filename
+
+    try:
+        response = send_from_directory(
+            static_data_manifest.build_dir,
+            stored_name,
+            mimetype='application/json',
+            etag=False,
+            conditional=False
+        )
+    except (FileNotFoundError, NotFound):
+        logger.warning(f"Static data file missing from build directory: {stored_name}")
+        return jsonify({'error': 'Not found'}), 404
+
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers.update(_cache_headers(entry))
+    return response
+
+
+def _cache_headers(entry):
+    """Headers marking a hashed dataset file as cacheable forever."""
+    return {
+        'Vary': 'Accept-Encoding',
+        'ETag': f'"{entry["hash"]}"',
+        'Cache-Control': f'public, max-age={STATIC_DATA_MAX_AGE}, immutable'
+    }
@@ -8,6 +8,9 @@ Star Charts discovery and navigation system.
 
 Key Features:
 - Loads and caches existing Star Charts database
+- Reads the compact binary or sharded layout when available, decoding
+  sectors lazily
+- Picks up regenerated data files without a restart
 - Provides unified interface for object lookup
 - Maintains compatibility with current Star Charts format
 - Enables incremental migration path
@@ -15,52 +18,286 @@ Key Features:
 
 import json
 import logging
-import os
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
+
+from backend.constants import (
+    STAR_CHARTS_SECTOR_CACHE_SIZE, STAR_CHARTS_RELOAD_INTERVAL, STAR_CHARTS_RETIRED_SNAPSHOT_TTL
+)
+from backend.file_monitor import ChangeMonitor, file_signature
+from backend.star_charts_binary import BinaryStarChartsSource, binary_path_for
+from backend.star_charts_search import StarChartsSearchIndex
+from backend.star_charts_spatial import MAP_FIELDS, project
+from backend.star_charts_storage import (
+    JsonStarChartsSource, ShardedStarChartsSource, SectorIndex, file_sha256, sharded_path_for
+)
 
 logger = logging.getLogger(__name__)
 
 
+class StarChartsSnapshot:
+    """
+    One loaded version of the Star Charts database and its caches.
+
+    A snapshot never changes the data it serves. Reloading builds a new
+    snapshot and swaps it in, so a caller holding a snapshot keeps reading a
+    consistent version for the rest of its request.
+    """
+
+    def __init__(self, source, path: str, signature, cache_size: int,
+                 previous: Optional['StarChartsSnapshot'] = None):
+        """
+        Initialize the snapshot.
+
+        Args:
+            source: JsonStarChartsSource, ShardedStarChartsSource or BinaryStarChartsSource
+            path (str): File the source was read from
+            signature: file_signature() of path when it was read
+            cache_size (int): Maximum number of decoded sectors to keep
+            previous (StarChartsSnapshot, optional): Snapshot being replaced;
+                its decoded sectors are reused where the sector digest is unchanged
+        """
+        self.source = source
+        self.path = path
+        self.signature = signature
+        self._cache_size = cache_size
+        self._cache: 'OrderedDict[str, SectorIndex]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._search_index: Optional[StarChartsSearchIndex] = None
+
+        if previous is not None:
+            self._adopt_unchanged_sectors(previous)
+
+    @property
+    def cached_sectors(self) -> int:
+        return len(self._cache)
+
+    def sector_index(self, sector: str) -> Optional[SectorIndex]:
+        """
+        Get the lookup index of a sector, decoding it on a cache miss.
+
+        Args:
+            sector (str): Sector identifier
+
+        Returns:
+            SectorIndex or None: Index if the sector exists
+        """
+        with self._lock:
+            index = self._cache.get(sector)
+            if index is not None:
+                self._cache.move_to_end(sector)
+                return index
+
+        try:
+            index = self.source.load_sector(sector)
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            logger.error(f"Error loading Star Charts sector {sector}: {e}")
+            return None
+        if index is None:
+            return None
+
+        with self._lock:
+            self._cache[sector] = index
+            self._cache.move_to_end(sector)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return index
+
+    def search_index(self) -> StarChartsSearchIndex:
+        """Get the search index, building it from the source catalog on first use."""
+        search_index = self._search_index
+        if search_index is None:
+            search_index = StarChartsSearchIndex()
+            for sector_id, object_id, name, object_type, object_class in self.source.catalog():
+                search_index.add(sector_id, object_id, name, object_type, object_class)
+            self._search_index = search_index
+        return search_index
+
+    def duplicate_ids(self) -> Dict[str, int]:
+        """Merge the per-sector duplicate ID counts from the source summaries."""
+        duplicates = {}
+        for sector_id in self.source.sector_ids():
+            duplicates.update(self.source.summary(sector_id).get('duplicates', {}))
+        return duplicates
+
+    def close(self) -> None:
+        """Release the source's open file, if it keeps one."""
+        close = getattr(self.source, 'close', None)
+        if close is not None:
+            close()
+
+    def _adopt_unchanged_sectors(self, previous: 'StarChartsSnapshot') -> None:
+        """Carry over decoded sectors whose content digest did not change."""
+        with previous._lock:
+            candidates = list(previous._cache.items())
+
+        for sector_id, index in candidates:
+            old_summary = previous.source.summary(sector_id) or {}
+            new_summary = self.source.summary(sector_id) or {}
+            digest = new_summary.get('digest')
+            if digest and digest == old_summary.get('digest'):
+                self._cache[sector_id] = index
+
+
 class StarChartsAdapter:
     """
     Adapter for existing star_charts/objects.json database.
 
     This class provides a clean interface to the existing Star Charts system
     while preparing for integration with the unified ObjectDatabase.
+
+    The first available layout next to objects.json that was written from
+    the current objects.json is used:
+
+    - objects.bin: columnar binary; opened with one read, sectors are
+      rebuilt from the columns on first access
+    - objects.shards.jsonl: only its header is read at load time and sectors
+      are decoded on first access
+    - objects.json: decoded up front
+
+    Decoded sectors are kept in a bounded LRU cache.
+
+    The data file is checked for changes (inode, mtime, size) at most once
+    every reload_interval seconds; a changed file is loaded into a new
+    snapshot which then replaces the current one. A replaced snapshot may
+    still serve requests that fetched it earlier, so it is closed (releasing
+    the sharded file handle) retired_ttl seconds after its replacement.
     """
 
-    def __init__(self):
-        """Initialize the StarChartsAdapter."""
-        self.star_charts_data = None
-        self._data_loaded = False
-        self._file_path = 'data/star_charts/objects.json'
+    def __init__(self, file_path: Optional[str] = None, sharded_path: Optional[str] = None,
+                 binary_path: Optional[str] = None, cache_size: int = STAR_CHARTS_SECTOR_CACHE_SIZE,
+                 reload_interval: Optional[float] = STAR_CHARTS_RELOAD_INTERVAL,
+                 retired_ttl: float = STAR_CHARTS_RETIRED_SNAPSHOT_TTL):
+        """
+        Initialize the StarChartsAdapter.
+
+        Args:
+            file_path (str, optional): Path to objects.json, defaults to the
+                repository database relative to the working directory
+            sharded_path (str, optional): Path to the sharded database,
+                defaults to objects.shards.jsonl next to file_path
+            binary_path (str, optional): Path to the binary database,
+                defaults to objects.bin next to file_path
+            cache_size (int): Maximum number of decoded sectors kept in memory
+            reload_interval (float, optional): Minimum seconds between file
+                change checks, or None to disable automatic reloads
+            retired_ttl (float): Seconds a replaced snapshot stays open
+        """
+        self._file_path = file_path or 'data/star_charts/objects.json'
+        self._sharded_path = sharded_path or sharded_path_for(self._file_path)
+        self._binary_path = binary_path or binary_path_for(self._file_path)
+        self._cache_size = max(1, cache_size)
+
+        self._snapshot: Optional[StarChartsSnapshot] = None
+        self._monitor = ChangeMonitor(reload_interval)
+        self._failed_signature = None
+        self._retired_ttl = retired_ttl
+        # (monotonic retirement time, snapshot) of replaced snapshots not yet closed
+        self._retired: List[Tuple[float, StarChartsSnapshot]] = []
+        self._retired_lock = threading.Lock()
+        # Path -> (file_signature, content hash) of objects.json and the
+        # source hashes recorded in the derived files, rehashed on change
+        self._hashes: Dict[str, tuple] = {}
+        # (derived path, its source hash, objects.json hash) already warned about as stale
+        self._stale_warned = set()
+
+    @property
+    def _data_loaded(self) -> bool:
+        return self._snapshot is not None
 
     def load_star_charts_data(self) -> bool:
         """
-        Load existing Star Charts database from JSON file.
+        Load existing Star Charts database.
+
+        Prefers the binary layout, then the sharded layout, and falls back to
+        objects.json (see _select_source). On failure
+        the previously loaded snapshot, if any, stays in service.
 
         Returns:
             bool: True if data loaded successfully, False otherwise
         """
-        try:
-            if not os.path.exists(self._file_path):
-                logger.warning(f"Star Charts file not found: {self._file_path}")
-                return False
-
-            with open(self._file_path, 'r', encoding='utf-8') as f:
-                self.star_charts_data = json.load(f)
+        path, source_class = self._select_source()
+        if path is None:
+            logger.warning(f"Star Charts file not found: {self._file_path}")
+            return False
 
-            self._data_loaded = True
-            logger.info(f"Loaded Star Charts database: {self.star_charts_data.get('metadata', {}).get('total_sectors', 'unknown')} sectors")
-            return True
+        signature = file_signature(path)
+        try:
+            source = source_class(path)
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing Star Charts JSON: {e}")
+        except (json.JSONDecodeError, ValueError, KeyError) as e:
+            logger.error(f"Error parsing Star Charts data: {e}")
+            self._failed_signature = (path, signature)
             return False
         except (IOError, OSError) as e:
             logger.error(f"Error loading Star Charts data: {e}")
             return False
 
+        previous = self._snapshot
+        snapshot = StarChartsSnapshot(source, path, signature, self._cache_size, previous=previous)
+        self._snapshot = snapshot
+        self._failed_signature = None
+        if previous is not None:
+            self._retire(previous)
+
+        duplicate_ids = snapshot.duplicate_ids()
+        if duplicate_ids:
+            logger.warning(
+                f"Star Charts database contains {len(duplicate_ids)} duplicate object IDs "
+                f"(first occurrence wins): {', '.join(sorted(duplicate_ids)[:10])}"
+            )
+
+        logger.info(f"Loaded Star Charts database ({source.storage}): {source.metadata.get('total_sectors', 'unknown')} sectors")
+        return True
+
+    def get_snapshot(self) -> Optional[StarChartsSnapshot]:
+        """
+        Get the current database snapshot, loading or reloading it if needed.
+
+        Callers that make several queries for one request can hold on to the
+        snapshot to read a single consistent version.
+
+        Returns:
+            StarChartsSnapshot or None: Current snapshot, None if no data
+        """
+        if not self._ensure_data_loaded():
+            return None
+        if self._monitor.due():
+            self.check_for_changes()
+        return self._snapshot
+
+    def check_for_changes(self) -> bool:
+        """
+        Reload the database if its file changed since it was loaded.
+
+        Only one thread reloads at a time; others keep using the current
+        snapshot meanwhile.
+
+        Returns:
+            bool: True if a new snapshot was loaded
+        """
+        if not self._monitor.try_begin_reload():
+            return False
+        try:
+            self._close_retired()
+            path, _ = self._select_source()
+            if path is None:
+                return False
+
+            current = (path, file_signature(path))
+            snapshot = self._snapshot
+            if snapshot is not None and current == (snapshot.path, snapshot.signature):
+                return False
+            if current == self._failed_signature:
+                return False
+
+            logger.info(f"Star Charts data changed on disk, reloading {path}")
+            return self.load_star_charts_data()
+        finally:
+            self._monitor.end_reload()
+
     def get_sector_data(self, sector: str) -> Optional[Dict[str, Any]]:
         """
         Get data for a specific sector.
@@ -71,11 +308,12 @@ class StarChartsAdapter:
         Returns:
             dict or None: Sector data if found, None otherwise
         """
-        if not self._ensure_data_loaded():
+        snapshot = self.get_snapshot()
+        if not snapshot:
             return None
 
-        sectors = self.star_charts_data.get('sectors', {})
-        return sectors.get(sector)
+        index = snapshot.sector_index(sector)
+        return index.data if index else None
 
     def get_object_by_id(self, object_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -87,35 +325,11 @@ class StarChartsAdapter:
         Returns:
             dict or None: Object data if found, None otherwise
         """
-        if not self._ensure_data_loaded():
-            return None
-
-        try:
-            # Parse object ID (format: sector_name)
-            parts = object_id.split('_', 1)
-            if len(parts) != 2:
-                return None
-
-            sector, name_part = parts
-            sector_data = self.get_sector_data(sector)
-
-            if not sector_data:
-                return None
-
-            # Check star
-            if name_part == 'star' and sector_data.get('star'):
-                return sector_data['star']
-
-            # Check objects array
-            for obj in sector_data.get('objects', []):
-                if obj.get('id') == object_id:
-                    return obj
-
+        snapshot = self.get_snapshot()
+        if not snapshot:
             return None
 
-        except (TypeError, KeyError) as e:
-            logger.error(f"Error finding object {object_id}: {e}")
-            return None
+        return self._lookup(snapshot, object_id)
 
     def get_all_sector_objects(self, sector: str) -> List[str]:
         """
@@ -127,22 +341,12 @@ class StarChartsAdapter:
         Returns:
             list: List of object IDs in the sector
         """
-        sector_data = self.get_sector_data(sector)
-        if not sector_data:
+        snapshot = self.get_snapshot()
+        if not snapshot:
             return []
 
-        object_ids = []
-
-        # Add star
-        if sector_data.get('star', {}).get('id'):
-            object_ids.append(sector_data['star']['id'])
-
-        # Add objects from objects array
-        for obj in sector_data.get('objects', []):
-            if obj.get('id'):
-                object_ids.append(obj['id'])
-
-        return object_ids
+        index = snapshot.sector_index(sector)
+        return list(index.ids) if index else []
 
     def get_all_sectors(self) -> List[str]:
         """
@@ -151,11 +355,11 @@ class StarChartsAdapter:
         Returns:
             list: List of sector identifiers
         """
-        if not self._ensure_data_loaded():
+        snapshot = self.get_snapshot()
+        if not snapshot:
             return []
 
-        sectors = self.star_charts_data.get('sectors', {})
-        return list(sectors.keys())
+        return snapshot.source.sector_ids()
 
     def get_metadata(self) -> Optional[Dict[str, Any]]:
         """
@@ -164,48 +368,35 @@ class StarChartsAdapter:
         Returns:
             dict or None: Metadata if available
         """
-        if not self._ensure_data_loaded():
+        snapshot = self.get_snapshot()
+        if not snapshot:
             return None
 
-        return self.star_charts_data.get('metadata')
+        return snapshot.source.metadata
 
-    def search_objects(self, query: str, sector: Optional[str] = None) -> List[Dict[str, Any]]:
+    def search_objects(self, query: str, sector: Optional[str] = None,
+                       limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Search for objects by name or type.
+        Search for objects by name, type or class.
 
         Args:
-            query (str): Search query (case-insensitive)
+            query (str): Search query (case-insensitive substring)
             sector (str, optional): Limit search to specific sector
+            limit (int, optional): Maximum number of results to return
 
         Returns:
-            list: List of matching objects
+            list: Matching objects, best match first
         """
-        if not self._ensure_data_loaded():
+        snapshot = self.get_snapshot()
+        if not snapshot:
             return []
 
+        object_ids = snapshot.search_index().search(query, sector=sector, limit=limit)
         results = []
-        query_lower = query.lower()
-
-        sectors_to_search = [sector] if sector else self.get_all_sectors()
-
-        for sector_id in sectors_to_search:
-            sector_data = self.get_sector_data(sector_id)
-            if not sector_data:
-                continue
-
-            # Search star
-            star = sector_data.get('star')
-            if star and (query_lower in star.get('name', '').lower() or
-                        query_lower in star.get('type', '').lower()):
-                results.append(star)
-
-            # Search objects
-            for obj in sector_data.get('objects', []):
-                if (query_lower in obj.get('name', '').lower() or
-                    query_lower in obj.get('type', '').lower() or
-                    query_lower in obj.get('class', '').lower()):
-                    results.append(obj)
-
+        for object_id in object_ids:
+            obj = self._lookup(snapshot, object_id)
+            if obj:
+                results.append(obj)
         return results
 
     def get_objects_by_type(self, object_type: str, sector: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -219,28 +410,179 @@ class StarChartsAdapter:
         Returns:
             list: List of objects of the specified type
         """
-        if not self._ensure_data_loaded():
+        snapshot = self.get_snapshot()
+        if not snapshot:
             return []
 
-        results = []
-        sectors_to_search = [sector] if sector else self.get_all_sectors()
+        source = snapshot.source
+        if sector:
+            sectors_to_search = [sector]
+        else:
+            sectors_to_search = [
+                sector_id for sector_id in source.sector_ids()
+                if object_type in source.summary(sector_id).get('types', {})
+            ]
 
+        results = []
         for sector_id in sectors_to_search:
-            sector_data = self.get_sector_data(sector_id)
-            if not sector_data:
-                continue
+            index = snapshot.sector_index(sector_id)
+            if index:
+                results.extend(index.by_type.get(object_type, []))
+        return results
+
+    def get_objects_in_bbox(self, sector: str, min_x: float, min_z: float, max_x: float, max_z: float,
+                            fields: Optional[List[str]] = None, offset: int = 0,
+                            limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the objects of a sector inside a map bounding box.
 
-            # Check star
-            star = sector_data.get('star')
-            if star and star.get('type') == object_type:
-                results.append(star)
+        Map coordinates are the top-down (x, z) of each object's position.
 
-            # Check objects
-            for obj in sector_data.get('objects', []):
-                if obj.get('type') == object_type:
-                    results.append(obj)
+        Args:
+            sector (str): Sector identifier
+            min_x, min_z, max_x, max_z (float): Box bounds, inclusive
+            fields (list, optional): Object fields to return, defaults to MAP_FIELDS
+            offset (int): Number of matches to skip
+            limit (int, optional): Maximum number of objects to return
 
-        return results
+        Returns:
+            dict or None: Page of projected objects in database order with the
+                total match count, or None if the sector does not exist
+        """
+        snapshot = self.get_snapshot()
+        index = snapshot.sector_index(sector) if snapshot else None
+        if not index:
+            return None
+
+        return self._page(index.grid.query_bbox(min_x, min_z, max_x, max_z), fields, offset, limit)
+
+    def get_objects_in_radius(self, sector: str, x: float, z: float, radius: float,
+                              fields: Optional[List[str]] = None, offset: int = 0,
+                              limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the objects of a sector within a radius of a map point.
+
+        Args:
+            sector (str): Sector identifier
+            x, z (float): Map coordinates of the center
+            radius (float): Search radius in game units
+            fields (list, optional): Object fields to return, defaults to MAP_FIELDS
+            offset (int): Number of matches to skip
+            limit (int, optional): Maximum number of objects to return
+
+        Returns:
+            dict or None: Page of projected objects, nearest first, with the
+                total match count, or None if the sector does not exist
+        """
+        snapshot = self.get_snapshot()
+        index = snapshot.sector_index(sector) if snapshot else None
+        if not index:
+            return None
+
+        return self._page(index.grid.query_radius(x, z, radius), fields, offset, limit)
+
+    def get_duplicate_ids(self) -> Dict[str, int]:
+        """
+        Get object IDs that appear more than once in the database.
+
+        Only the first occurrence of a duplicated ID is indexed; later
+        occurrences are reported here so the generator can be fixed.
+
+        Returns:
+            dict: Mapping of duplicated object ID to total occurrence count
+        """
+        snapshot = self.get_snapshot()
+        if not snapshot:
+            return {}
+
+        return snapshot.duplicate_ids()
+
+    def _lookup(self, snapshot: StarChartsSnapshot, object_id: str) -> Optional[Dict[str, Any]]:
+        """Resolve an object ID within one snapshot."""
+        # Object IDs are prefixed with their sector (format: sector_name)
+        parts = object_id.split('_', 1)
+        if len(parts) != 2:
+            return None
+
+        index = snapshot.sector_index(parts[0])
+        return index.objects.get(object_id) if index else None
+
+    @staticmethod
+    def _page(objects: List[Dict[str, Any]], fields: Optional[List[str]],
+              offset: int, limit: Optional[int]) -> Dict[str, Any]:
+        """Slice a list of matches and project the requested fields of the page."""
+        fields = list(fields) if fields else list(MAP_FIELDS)
+        if 'id' not in fields:
+            fields.insert(0, 'id')
+
+        end = None if limit is None else offset + limit
+        return {
+            'objects': [project(obj, fields) for obj in objects[offset:end]],
+            'total': len(objects),
+            'offset': offset,
+            'limit': limit
+        }
+
+    def _retire(self, snapshot: StarChartsSnapshot) -> None:
+        """Schedule a replaced snapshot to be closed once in-flight requests are done with it."""
+        with self._retired_lock:
+            self._retired.append((time.monotonic(), snapshot))
+        self._close_retired()
+
+    def _close_retired(self) -> None:
+        """Close replaced snapshots retired for at least retired_ttl seconds."""
+        cutoff = time.monotonic() - self._retired_ttl
+        with self._retired_lock:
+            expired = [snapshot for retired_at, snapshot in self._retired if retired_at <= cutoff]
+            self._retired = [(retired_at, snapshot) for retired_at, snapshot in self._retired if retired_at > cutoff]
+        for snapshot in expired:
+            snapshot.close()
+
+    def _select_source(self) -> tuple:
+        """
+        Return the (path, source class) of the data file to load, or (None, None).
+
+        objects.bin and objects.shards.jsonl are derived from objects.json by
+        the database generator, which records the SHA-256 of objects.json in
+        their headers. The first derived file present whose recorded hash
+        matches the current objects.json wins; one that differs is stale
+        (objects.json was edited without regenerating) and is skipped with a
+        warning, so the edit is served and picked up by hot reload. Derived
+        files without a recorded hash, or without an objects.json next to
+        them, are used as they are.
+        """
+        json_hash = self._hash_of(self._file_path, file_sha256)
+        for path, source_class in ((self._binary_path, BinaryStarChartsSource),
+                                   (self._sharded_path, ShardedStarChartsSource)):
+            if file_signature(path) is None:
+                continue
+            try:
+                recorded = self._hash_of(path, source_class.read_source_hash)
+            except (OSError, ValueError):
+                # Unreadable header: loading it reports the error
+                recorded = None
+            if json_hash is not None and recorded is not None and recorded != json_hash:
+                if (path, recorded, json_hash) not in self._stale_warned:
+                    self._stale_warned.add((path, recorded, json_hash))
+                    logger.warning(f"Star Charts {path} was not built from the current {self._file_path}, "
+                                   f"ignoring it; rerun scripts/generate_star_charts_db.py to rebuild it")
+                continue
+            return path, source_class
+        if json_hash is not None:
+            return self._file_path, JsonStarChartsSource
+        return None, None
+
+    def _hash_of(self, path: str, read_hash) -> Optional[str]:
+        """Return read_hash(path), reusing the last result while the file is unchanged."""
+        signature = file_signature(path)
+        if signature is None:
+            return None
+        cached = self._hashes.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        value = read_hash(path)
+        self._hashes[path] = (signature, value)
+        return value
 
     def _ensure_data_loaded(self) -> bool:
         """
@@ -260,7 +602,6 @@ class StarChartsAdapter:
         Returns:
             bool: True if reload successful, False otherwise
         """
-        self._data_loaded = False
         return self.load_star_charts_data()
 
     def get_stats(self) -> Dict[str, Any]:
@@ -270,20 +611,21 @@ class StarChartsAdapter:
         Returns:
             dict: Database statistics
         """
-        if not self._ensure_data_loaded():
+        snapshot = self.get_snapshot()
+        if not snapshot:
             return {'error': 'Data not loaded'}
 
-        metadata = self.get_metadata()
-        sectors = self.get_all_sectors()
-
-        total_objects = 0
-        for sector in sectors:
-            total_objects += len(self.get_all_sector_objects(sector))
+        source = snapshot.source
+        sectors = source.sector_ids()
+        total_objects = sum(source.summary(sector).get('objects', 0) for sector in sectors)
 
         return {
             'total_sectors': len(sectors),
             'total_objects': total_objects,
+            'duplicate_ids': len(snapshot.duplicate_ids()),
             'sectors': sectors,
-            'metadata': metadata,
+            'metadata': source.metadata,
+            'storage': source.storage,
+            'cached_sectors': snapshot.cached_sectors,
             'data_loaded': self._data_loaded
         }
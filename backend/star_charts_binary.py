@@ -0,0 +1,446 @@
+"""
+Star Charts Binary Encoding
+===========================
+
+Compact columnar encoding of the Star Charts database (objects.bin), written
+next to objects.json by the database generator.
+
+Layout (little-endian):
+
+    b'SCDB'  u16 version  u16 reserved  u32 header length
+    header   compact JSON: metadata, per-sector row ranges and summaries,
+             and the byte offset of every section below
+    sections 4-byte aligned, offsets relative to the end of the header
+
+Every object of every sector is one row (the star first, then the sector's
+objects in database order). Strings (IDs, names, types, classes,
+descriptions, orbit parents) are interned in a single string table, so each
+distinct string is stored once and string columns hold table indexes.
+Positions, visual radii and orbit parameters are float32 columns. Fields
+that do not fit a column (rare keys, unusual shapes) are kept per row as a
+compact JSON string, and sector-level extras such as the A0 infrastructure
+likewise. Integer values in numeric columns are flagged in a per-row mask
+and the key order of every object and sector is recorded (as interned key
+lists), so rebuilt sectors match objects.json apart from float32 precision
+(numbers come back as the doubles nearest the stored float32 values).
+
+BinaryStarChartsSource opens the file with a single read and wraps the
+columns in typed arrays. The search catalog and sector summaries come
+straight from the columns and the header; sector queries rebuild the dicts
+of the requested sector only, which the adapter then caches. Opening the
+file and rebuilding one sector costs a fraction of parsing objects.json,
+while rebuilding every sector costs about as much as json.load.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from backend.star_charts_storage import CatalogRow, SectorIndex, _atomic_write
+
+logger = logging.getLogger(__name__)
+
+BINARY_MAGIC = b'SCDB'
+BINARY_FORMAT_VERSION = 2
+
+# Suffix of the binary file, which lives next to objects.json
+BINARY_SUFFIX = '.bin'
+
+PREAMBLE = struct.Struct('<4sHHI')
+
+# Keys stored in columns, in the order objects are rebuilt with
+STRING_FIELDS = ('id', 'name', 'type', 'class')
+ORBIT_KEYS = ('parent', 'radius', 'period', 'angle')
+
+# Row flags
+HAS_POSITION = 1
+HAS_VISUAL_RADIUS = 2
+HAS_ORBIT = 4
+
+# Integer mask bits: position x/y/z, visual radius, orbit radius/period/angle
+INT_POSITION = 1
+INT_VISUAL_RADIUS = 8
+INT_ORBIT = 16
+
+# Integers up to this magnitude survive the float32 round trip exactly
+FLOAT32_INT_LIMIT = 2 ** 24
+
+# String index meaning "no value"
+NO_STRING = 0
+
+
+def binary_path_for(json_path: str) -> str:
+    """Return the binary database path that belongs to an objects.json path."""
+    return os.path.splitext(json_path)[0] + BINARY_SUFFIX
+
+
+def _is_number(value: Any) -> bool:
+    """Whether value can be stored in a float32 column and rebuilt as the same JSON value."""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return abs(value) <= FLOAT32_INT_LIMIT
+    return isinstance(value, float)
+
+
+def _int_bits(values, first_bit: int) -> int:
+    """Integer mask bits of consecutive column values, starting at first_bit."""
+    mask = 0
+    for i, value in enumerate(values):
+        if isinstance(value, int):
+            mask |= first_bit << i
+    return mask
+
+
+def _column_bytes(column: array) -> bytes:
+    if sys.byteorder == 'big':
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _column_from(buffer: memoryview, typecode: str, offset: int, count: int) -> array:
+    column = array(typecode)
+    column.frombytes(buffer[offset:offset + count * column.itemsize])
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column
+
+
+def _index_typecode(count: int) -> str:
+    """Smallest unsigned array typecode able to index count strings."""
+    for typecode in ('H', 'I', 'L'):
+        if count < 2 ** (8 * array(typecode).itemsize):
+            return typecode
+    raise ValueError("String table too large")
+
+
+class _StringTable:
+    """Interns strings while writing; index 0 is reserved for 'no value'."""
+
+    def __init__(self):
+        self.strings: List[str] = ['']
+        self._index: Dict[str, int] = {}
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self._index[value] = index
+        return index
+
+
+def write_binary_database(database: Dict[str, Any], path: str, source_hash: Optional[str] = None) -> None:
+    """
+    Write a database in the binary columnar layout.
+
+    Args:
+        database (dict): Database in the objects.json structure
+        path (str): Destination path of the binary file
+        source_hash (str, optional): file_sha256() of the objects.json the
+            database was read from or written to
+    """
+    strings = _StringTable()
+    string_columns: Dict[str, List[int]] = {
+        field: [] for field in STRING_FIELDS + ('description', 'parent', 'extras', 'keys')
+    }
+    flags = array('B')
+    int_masks = array('B')
+    positions = array('f')
+    visual_radii = array('f')
+    orbits = array('f')
+    sectors: Dict[str, Dict[str, Any]] = {}
+
+    def add_row(obj: Dict[str, Any]) -> None:
+        extras = {}
+        row_flags = 0
+        int_mask = 0
+        for field in STRING_FIELDS + ('description',):
+            value = obj.get(field)
+            if value is not None and not isinstance(value, str):
+                extras[field] = value
+                value = None
+            string_columns[field].append(strings.add(value))
+
+        position = obj.get('position')
+        if isinstance(position, list) and len(position) == 3 and all(_is_number(v) for v in position):
+            row_flags |= HAS_POSITION
+            int_mask |= _int_bits(position, INT_POSITION)
+            positions.extend(position)
+        else:
+            positions.extend((0.0, 0.0, 0.0))
+            if 'position' in obj:
+                extras['position'] = position
+
+        visual_radius = obj.get('visualRadius')
+        if _is_number(visual_radius):
+            row_flags |= HAS_VISUAL_RADIUS
+            int_mask |= _int_bits((visual_radius,), INT_VISUAL_RADIUS)
+            visual_radii.append(visual_radius)
+        else:
+            visual_radii.append(0.0)
+            if 'visualRadius' in obj:
+                extras['visualRadius'] = visual_radius
+
+        orbit = obj.get('orbit')
+        if (isinstance(orbit, dict) and tuple(orbit) == ORBIT_KEYS and isinstance(orbit['parent'], str)
+                and all(_is_number(orbit[key]) for key in ORBIT_KEYS[1:])):
+            row_flags |= HAS_ORBIT
+            int_mask |= _int_bits((orbit[key] for key in ORBIT_KEYS[1:]), INT_ORBIT)
+            string_columns['parent'].append(strings.add(orbit['parent']))
+            orbits.extend(orbit[key] for key in ORBIT_KEYS[1:])
+        else:
+            string_columns['parent'].append(NO_STRING)
+            orbits.extend((0.0, 0.0, 0.0))
+            if 'orbit' in obj:
+                extras['orbit'] = orbit
+
+        known = set(STRING_FIELDS) | {'description', 'position', 'visualRadius', 'orbit'}
+        extras.update((key, value) for key, value in obj.items() if key not in known)
+        string_columns['extras'].append(
+            strings.add(json.dumps(extras, separators=(',', ':'))) if extras else NO_STRING
+        )
+        string_columns['keys'].append(strings.add(json.dumps(list(obj), separators=(',', ':'))))
+        flags.append(row_flags)
+        int_masks.append(int_mask)
+
+    for sector_id, sector_data in database.get('sectors', {}).items():
+        first_row = len(flags)
+        star = sector_data.get('star')
+        if star:
+            add_row(star)
+        for obj in sector_data.get('objects', []):
+            add_row(obj)
+
+        sector_extras = {key: value for key, value in sector_data.items() if key not in ('star', 'objects')}
+        sectors[sector_id] = {
+            'rows': [first_row, len(flags) - first_row],
+            'digest': hashlib.sha1(json.dumps(sector_data, separators=(',', ':')).encode('utf-8')).hexdigest()[:16],
+            'star': bool(star),
+            'extras': strings.add(json.dumps(sector_extras, separators=(',', ':'))) if sector_extras else NO_STRING,
+            'keys': list(sector_data),
+            **SectorIndex(sector_id, sector_data).summary()
+        }
+
+    # String table: offsets into one UTF-8 blob
+    encoded = [value.encode('utf-8') for value in strings.strings]
+    string_offsets = array('I', [0])
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+    index_typecode = _index_typecode(len(encoded))
+
+    sections: List[Tuple[str, bytes]] = [
+        ('string_offsets', _column_bytes(string_offsets)),
+        ('string_data', b''.join(encoded)),
+        ('flags', _column_bytes(flags)),
+        ('int_mask', _column_bytes(int_masks)),
+        ('position', _column_bytes(positions)),
+        ('visual_radius', _column_bytes(visual_radii)),
+        ('orbit', _column_bytes(orbits)),
+    ]
+    sections.extend(
+        (field, _column_bytes(array(index_typecode, column))) for field, column in string_columns.items()
+    )
+
+    body: List[bytes] = []
+    offsets: Dict[str, int] = {}
+    offset = 0
+    for name, data in sections:
+        offsets[name] = offset
+        padding = -len(data) % 4
+        body.append(data + b'\0' * padding)
+        offset += len(data) + padding
+
+    header = {
+        'metadata': database.get('metadata', {}),
+        'rows': len(flags),
+        'strings': len(encoded),
+        'index_type': index_typecode,
+        'sections': offsets,
+        'sectors': sectors,
+    }
+    if source_hash:
+        header['source_sha256'] = source_hash
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    header_bytes += b' ' * (-(PREAMBLE.size + len(header_bytes)) % 4)
+
+    _atomic_write(path, [PREAMBLE.pack(BINARY_MAGIC, BINARY_FORMAT_VERSION, 0, len(header_bytes)), header_bytes, *body])
+    logger.info(f"Wrote binary Star Charts database: {path} ({len(sectors)} sectors, {len(flags)} objects)")
+
+
+class BinaryStarChartsSource:
+    """Source backed by objects.bin, rebuilding sectors from its columns on demand."""
+
+    storage = 'binary'
+
+    def __init__(self, path: str):
+        """
+        Open a binary database.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a supported binary database
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            buffer = memoryview(f.read())
+
+        if len(buffer) < PREAMBLE.size:
+            raise ValueError(f"Truncated Star Charts binary database: {path}")
+        magic, version, _, header_length = PREAMBLE.unpack_from(buffer)
+        if magic != BINARY_MAGIC or version != BINARY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported Star Charts binary format in {path}")
+
+        header = json.loads(bytes(buffer[PREAMBLE.size:PREAMBLE.size + header_length]))
+        body = buffer[PREAMBLE.size + header_length:]
+        sections = header['sections']
+        rows = header['rows']
+        index_type = header['index_type']
+
+        self.source_hash: Optional[str] = header.get('source_sha256')
+        self.metadata: Dict[str, Any] = header.get('metadata', {})
+        self._sectors: Dict[str, Dict[str, Any]] = header['sectors']
+
+        self._string_offsets = _column_from(body, 'I', sections['string_offsets'], header['strings'] + 1)
+        self._string_data = bytes(body[sections['string_data']:sections['string_data'] + self._string_offsets[-1]])
+        self._flags = _column_from(body, 'B', sections['flags'], rows)
+        self._int_masks = _column_from(body, 'B', sections['int_mask'], rows)
+        self._positions = _column_from(body, 'f', sections['position'], rows * 3)
+        self._visual_radii = _column_from(body, 'f', sections['visual_radius'], rows)
+        self._orbits = _column_from(body, 'f', sections['orbit'], rows * 3)
+        self._columns = {
+            field: _column_from(body, index_type, sections[field], rows)
+            for field in STRING_FIELDS + ('description', 'parent', 'extras', 'keys')
+        }
+        # Key list string index -> decoded key list
+        self._key_orders: Dict[int, List[str]] = {}
+        # String index -> decoded string, filled on first use
+        self._strings: List[Optional[str]] = [None] * (header['strings'] + 1)
+
+        if len(self._flags) != rows or len(self._int_masks) != rows or any(len(column) != rows for column in self._columns.values()):
+            raise ValueError(f"Truncated Star Charts binary database: {path}")
+
+    @staticmethod
+    def read_source_hash(path: str) -> Optional[str]:
+        """
+        Return the objects.json SHA-256 recorded in a binary file's header.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a supported binary database
+        """
+        with open(path, 'rb') as f:
+            preamble = f.read(PREAMBLE.size)
+            if len(preamble) < PREAMBLE.size:
+                raise ValueError(f"Truncated Star Charts binary database: {path}")
+            magic, version, _, header_length = PREAMBLE.unpack(preamble)
+            if magic != BINARY_MAGIC or version != BINARY_FORMAT_VERSION:
+                raise ValueError(f"Unsupported Star Charts binary format in {path}")
+            return json.loads(f.read(header_length)).get('source_sha256')
+
+    def sector_ids(self) -> List[str]:
+        return list(self._sectors.keys())
+
+    def summary(self, sector: str) -> Optional[Dict[str, Any]]:
+        return self._sectors.get(sector)
+
+    def load_sector(self, sector: str) -> Optional[SectorIndex]:
+        entry = self._sectors.get(sector)
+        if entry is None:
+            return None
+
+        first_row, count = entry['rows']
+        rows = range(first_row, first_row + count)
+        data: Dict[str, Any] = {}
+        if entry['star']:
+            data['star'] = self._object(first_row)
+            rows = rows[1:]
+        data['objects'] = [self._object(row) for row in rows]
+        if entry['extras']:
+            data.update(json.loads(self._string(entry['extras'])))
+        return SectorIndex(sector, {key: data[key] for key in entry['keys']})
+
+    def catalog(self) -> Iterator[CatalogRow]:
+        ids, names = self._columns['id'], self._columns['name']
+        types, classes = self._columns['type'], self._columns['class']
+        for sector_id, entry in self._sectors.items():
+            first_row, count = entry['rows']
+            seen = set()
+            for row in range(first_row, first_row + count):
+                object_id = self._string(ids[row])
+                if not object_id:
+                    if not (entry['star'] and row == first_row):
+                        continue
+                    object_id = f"{sector_id}_star"
+                if object_id in seen:
+                    continue
+                seen.add(object_id)
+                yield (sector_id, object_id, self._string(names[row]),
+                       self._string(types[row]), self._string(classes[row]))
+
+    def _string(self, index: int) -> str:
+        value = self._strings[index]
+        if value is None:
+            value = self._strings[index] = (
+                self._string_data[self._string_offsets[index]:self._string_offsets[index + 1]].decode('utf-8')
+            )
+        return value
+
+    def _key_order(self, index: int) -> List[str]:
+        keys = self._key_orders.get(index)
+        if keys is None:
+            keys = self._key_orders[index] = json.loads(self._string(index))
+        return keys
+
+    def _object(self, row: int) -> Dict[str, Any]:
+        """Rebuild the object dict of one row, with the source's key order and number types."""
+        obj: Dict[str, Any] = {}
+        columns = self._columns
+        strings = self._strings
+        flags = self._flags[row]
+        int_mask = self._int_masks[row]
+
+        for field in STRING_FIELDS:
+            index = columns[field][row]
+            if index:
+                obj[field] = strings[index] or self._string(index)
+        if flags & HAS_POSITION:
+            position = self._positions[row * 3:row * 3 + 3].tolist()
+            if int_mask & (INT_POSITION * 7):
+                position = [int(value) if int_mask & (INT_POSITION << i) else value
+                            for i, value in enumerate(position)]
+            obj['position'] = position
+        if flags & HAS_VISUAL_RADIUS:
+            visual_radius = self._visual_radii[row]
+            obj['visualRadius'] = int(visual_radius) if int_mask & INT_VISUAL_RADIUS else visual_radius
+        if flags & HAS_ORBIT:
+            radius, period, angle = self._orbits[row * 3:row * 3 + 3].tolist()
+            if int_mask & (INT_ORBIT * 7):
+                radius, period, angle = [int(value) if int_mask & (INT_ORBIT << i) else value
+                                         for i, value in enumerate((radius, period, angle))]
+            index = columns['parent'][row]
+            obj['orbit'] = {
+                'parent': strings[index] or self._string(index),
+                'radius': radius,
+                'period': period,
+                'angle': angle,
+            }
+        index = columns['description'][row]
+        if index:
+            obj['description'] = strings[index] or self._string(index)
+        index = columns['extras'][row]
+        if index:
+            obj.update(json.loads(strings[index] or self._string(index)))
+
+        keys = self._key_order(columns['keys'][row])
+        if list(obj) == keys:
+            return obj
+        return {key: obj[key] for key in keys}
@@ -0,0 +1,161 @@
+"""
+Star Charts Search Index
+========================
+
+Inverted n-gram index over the name, type and class of Star Charts objects.
+
+Every field value is broken into all of its 1-, 2- and 3-character grams.
+A query of up to three characters is answered straight from its posting
+list; a longer query starts from the posting list of its rarest trigram and
+verifies the substring on that (small) candidate set. Matching therefore
+keeps the substring semantics of the original linear scan while touching
+only objects that can possibly match.
+
+Results are ranked so type-ahead puts the most relevant objects first:
+
+    0. name equals the query
+    1. name starts with the query
+    2. a word in the name starts with the query
+    3. type or class equals the query
+    4. a word in the type or class starts with the query
+    5. substring match anywhere
+"""
+
+import heapq
+import logging
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Longest gram stored in the index
+MAX_GRAM_LENGTH = 3
+
+
+def _grams(text: str) -> set:
+    """Return every distinct 1..MAX_GRAM_LENGTH character gram of text."""
+    grams = set()
+    for size in range(1, MAX_GRAM_LENGTH + 1):
+        for start in range(len(text) - size + 1):
+            grams.add(text[start:start + size])
+    return grams
+
+
+class StarChartsSearchIndex:
+    """
+    Prebuilt inverted index for Star Charts object search.
+
+    Documents are stored in insertion order, so ties in ranking keep the
+    database order the linear scan used to return.
+    """
+
+    def __init__(self):
+        """Initialize an empty search index."""
+        self._doc_ids: List[str] = []
+        self._doc_sectors: List[str] = []
+        self._doc_fields: List[Tuple[str, str, str]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._sector_docs: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def add(self, sector: str, object_id: str, name: str = '',
+            object_type: str = '', object_class: str = '') -> None:
+        """
+        Add an object to the index.
+
+        Args:
+            sector (str): Sector the object belongs to
+            object_id (str): Unique object ID
+            name (str): Object name
+            object_type (str): Object type (e.g. 'planet')
+            object_class (str): Object class (e.g. 'Class-M')
+        """
+        doc = len(self._doc_ids)
+        fields = ((name or '').lower(), (object_type or '').lower(), (object_class or '').lower())
+
+        self._doc_ids.append(object_id)
+        self._doc_sectors.append(sector)
+        self._doc_fields.append(fields)
+        self._sector_docs.setdefault(sector, []).append(doc)
+
+        grams = set()
+        for value in fields:
+            grams |= _grams(value)
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(doc)
+
+    def search(self, query: str, sector: Optional[str] = None,
+               limit: Optional[int] = None) -> List[str]:
+        """
+        Search the index.
+
+        Args:
+            query (str): Search query (case-insensitive substring)
+            sector (str, optional): Limit results to one sector
+            limit (int, optional): Maximum number of results
+
+        Returns:
+            list: Matching object IDs, best match first
+        """
+        query = query.lower()
+        candidates = self._candidates(query, sector)
+
+        ranked = []
+        for doc in candidates:
+            if sector and self._doc_sectors[doc] != sector:
+                continue
+            rank = self._rank(query, self._doc_fields[doc])
+            if rank is not None:
+                ranked.append((rank, doc))
+
+        if limit is not None and limit < len(ranked):
+            ranked = heapq.nsmallest(limit, ranked)
+        else:
+            ranked.sort()
+
+        return [self._doc_ids[doc] for _, doc in ranked]
+
+    def _candidates(self, query: str, sector: Optional[str]) -> List[int]:
+        """Return the smallest posting list that must contain every match."""
+        if not query:
+            if sector:
+                return self._sector_docs.get(sector, [])
+            return list(range(len(self._doc_ids)))
+
+        if len(query) <= MAX_GRAM_LENGTH:
+            postings = self._postings.get(query, [])
+        else:
+            postings = None
+            for start in range(len(query) - MAX_GRAM_LENGTH + 1):
+                gram_postings = self._postings.get(query[start:start + MAX_GRAM_LENGTH])
+                if not gram_postings:
+                    return []
+                if postings is None or len(gram_postings) < len(postings):
+                    postings = gram_postings
+
+        if sector:
+            sector_docs = self._sector_docs.get(sector, [])
+            if len(sector_docs) < len(postings):
+                return sector_docs
+        return postings
+
+    @staticmethod
+    def _rank(query: str, fields: Tuple[str, str, str]) -> Optional[int]:
+        """Rank a document against the query, or None if it does not match."""
+        name, object_type, object_class = fields
+
+        if query == name:
+            return 0
+        if name.startswith(query):
+            return 1
+        if query in name and any(word.startswith(query) for word in name.split()):
+            return 2
+        if query == object_type or query == object_class:
+            return 3
+        for value in (object_type, object_class):
+            if query in value and any(word.startswith(query) for word in value.replace('-', ' ').split()):
+                return 4
+        if query in name or query in object_type or query in object_class:
+            return 5
+        return None
@@ -0,0 +1,132 @@
+"""
+Star Charts Spatial Index
+=========================
+
+Uniform grid over the positions of the objects in one Star Charts sector,
+used to answer viewport (bounding box) and radius queries for the map.
+
+The star chart is a top-down view, so objects are bucketed by their map
+coordinates: position[0] (x) and position[2] (z). A query visits only the
+grid cells that overlap the requested area and checks the exact bounds on
+the objects in those cells.
+
+Results come back as projections holding only the fields the map needs.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Fields returned by map queries when the caller does not ask for specific ones
+MAP_FIELDS = ('id', 'name', 'type', 'class', 'position', 'visualRadius')
+
+Cell = Tuple[int, int]
+
+
+def map_coordinates(obj: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """
+    Get the top-down map coordinates of an object.
+
+    Args:
+        obj (dict): Star Charts object
+
+    Returns:
+        tuple or None: (x, z), or None if the object has no usable position
+    """
+    position = obj.get('position')
+    if not isinstance(position, (list, tuple)) or len(position) < 3:
+        return None
+    try:
+        return float(position[0]), float(position[2])
+    except (TypeError, ValueError):
+        return None
+
+
+def project(obj: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """Return a copy of obj holding only the requested fields that it has."""
+    return {field: obj[field] for field in fields if field in obj}
+
+
+class SpatialGrid:
+    """
+    Grid index of the objects in one sector.
+
+    Objects keep their database order within the grid, so bounding box
+    results are stable between calls and safe to paginate.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, Dict[str, Any]]], cell_size: float):
+        """
+        Build the grid.
+
+        Args:
+            entries: (object_id, object) pairs in database order
+            cell_size (float): Width of a grid cell in game units
+        """
+        self.cell_size = cell_size
+        self._objects: List[Dict[str, Any]] = []
+        self._points: List[Tuple[float, float]] = []
+        self._cells: Dict[Cell, List[int]] = {}
+
+        for _, obj in entries:
+            point = map_coordinates(obj)
+            if point is None:
+                continue
+            slot = len(self._objects)
+            self._objects.append(obj)
+            self._points.append(point)
+            self._cells.setdefault(self._cell(*point), []).append(slot)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def query_bbox(self, min_x: float, min_z: float, max_x: float, max_z: float) -> List[Dict[str, Any]]:
+        """
+        Find objects inside a bounding box (bounds inclusive).
+
+        Returns:
+            list: Matching objects in database order
+        """
+        slots = [
+            slot for slot in self._slots_in_cells(min_x, min_z, max_x, max_z)
+            if min_x <= self._points[slot][0] <= max_x and min_z <= self._points[slot][1] <= max_z
+        ]
+        slots.sort()
+        return [self._objects[slot] for slot in slots]
+
+    def query_radius(self, x: float, z: float, radius: float) -> List[Dict[str, Any]]:
+        """
+        Find objects within a radius of a point.
+
+        Returns:
+            list: Matching objects, nearest first
+        """
+        radius_sq = radius * radius
+        matches = []
+        for slot in self._slots_in_cells(x - radius, z - radius, x + radius, z + radius):
+            px, pz = self._points[slot]
+            distance_sq = (px - x) ** 2 + (pz - z) ** 2
+            if distance_sq <= radius_sq:
+                matches.append((distance_sq, slot))
+        matches.sort()
+        return [self._objects[slot] for _, slot in matches]
+
+    def _cell(self, x: float, z: float) -> Cell:
+        return math.floor(x / self.cell_size), math.floor(z / self.cell_size)
+
+    def _slots_in_cells(self, min_x: float, min_z: float, max_x: float, max_z: float) -> Iterable[int]:
+        """Yield the objects of every occupied cell overlapping the box."""
+        if min_x > max_x or min_z > max_z:
+            return
+        low_x, low_z = self._cell(min_x, min_z)
+        high_x, high_z = self._cell(max_x, max_z)
+
+        # A huge box over a sparse grid: walking occupied cells is cheaper
+        if (high_x - low_x + 1) * (high_z - low_z + 1) > len(self._cells):
+            for (cell_x, cell_z), slots in self._cells.items():
+                if low_x <= cell_x <= high_x and low_z <= cell_z <= high_z:
+                    yield from slots
+            return
+
+        for cell_x in range(low_x, high_x + 1):
+            for cell_z in range(low_z, high_z + 1):
+                yield from self._cells.get((cell_x, cell_z), ())
@@ -0,0 +1,328 @@
+"""
+Star Charts Storage
+===================
+
+On-disk layouts for the Star Charts database and the sources the
+StarChartsAdapter reads them through.
+
+Two layouts are supported:
+
+- objects.json: the original monolithic database. Reading any sector means
+  parsing the whole file, so JsonStarChartsSource keeps every sector in memory.
+- objects.shards.jsonl: the sharded layout written next to objects.json by
+  the database generator. The first line is a small header holding the
+  metadata plus a byte offset, length, content digest and summary for every
+  sector. Each following line is one sector encoded as compact JSON, and the
+  last line is a search catalog of (sector, id, name, type, class) rows. The
+  digest lets a reload keep already decoded sectors that did not change.
+  ShardedStarChartsSource parses only the header at startup and decodes a
+  sector with a single seek and read when it is first needed.
+
+Derived layouts record the SHA-256 of the objects.json they were written
+from (source_sha256 in the header), so the adapter can tell an up-to-date
+derived file from one left behind by an edit of objects.json. File times
+cannot: a git checkout writes files in arbitrary order.
+
+Both sources hand out SectorIndex objects, which carry the per-sector lookup
+indexes the adapter queries.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from backend.constants import STAR_CHARTS_GRID_CELL_SIZE
+from backend.star_charts_spatial import SpatialGrid
+
+logger = logging.getLogger(__name__)
+
+SHARDED_FORMAT = 'star_charts_sharded'
+SHARDED_FORMAT_VERSION = 1
+
+# Suffix of the sharded file, which lives next to objects.json
+SHARDED_SUFFIX = '.shards.jsonl'
+
+CatalogRow = Tuple[str, str, str, str, str]
+
+
+def sharded_path_for(json_path: str) -> str:
+    """Return the sharded database path that belongs to an objects.json path."""
+    return os.path.splitext(json_path)[0] + SHARDED_SUFFIX
+
+
+def file_sha256(path: str) -> Optional[str]:
+    """Return the hex SHA-256 of a file's content, or None if it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def sector_entries(sector_id: str, sector_data: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    List the (object_id, object) pairs of a sector, star first.
+
+    A star without an explicit ID is listed under '<sector>_star', which is
+    how the original lookup code addressed it.
+    """
+    entries = []
+    star = sector_data.get('star')
+    if star:
+        entries.append((star.get('id') or f"{sector_id}_star", star))
+    for obj in sector_data.get('objects', []):
+        if obj.get('id'):
+            entries.append((obj['id'], obj))
+    return entries
+
+
+class SectorIndex:
+    """
+    Lookup indexes for a single decoded sector.
+
+    Only the first occurrence of a duplicated object ID is indexed; later
+    occurrences are kept in ``duplicates`` so they can be reported.
+    """
+
+    def __init__(self, sector_id: str, data: Dict[str, Any]):
+        self.sector_id = sector_id
+        self.data = data
+        self.objects: Dict[str, Dict[str, Any]] = {}
+        self.ids: List[str] = []
+        self.by_type: Dict[str, List[Dict[str, Any]]] = {}
+        self.duplicates: Dict[str, List[Dict[str, Any]]] = {}
+        self._grid: Optional[SpatialGrid] = None
+
+        for object_id, obj in sector_entries(sector_id, data):
+            if object_id in self.objects:
+                self.duplicates.setdefault(object_id, []).append(obj)
+                continue
+            self.objects[object_id] = obj
+            self.ids.append(object_id)
+            self.by_type.setdefault(obj.get('type'), []).append(obj)
+
+    @property
+    def grid(self) -> SpatialGrid:
+        """Spatial grid over the indexed objects, built on first use."""
+        if self._grid is None:
+            self._grid = SpatialGrid(self.objects.items(), STAR_CHARTS_GRID_CELL_SIZE)
+        return self._grid
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the object count, type counts and duplicate counts of the sector."""
+        return {
+            'objects': len(self.ids),
+            'types': {object_type: len(objects) for object_type, objects in self.by_type.items()},
+            'duplicates': {object_id: len(shadowed) + 1 for object_id, shadowed in self.duplicates.items()},
+        }
+
+    def catalog(self) -> List[CatalogRow]:
+        """Return the search catalog rows of the sector."""
+        return [
+            (self.sector_id, object_id, obj.get('name', ''), obj.get('type', ''), obj.get('class', ''))
+            for object_id, obj in self.objects.items()
+        ]
+
+
+class JsonStarChartsSource:
+    """Source backed by the monolithic objects.json, fully decoded at load."""
+
+    storage = 'json'
+
+    def __init__(self, path: str):
+        """
+        Load and index the whole database.
+
+        Raises:
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        self.path = path
+        with open(path, 'r', encoding='utf-8') as f:
+            database = json.load(f)
+
+        self.metadata: Dict[str, Any] = database.get('metadata', {})
+        self._sectors: Dict[str, SectorIndex] = {
+            sector_id: SectorIndex(sector_id, sector_data)
+            for sector_id, sector_data in database.get('sectors', {}).items()
+        }
+        self._summaries = {sector_id: index.summary() for sector_id, index in self._sectors.items()}
+
+    def sector_ids(self) -> List[str]:
+        return list(self._sectors.keys())
+
+    def summary(self, sector: str) -> Optional[Dict[str, Any]]:
+        return self._summaries.get(sector)
+
+    def load_sector(self, sector: str) -> Optional[SectorIndex]:
+        return self._sectors.get(sector)
+
+    def catalog(self) -> Iterator[CatalogRow]:
+        for index in self._sectors.values():
+            yield from index.catalog()
+
+
+class ShardedStarChartsSource:
+    """Source backed by objects.shards.jsonl, decoding sectors on demand."""
+
+    storage = 'sharded'
+
+    def __init__(self, path: str):
+        """
+        Read the header of a sharded database.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the header is missing or not a supported format
+        """
+        self.path = path
+        # Kept open for the life of the source: a regenerated database is
+        # renamed over path, and this handle keeps reading the file the
+        # header describes rather than the replacement
+        self._file = open(path, 'rb')
+        self._lock = threading.Lock()
+        try:
+            header_line = self._file.readline()
+            header = json.loads(header_line)
+            if header.get('format') != SHARDED_FORMAT or header.get('version') != SHARDED_FORMAT_VERSION:
+                raise ValueError(f"Unsupported Star Charts shard format in {path}")
+        except BaseException:
+            self._file.close()
+            raise
+
+        self._body_offset = len(header_line)
+        self.source_hash: Optional[str] = header.get('source_sha256')
+        self.metadata: Dict[str, Any] = header.get('metadata', {})
+        self._sectors: Dict[str, Dict[str, Any]] = header['sectors']
+        self._catalog_span: Dict[str, int] = header['catalog']
+
+    @staticmethod
+    def read_source_hash(path: str) -> Optional[str]:
+        """
+        Return the objects.json SHA-256 recorded in a sharded file's header.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the header is not valid JSON
+        """
+        with open(path, 'rb') as f:
+            return json.loads(f.readline()).get('source_sha256')
+
+    def sector_ids(self) -> List[str]:
+        return list(self._sectors.keys())
+
+    def summary(self, sector: str) -> Optional[Dict[str, Any]]:
+        return self._sectors.get(sector)
+
+    def load_sector(self, sector: str) -> Optional[SectorIndex]:
+        entry = self._sectors.get(sector)
+        if entry is None:
+            return None
+        return SectorIndex(sector, self._read_record(entry['offset'], entry['length']))
+
+    def catalog(self) -> Iterator[CatalogRow]:
+        for row in self._read_record(self._catalog_span['offset'], self._catalog_span['length']):
+            yield tuple(row)
+
+    def _read_record(self, offset: int, length: int) -> Any:
+        with self._lock:
+            if self._file.closed:
+                raise OSError(f"Star Charts shard file is closed: {self.path}")
+            self._file.seek(self._body_offset + offset)
+            record = self._file.read(length)
+        return json.loads(record)
+
+    def close(self) -> None:
+        """Close the database file; the adapter closes replaced snapshots once they are retired."""
+        self._file.close()
+
+    def __del__(self):
+        file = getattr(self, '_file', None)
+        if file is not None:
+            file.close()
+
+
+def _atomic_write(path: str, chunks: List[bytes]) -> None:
+    """
+    Write a file by writing a temporary file in the same directory and renaming it into place.
+
+    Readers never observe a partial file, and a crash leaves the old file intact.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.objects-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.writelines(chunks)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json_database(database: Dict[str, Any], path: str) -> None:
+    """
+    Write a database as compact objects.json, atomically.
+
+    Args:
+        database (dict): Database in the objects.json structure
+        path (str): Destination path
+    """
+    _atomic_write(path, [json.dumps(database, separators=(',', ':')).encode('utf-8')])
+    logger.info(f"Wrote Star Charts database: {path} ({len(database.get('sectors', {}))} sectors)")
+
+
+def write_sharded_database(database: Dict[str, Any], path: str, source_hash: Optional[str] = None) -> None:
+    """
+    Write a database in the sharded layout.
+
+    The file is written to a temporary name in the target directory and
+    renamed into place, so readers never observe a partial file.
+
+    Args:
+        database (dict): Database in the objects.json structure
+        path (str): Destination path of the sharded file
+        source_hash (str, optional): file_sha256() of the objects.json the
+            database was read from or written to
+    """
+    body: List[bytes] = []
+    offset = 0
+    sectors: Dict[str, Dict[str, Any]] = {}
+    catalog: List[CatalogRow] = []
+
+    for sector_id, sector_data in database.get('sectors', {}).items():
+        record = json.dumps(sector_data, separators=(',', ':')).encode('utf-8') + b'\n'
+        index = SectorIndex(sector_id, sector_data)
+        sectors[sector_id] = {
+            'offset': offset,
+            'length': len(record),
+            'digest': hashlib.sha1(record).hexdigest()[:16],
+            **index.summary()
+        }
+        catalog.extend(index.catalog())
+        body.append(record)
+        offset += len(record)
+
+    catalog_record = json.dumps(catalog, separators=(',', ':')).encode('utf-8') + b'\n'
+    header = {
+        'format': SHARDED_FORMAT,
+        'version': SHARDED_FORMAT_VERSION,
+        'metadata': database.get('metadata', {}),
+        'sectors': sectors,
+        'catalog': {'offset': offset, 'length': len(catalog_record)},
+    }
+    if source_hash:
+        header['source_sha256'] = source_hash
+    header_line = json.dumps(header, separators=(',', ':')).encode('utf-8') + b'\n'
+
+    _atomic_write(path, [header_line, *body, catalog_record])
+
+    logger.info(f"Wrote sharded Star Charts database: {path} ({len(sectors)} sectors)")
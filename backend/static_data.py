@@ -0,0 +1,262 @@
+"""
+Precompressed Static Data
+=========================
+
+Build step and lookup for static JSON datasets (Star Charts database,
+reference data) served with long-lived caching.
+
+build_static_data() copies every dataset into the build directory under a
+content-hashed name (e.g. objects.3f2a9c1b7d4e.json) next to gzip and, when
+the optional brotli package is installed, brotli variants. A manifest maps
+each logical dataset name to its current hashed file. Because a file name
+changes whenever its content does, the files can be served as immutable and
+browsers download each dataset once per version.
+
+The build runs from scripts/build_static_data.py, the Star Charts generator
+and the Docker image build; create_app() also runs it when no manifest
+exists yet (ensure_static_data), so a fresh checkout serves hashed URLs.
+
+StaticDataManifest reads the manifest for the serving routes and picks up a
+rebuilt manifest without a restart.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.constants import STATIC_DATA_RELOAD_INTERVAL
+from backend.file_monitor import ChangeMonitor, file_signature
+
+try:
+    import brotli
+except ImportError:  # Optional dependency: only gzip variants are built without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+STATIC_DATA_BUILD_DIR = PROJECT_ROOT / 'data' / 'build' / 'static_data'
+MANIFEST_FILENAME = 'manifest.json'
+
+# Hex digits of the SHA-256 content hash used in file names
+CONTENT_HASH_LENGTH = 12
+
+# Content-Encoding token -> file suffix, in server preference order
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+# Directory of the JSON files the browser loads, published from data/ by the generators
+FRONTEND_DATA_DIR = PROJECT_ROOT / 'frontend' / 'static' / 'data'
+
+
+def default_datasets() -> Dict[str, Path]:
+    """Return the logical name and source file of every published dataset."""
+    # Browser datasets are built from the copies the frontend serves
+    datasets = {
+        'star_charts/objects': FRONTEND_DATA_DIR / 'star_charts' / 'objects.json',
+        'starter_system_infrastructure': FRONTEND_DATA_DIR / 'starter_system_infrastructure.json',
+    }
+    for path in sorted((PROJECT_ROOT / 'data' / 'reference').glob('*.json')):
+        datasets[f'reference/{path.stem}'] = path
+    return datasets
+
+
+def _write_file(path: Path, content: bytes) -> None:
+    """Write a file atomically via a temporary file in the same directory."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.static-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def build_static_data(datasets: Optional[Dict[str, Path]] = None,
+                      output_dir: Path = STATIC_DATA_BUILD_DIR) -> Dict[str, Any]:
+    """
+    Write hashed and precompressed copies of the datasets plus a manifest.
+
+    Unchanged datasets keep their existing files; files no longer referenced
+    by the manifest are removed.
+
+    Args:
+        datasets (dict, optional): Logical name -> source path, defaults to default_datasets()
+        output_dir (Path): Build directory
+
+    Returns:
+        dict: The written manifest
+    """
+    datasets = datasets if datasets is not None else default_datasets()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest: Dict[str, Any] = {}
+    for name, source in datasets.items():
+        source = Path(source)
+        if not source.exists():
+            logger.warning(f"Static dataset source not found: {source}")
+            continue
+
+        content = source.read_bytes()
+        content_hash = hashlib.sha256(content).hexdigest()[:CONTENT_HASH_LENGTH]
+        filename = f"{source.stem}.{content_hash}{source.suffix}"
+
+        variants = {None: content, 'gzip': gzip.compress(content, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants['br'] = brotli.compress(content, quality=11)
+
+        for encoding, data in variants.items():
+            path = output_dir / (filename + ENCODING_SUFFIXES.get(encoding, ''))
+            if not path.exists():
+                _write_file(path, data)
+
+        manifest[name] = {
+            'file': filename,
+            'hash': content_hash,
+            'size': len(content),
+            'encodings': {encoding: len(data) for encoding, data in variants.items() if encoding}
+        }
+
+    _write_file(output_dir / MANIFEST_FILENAME, json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+    _remove_unreferenced_files(output_dir, manifest)
+    logger.info(f"Built {len(manifest)} static datasets in {output_dir}")
+    return manifest
+
+
+def ensure_static_data(output_dir: Path = STATIC_DATA_BUILD_DIR) -> bool:
+    """
+    Build the static data if the build directory has no manifest yet.
+
+    Args:
+        output_dir (Path): Build directory
+
+    Returns:
+        bool: True if a manifest exists afterwards
+    """
+    if (Path(output_dir) / MANIFEST_FILENAME).exists():
+        return True
+    try:
+        build_static_data(output_dir=output_dir)
+    except OSError as e:
+        logger.warning(f"Could not build static data in {output_dir}, serving uncached URLs: {e}")
+        return False
+    return True
+
+
+def _remove_unreferenced_files(output_dir: Path, manifest: Dict[str, Any]) -> None:
+    """Delete hashed files of older dataset versions."""
+    keep = {MANIFEST_FILENAME}
+    for entry in manifest.values():
+        keep.add(entry['file'])
+        keep.update(entry['file'] + ENCODING_SUFFIXES[encoding] for encoding in entry['encodings'])
+
+    for path in output_dir.iterdir():
+        if path.is_file() and path.name not in keep and not path.name.startswith('.'):
+            path.unlink()
+
+
+def select_encoding(accept_encoding: Optional[str], available: List[str]) -> Optional[str]:
+    """
+    Pick the Content-Encoding to serve from an Accept-Encoding header.
+
+    Args:
+        accept_encoding (str, optional): Accept-Encoding request header
+        available (list): Encodings prebuilt for the file
+
+    Returns:
+        str or None: Chosen encoding, or None to serve the identity file
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(','):
+        token, _, params = part.strip().partition(';')
+        token = token.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            weights[token] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in ENCODING_SUFFIXES:
+        if encoding not in available:
+            continue
+        quality = weights.get(encoding, weights.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class StaticDataManifest:
+    """
+    Read access to the built manifest, reloaded when the build runs again.
+    """
+
+    def __init__(self, build_dir: Path = STATIC_DATA_BUILD_DIR,
+                 reload_interval: Optional[float] = STATIC_DATA_RELOAD_INTERVAL):
+        """
+        Initialize the manifest reader.
+
+        Args:
+            build_dir (Path): Directory written by build_static_data()
+            reload_interval (float, optional): Minimum seconds between
+                manifest change checks, or None to disable reloads
+        """
+        self.build_dir = Path(build_dir)
+        self._entries: Dict[str, Any] = {}
+        self._by_file: Dict[str, Dict[str, Any]] = {}
+        self._signature = None
+        self._loaded = False
+        self._monitor = ChangeMonitor(reload_interval)
+
+    def entries(self) -> Dict[str, Any]:
+        """Return the manifest: logical dataset name -> entry."""
+        self._refresh()
+        return self._entries
+
+    def find_file(self, filename: str) -> Optional[Dict[str, Any]]:
+        """Return the manifest entry that owns a hashed file name, if any."""
+        self._refresh()
+        return self._by_file.get(filename)
+
+    def _refresh(self) -> None:
+        if self._loaded and not self._monitor.due():
+            return
+        if not self._monitor.try_begin_reload():
+            return
+        try:
+            path = self.build_dir / MANIFEST_FILENAME
+            signature = file_signature(path)
+            if self._loaded and signature == self._signature:
+                return
+
+            entries = {}
+            if signature is not None:
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        entries = json.load(f)
+                except (IOError, OSError, json.JSONDecodeError) as e:
+                    logger.error(f"Error loading static data manifest: {e}")
+                    return
+
+            self._entries = entries
+            self._by_file = {entry['file']: entry for entry in entries.values()}
+            self._signature = signature
+            self._loaded = True
+        finally:
+            self._monitor.end_reload()
@@ -0,0 +1,82 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from backend.star_charts_binary import BinaryStarChartsSource
+from backend.star_charts_storage import ShardedStarChartsSource
+
+SCRIPT = Path(__file__).resolve().parents[2] / 'scripts' / 'generate_star_charts_db.py'
+
+
+@pytest.fixture(scope='module')
+def generator():
+    """The generator script, imported as a module."""
+    spec = importlib.util.spec_from_file_location('generate_star_charts_db', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so the worker processes can unpickle generate_sector
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules[spec.name]
+
+
+def _shard_digests(output_dir):
+    with open(output_dir / 'objects.shards.jsonl', 'rb') as f:
+        header = json.loads(f.readline())
+    return {sector: entry['digest'] for sector, entry in header['sectors'].items()}
+
+
+def test_string_seeds_resolve_the_same_in_every_process():
+    """The base seed of a string universe seed does not depend on PYTHONHASHSEED."""
+    code = ('import importlib.util, sys;'
+            f'spec = importlib.util.spec_from_file_location("g", {str(SCRIPT)!r});'
+            'g = importlib.util.module_from_spec(spec); spec.loader.exec_module(g);'
+            'sys.stderr.write(str(g.resolve_universe_base_seed("andromeda")))')
+    seeds = set()
+    for hash_seed in ('1', '2'):
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+        result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+        seeds.add(result.stderr.strip().splitlines()[-1])
+    assert len(seeds) == 1
+
+
+def test_incremental_build_regenerates_only_stale_sectors(generator, tmp_path, monkeypatch):
+    """An incremental run reuses unchanged sectors and writes the same sector bytes as a full build."""
+    full_dir, incremental_dir = tmp_path / 'full', tmp_path / 'incremental'
+    assert generator.main(workers=2, output_dir=full_dir, publish=False)
+    assert generator.main(output_dir=incremental_dir, publish=False)
+    assert _shard_digests(incremental_dir) == _shard_digests(full_dir)
+
+    # Invalidate one sector, then rebuild incrementally
+    database_path = incremental_dir / 'objects.json'
+    database = json.loads(database_path.read_text())
+    database['metadata']['sector_hashes']['B3'] = 'stale'
+    database['sectors']['B3'] = {}
+    database_path.write_text(json.dumps(database))
+
+    generated = []
+    generate_sector = generator.generate_sector
+    monkeypatch.setattr(generator, 'generate_sector',
+                        lambda sector, base_seed: generated.append(sector) or generate_sector(sector, base_seed))
+    assert generator.main(incremental=True, output_dir=incremental_dir, publish=False)
+    assert generated == ['B3']
+
+    full = json.loads((full_dir / 'objects.json').read_text())
+    rebuilt = json.loads(database_path.read_text())
+    assert rebuilt['sectors'] == full['sectors']
+    assert rebuilt['metadata']['sector_hashes'] == full['metadata']['sector_hashes']
+    assert _shard_digests(incremental_dir) == _shard_digests(full_dir)
+    for source_class, name in ((ShardedStarChartsSource, 'objects.shards.jsonl'), (BinaryStarChartsSource, 'objects.bin')):
+        source = source_class(str(incremental_dir / name))
+        assert source.load_sector('B3').ids == source_class(str(full_dir / name)).load_sector('B3').ids
+
+    # Nothing stale: the database is left untouched
+    before = database_path.read_bytes()
+    assert generator.main(incremental=True, output_dir=incremental_dir, publish=False)
+    assert generated == ['B3']
+    assert database_path.read_bytes() == before
@@ -0,0 +1,555 @@
+import json
+import threading
+import time
+
+import pytest
+
+from backend.mission_system import Mission, MissionManager, MissionState, Objective
+from backend.mission_system.mission import STORAGE_FORMAT
+from backend.mission_system.atomic_io import DirectorySyncGroup, atomic_write_json
+from backend.mission_system.job_queue import MissionJobQueue
+from backend.mission_system.persistence_queue import MissionWriteBehindQueue
+from backend.mission_system.storage_manager import JSONFileStorage, MissionStorageManager, SQLiteStorage
+
+
+def _create_mission(mission_id='mission_test'):
+    mission = Mission(mission_id, 'Test Mission', 'Persistence test', mission_type='elimination')
+    mission.add_objective(Objective('obj_1', 'Destroy a target'))
+    return mission
+
+
+def test_write_behind_coalesces_until_flush(tmp_path):
+    """Repeated saves of one mission are written once, on flush."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_flush_interval': 3600})
+    mission = _create_mission()
+    mission_file = tmp_path / 'active' / f'{mission.id}.json'
+
+    for title in ('First', 'Second', 'Third'):
+        mission.title = title
+        assert manager.save_mission(mission)
+    assert not mission_file.exists()
+
+    assert manager.flush() == 1
+    assert json.loads(mission_file.read_text())['title'] == 'Third'
+    assert manager.save_queue.stats['coalesced'] == 2
+    manager.shutdown()
+
+
+def test_queued_save_is_a_snapshot_of_the_mission(tmp_path):
+    """Changes made after save_mission are not written by the later flush."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_flush_interval': 3600})
+    mission = _create_mission()
+    mission.custom_fields['kills_made'] = 1
+    manager.save_mission(mission)
+    mission.custom_fields['kills_made'] = 99
+
+    manager.flush()
+    written = json.loads((tmp_path / 'active' / f'{mission.id}.json').read_text())
+    assert written['custom_fields']['kills_made'] == 1
+    manager.shutdown()
+
+
+def test_writer_errors_keep_missions_queued_and_thread_alive(tmp_path):
+    """A write that raises stays pending and the background writer keeps running."""
+    calls = []
+
+    def flaky_writer(target_dir, mission_data, sync_group=None):
+        calls.append(mission_data['id'])
+        if len(calls) == 1:
+            raise RuntimeError('unexpected writer failure')
+
+    queue = MissionWriteBehindQueue(flaky_writer, flush_interval=0.01)
+    queue.enqueue('first', str(tmp_path), {'id': 'first'})
+    deadline = time.time() + 5
+    while queue.pending_count and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert queue.pending_count == 0 and calls[:2] == ['first', 'first']
+    assert queue._thread.is_alive()
+    queue.enqueue('second', str(tmp_path), {'id': 'second'})
+    queue.close()
+    assert 'second' in calls and queue.stats['failures'] == 1
+
+
+def test_sync_durability_writes_on_save(tmp_path):
+    """In sync mode the file is on disk when save_mission returns."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_durability': 'sync'})
+    mission = _create_mission()
+
+    assert manager.save_mission(mission)
+    assert (tmp_path / 'active' / f'{mission.id}.json').exists()
+    assert manager.save_queue.pending_count == 0
+
+
+def test_atomic_write_replaces_file_without_leftovers(tmp_path):
+    """Atomic writes swap in complete files and leave no temporary files behind."""
+    target = tmp_path / 'mission.json'
+    target.write_text('{"truncated": ')
+    group = DirectorySyncGroup()
+
+    atomic_write_json(str(target), {'id': 'mission', 'state': 'Accepted'}, sync_group=group)
+    assert json.loads(target.read_text()) == {'id': 'mission', 'state': 'Accepted'}
+    assert [path.name for path in tmp_path.iterdir()] == ['mission.json']
+    assert group.commit() == 1
+
+
+def test_indexes_follow_state_changes(tmp_path):
+    """Indexed queries see state changes made through Mission.set_state and botch."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_durability': 'sync'})
+    delivery = Mission('delivery_1', 'Delivery', 'Haul cargo', mission_type='delivery')
+    patrol = Mission('patrol_1', 'Patrol', 'Clear the sector', mission_type='elimination')
+    for mission in (delivery, patrol):
+        mission.set_state(MissionState.MENTIONED)
+        manager.save_mission(mission)
+
+    assert manager.get_active_missions_by_type('delivery') == []
+    assert manager.accept_mission('delivery_1')
+    assert manager.get_active_missions_by_type('delivery') == [delivery]
+    assert manager.get_missions_by_type_and_states(
+        'delivery', [MissionState.ACCEPTED, MissionState.ACHIEVED]) == [delivery]
+    assert manager.get_available_missions() == [patrol]
+
+    delivery.botch()
+    assert manager.get_active_missions_by_type('delivery') == []
+    assert manager.get_stats()['botched_missions'] == 1
+
+
+def test_sqlite_storage_pools_wal_connections_per_thread(tmp_path):
+    """Each thread reuses one WAL-mode connection and sees committed saves."""
+    storage = SQLiteStorage({'sqlite_path': str(tmp_path / 'missions.db')})
+    mission = _create_mission()
+    assert storage.save_mission(mission.to_dict())
+
+    conn = storage._connection()
+    assert storage._connection() is conn
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+    loaded = []
+    reader = threading.Thread(target=lambda: loaded.append(storage.load_mission(mission.id)))
+    reader.start()
+    reader.join()
+    assert loaded[0]['objectives'][0]['id'] == 'obj_1'
+    assert conn.execute('SELECT COUNT(*) FROM objectives').fetchone()[0] == 1
+    storage.close()
+
+
+@pytest.mark.parametrize('backend_class', [JSONFileStorage, SQLiteStorage])
+def test_bulk_save_load_and_delete(tmp_path, backend_class):
+    """Bulk operations round-trip many missions and skip unknown IDs."""
+    storage = backend_class({'data_directory': str(tmp_path), 'sqlite_path': str(tmp_path / 'missions.db')})
+    missions = [_create_mission(f'mission_{i}').to_dict() for i in range(5)]
+
+    assert storage.save_missions(missions) == 5
+    loaded = list(storage.load_missions(['mission_1', 'mission_3', 'missing']))
+    assert sorted(m['id'] for m in loaded) == ['mission_1', 'mission_3']
+
+    assert storage.delete_missions(['mission_0', 'mission_1', 'missing']) == 2
+    assert sorted(m['id'] for m in storage.load_all_missions()) == ['mission_2', 'mission_3', 'mission_4']
+
+
+@pytest.mark.parametrize('backend_class', [JSONFileStorage, SQLiteStorage])
+def test_query_page_filters_and_follows_cursor(tmp_path, backend_class):
+    """Storage queries filter natively and continue pages with the returned cursor."""
+    storage = MissionStorageManager({'data_directory': str(tmp_path), 'sqlite_path': str(tmp_path / 'missions.db')})
+    storage.storage_backend = backend_class(storage.config)
+    missions = [_create_mission(f'mission_{i}').to_dict() for i in range(5)]
+    for i, mission_data in enumerate(missions):
+        mission_data['location'] = 'terra_prime' if i % 2 == 0 else 'luna'
+    storage.save_missions(missions)
+
+    first = storage.query_page({'location': 'terra_prime'}, sort_by='id', limit=2)
+    assert [m['id'] for m in first['missions']] == ['mission_0', 'mission_2']
+    assert first['total'] == 3
+
+    second = storage.query_page({'location': 'terra_prime'}, sort_by='id', limit=2, cursor=first['next_cursor'])
+    assert [m['id'] for m in second['missions']] == ['mission_4']
+    assert second['next_cursor'] is None
+
+    with pytest.raises(ValueError):
+        storage.query_page({'title': 'Test Mission'})
+
+
+def test_manager_query_uses_indexes_and_cursor(tmp_path):
+    """In-memory queries page through index matches in sort order."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_durability': 'sync'})
+    for i in range(3):
+        mission = _create_mission(f'mission_{i}')
+        mission.set_state(MissionState.MENTIONED)
+        manager.save_mission(mission)
+
+    page = manager.query_missions({'state': 'Mentioned'}, sort_by='id', limit=2)
+    assert [m.id for m in page['missions']] == ['mission_0', 'mission_1']
+    rest = manager.query_missions({'state': MissionState.MENTIONED}, sort_by='id', limit=2,
+                                  cursor=page['next_cursor'])
+    assert [m.id for m in rest['missions']] == ['mission_2']
+
+
+def test_manifest_tracks_saves_and_external_writes(tmp_path):
+    """The JSON manifest indexes saved missions and picks up files written by other writers."""
+    storage = JSONFileStorage({'data_directory': str(tmp_path)})
+    storage.save_missions([_create_mission('mission_a').to_dict()])
+    assert storage.manifest.entries()['mission_a']['directory'] == 'active'
+
+    external = _create_mission('mission_b')
+    external.set_state(MissionState.MENTIONED)
+    external.save_to_file(str(tmp_path / 'completed'))
+
+    reopened = JSONFileStorage({'data_directory': str(tmp_path)})
+    assert reopened.manifest.path_for('mission_b') == str(tmp_path / 'completed' / 'mission_b.json')
+    assert [m['id'] for m in reopened.query_missions({'state': 'Mentioned'})] == ['mission_b']
+
+    assert reopened.delete_mission('mission_a')
+    assert sorted(reopened.manifest.entries()) == ['mission_b']
+
+
+def test_lazy_loading_hydrates_on_access_and_evicts_completed(tmp_path):
+    """Lazy managers start from index metadata and keep only hot missions resident."""
+    writer = MissionManager(data_directory=str(tmp_path), config={'save_durability': 'sync'})
+    for i in range(3):
+        mission = _create_mission(f'mission_{i}')
+        mission.set_state(MissionState.ACCEPTED)
+        writer.save_mission(mission)
+
+    manager = MissionManager(data_directory=str(tmp_path),
+                             config={'lazy_loading': True, 'mission_cache_size': 1, 'save_durability': 'sync'})
+    assert len(manager.missions) == 3
+    assert manager.missions.resident_count == 0
+    assert manager.get_stats()['active_missions'] == 3
+
+    page = manager.query_missions({'state': 'Accepted'}, sort_by='id', limit=1)
+    assert [m.id for m in page['missions']] == ['mission_0']
+    assert manager.missions.resident_count == 1
+
+    for mission_id in ('mission_0', 'mission_1'):
+        mission = manager.get_mission(mission_id)
+        mission.set_state(MissionState.COMPLETED)
+        manager.save_mission(mission)
+    assert manager.missions.resident_count == 1
+    assert manager.get_mission('mission_0').state == MissionState.COMPLETED
+
+
+def test_journal_appends_deltas_and_replays_on_start(tmp_path):
+    """Journaled saves append small deltas that a restarted manager replays into the files."""
+    config = {'journal_enabled': True, 'journal_snapshot_interval': 100}
+    manager = MissionManager(data_directory=str(tmp_path), config=config)
+    mission = _create_mission()
+    mission.set_state(MissionState.ACCEPTED)
+    manager.save_mission(mission)
+
+    mission.custom_fields['enemies_destroyed'] = 1
+    mission.objectives[0].achieve()
+    manager.save_mission(mission)
+
+    records = [json.loads(line) for line in (tmp_path / 'journal' / 'missions.ndjson').read_text().splitlines()]
+    assert 'doc' in records[0]
+    assert records[1]['custom_fields'] == {'set': {'enemies_destroyed': 1}, 'unset': []}
+    assert records[1]['objectives']['obj_1']['is_achieved'] is True
+    assert not (tmp_path / 'active' / f'{mission.id}.json').exists()
+
+    # Simulate a crash: no snapshot, the journal is the only copy
+    manager.journal.close()
+    restarted = MissionManager(data_directory=str(tmp_path), config=config)
+    replayed = restarted.get_mission(mission.id)
+    assert replayed.custom_fields == {'enemies_destroyed': 1}
+    assert replayed.objectives[0].is_achieved
+    assert (tmp_path / 'journal' / 'missions.ndjson').read_text() == ''
+    assert len(list((tmp_path / 'journal').glob('missions.*.ndjson'))) == 1
+    restarted.shutdown()
+
+
+def test_compact_storage_format_round_trips_and_reads_verbose_files(tmp_path):
+    """Mission files use the compact format; legacy verbose files still load."""
+    mission = _create_mission()
+    mission.set_state(MissionState.ACCEPTED)
+    mission.objectives[0].achieve()
+    path = mission.save_to_file(str(tmp_path))
+
+    stored = json.loads(open(path).read())
+    assert stored['format'] == STORAGE_FORMAT
+    assert stored['state'] == MissionState.ACCEPTED.ordinal
+    assert 'progress' not in stored and '\n' not in open(path).read()
+    assert Mission.load_from_file(path).to_dict() == mission.to_dict()
+
+    legacy = tmp_path / 'legacy.json'
+    legacy.write_text(json.dumps(mission.to_dict(), indent=2))
+    assert Mission.load_from_file(str(legacy)).to_dict() == mission.to_dict()
+
+    storage = JSONFileStorage({'data_directory': str(tmp_path / 'storage')})
+    storage.save_mission(mission.to_dict())
+    assert storage.load_mission(mission.id) == mission.to_dict()
+
+
+def test_loaded_missions_are_slotted_and_share_interned_strings():
+    """Missions carry no per-instance dict and share one copy of repeated type strings."""
+    first = Mission.from_dict(json.loads(json.dumps(_create_mission('mission_1').to_storage_dict())))
+    second = Mission.from_dict(json.loads(json.dumps(_create_mission('mission_2').to_storage_dict())))
+
+    assert not hasattr(first, '__dict__') and not hasattr(first.objectives[0], '__dict__')
+    assert first.mission_type is second.mission_type
+    assert first.objectives[0].id is second.objectives[0].id
+    with pytest.raises(AttributeError):
+        first.unknown_attribute = True
+
+
+def test_progress_counters_follow_objective_changes():
+    """Progress and completion use counters kept current by add_objective and achieve."""
+    mission = _create_mission()
+    mission.add_objective(Objective('obj_2', 'Optional scan', is_optional=True))
+    assert mission.get_progress()['required_objectives'] == 1
+    assert not mission.check_completion()
+
+    mission.objectives[0].achieve()
+    mission.objectives[0].achieve()
+    progress = mission.get_progress()
+    assert (progress['achieved_objectives'], progress['achieved_required']) == (1, 1)
+    assert progress['completion_percentage'] == 100
+    assert mission.check_completion()
+
+    reloaded = Mission.from_dict(mission.to_storage_dict())
+    assert reloaded.get_progress() == progress
+
+
+def test_game_events_reach_only_subscribed_missions(tmp_path):
+    """Events are routed by (event type, target) to accepted missions and progress their objectives."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_durability': 'sync'})
+    missions = {}
+    for mission_id, enemy_type in (('hunt_pirates', 'pirate'), ('hunt_drones', 'drone')):
+        mission = Mission(mission_id, 'Hunt', 'Clear the sector', mission_type='elimination')
+        mission.add_objective(Objective('1', f'Eliminate 2 {enemy_type} ships'))
+        mission.custom_fields.update({'target_enemy_type': enemy_type, 'enemy_count': 2})
+        mission.set_state(MissionState.MENTIONED)
+        manager.save_mission(mission)
+        missions[mission_id] = mission
+
+    event = {'type': 'enemy_destroyed', 'enemy_type': 'pirate'}
+    assert manager.get_event_subscribers(event) == []
+
+    for mission_id in missions:
+        manager.accept_mission(mission_id)
+    assert manager.process_game_event(event) == [missions['hunt_pirates']]
+    assert missions['hunt_pirates'].objectives[0].progress == 0.5
+    assert missions['hunt_drones'].custom_fields.get('kills_made') is None
+
+    missions['hunt_pirates'].botch()
+    assert manager.process_game_event(event) == []
+    assert manager.event_index.subscription_count() == 1
+
+
+def test_subscriptions_follow_unsaved_target_and_objective_changes(tmp_path):
+    """Changing custom_fields targets or adding objectives reindexes without a save."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_flush_interval': 3600})
+    mission = Mission('hunt', 'Hunt', 'Clear the sector', mission_type='elimination')
+    mission.custom_fields.update({'target_enemy_type': 'pirate', 'enemy_count': 2})
+    mission.set_state(MissionState.ACCEPTED)
+    manager.save_mission(mission)
+
+    mission.custom_fields['target_enemy_type'] = 'drone'
+    assert manager.get_event_subscribers({'type': 'enemy_destroyed', 'enemy_type': 'pirate'}) == []
+    drone_kill = {'type': 'enemy_destroyed', 'enemy_type': 'drone'}
+    assert manager.get_event_subscribers(drone_kill) == [mission]
+
+    mission.add_objective(Objective('1', 'Eliminate 2 drones'))
+    manager.process_game_event(drone_kill)
+    assert mission.objectives[0].progress == 0.5
+    assert type(mission.to_storage_dict()['custom_fields']) is dict
+    manager.shutdown()
+
+
+def test_event_batch_coalesces_saves_and_reports_hooks(tmp_path):
+    """A batch of events is applied in order with one save per mission and per-event hooks."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_flush_interval': 3600})
+    mission = Mission('hunt', 'Hunt', 'Clear the sector', mission_type='elimination')
+    mission.add_objective(Objective('1', 'Eliminate 3 pirate ships'))
+    mission.custom_fields.update({'target_enemy_type': 'pirate', 'enemy_count': 3})
+    mission.set_state(MissionState.ACCEPTED)
+    manager.save_mission(mission)
+    enqueued = manager.save_queue.stats['enqueued']
+
+    kill = {'type': 'enemy_destroyed', 'enemy_type': 'pirate'}
+    results = manager.process_game_events([kill, {'type': 'cargo_loaded', 'cargo_type': 'ore'}, kill])
+
+    assert [len(result['updated_missions']) for result in results] == [1, 0, 1]
+    assert mission.custom_fields['kills_made'] == 2
+    assert results[0]['hooks'] == []
+    assert manager.save_queue.stats['enqueued'] == enqueued + 1
+
+    final = manager.process_game_events([kill])
+    assert mission.state == MissionState.COMPLETED
+    assert [hook['type'] for hook in final[0]['hooks']] == ['objective_complete_effects', 'mission_complete_effects']
+    manager.shutdown()
+
+
+def test_single_event_fires_the_same_triggers_as_a_batch(tmp_path):
+    """process_game_event fires objective_completed and mission_completed like the batch path."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_flush_interval': 3600})
+    fired = []
+    manager.trigger_system.add_listener(lambda event_type, mission, context, hooks: fired.append(event_type))
+    mission = Mission('hunt', 'Hunt', 'Clear the sector', mission_type='elimination')
+    mission.add_objective(Objective('1', 'Eliminate a pirate ship'))
+    mission.custom_fields.update({'target_enemy_type': 'pirate', 'enemy_count': 1})
+    mission.set_state(MissionState.ACCEPTED)
+    manager.save_mission(mission)
+
+    assert manager.process_game_event({'type': 'enemy_destroyed', 'enemy_type': 'pirate'}) == [mission]
+    assert mission.state == MissionState.COMPLETED
+    assert [event for event in fired if event != 'mission_state_changed'] == [
+        'objective_completed', 'mission_completed', 'objective_progress'
+    ]
+    manager.shutdown()
+
+
+def test_job_queue_orders_jobs_per_key_and_retries():
+    """Jobs of one key run in submission order; a failing job is retried before it is reported."""
+    queue = MissionJobQueue(workers=2, max_retries=1, retry_delay=0)
+    runs = []
+    attempts = []
+
+    def record(key, n):
+        runs.append((key, n))
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError('transient')
+        return 'ok'
+
+    for n in range(20):
+        queue.submit('a' if n % 2 else 'b', record, 'a' if n % 2 else 'b', n)
+    retried = queue.submit('c', flaky)
+    assert queue.wait(timeout=5)
+
+    assert [n for key, n in runs if key == 'a'] == list(range(1, 20, 2))
+    assert [n for key, n in runs if key == 'b'] == list(range(0, 20, 2))
+    assert retried.result == 'ok' and retried.attempts == 2
+    assert queue.stats['retries'] == 1 and queue.stats['failed'] == 0
+    queue.close()
+
+
+def test_botch_cascade_runs_on_job_queue(tmp_path):
+    """Botching returns before its cascade has run; waiting on the queue observes the effects."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_durability': 'sync'})
+    for mission_id in ('alliance_escort_001', 'alliance_patrol_001'):
+        mission = Mission(mission_id, 'Alliance', 'Convoy duty', faction='terran_republic_alliance')
+        mission.set_state(MissionState.MENTIONED)
+        manager.save_mission(mission)
+    manager.accept_mission('alliance_escort_001')
+
+    assert manager.botch_mission('alliance_escort_001', 'convoy_destroyed')
+    assert manager.job_queue.wait(timeout=5)
+    assert manager.get_mission('alliance_patrol_001').is_botched
+    manager.shutdown()
+
+
+def test_cascade_saves_are_not_deferred_into_a_concurrent_batch(tmp_path):
+    """A cascade running during a request's deferred_saves() block saves at once; the batch still coalesces."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_flush_interval': 3600})
+    manager.cascade_handler.register_cascade_rule(
+        'convoy', {'type': 'botch_related_missions', 'data': {'mission_ids': ['patrol']}})
+    for mission_id in ('convoy', 'patrol'):
+        mission = Mission(mission_id, mission_id, 'Convoy duty')
+        mission.set_state(MissionState.MENTIONED)
+        manager.save_mission(mission)
+    manager.flush()
+
+    with manager.deferred_saves():
+        assert manager.botch_mission('convoy', 'ambush')
+        assert manager.job_queue.wait(timeout=5)
+        # The worker's save was queued, the request's save is still held by the batch
+        assert manager.save_queue.is_pending('patrol')
+        assert not manager.save_queue.is_pending('convoy')
+        assert manager.get_mission('patrol').is_botched
+        assert manager.get_missions_by_type_and_states('exploration', [MissionState.MENTIONED]) == []
+
+    assert manager.save_queue.is_pending('convoy')
+    manager.shutdown()
+
+
+def test_cascade_closure_follows_shared_subgraphs_and_cycles(tmp_path):
+    """Botch cascades are transitive, visit each mission once and terminate on cyclic rules."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_durability': 'sync', 'job_workers': 0})
+    cascade = manager.cascade_handler
+    for source, related in (('a', ['b', 'c']), ('b', ['d']), ('c', ['d']), ('d', ['a'])):
+        cascade.register_cascade_rule(source, {'type': 'botch_related_missions', 'data': {'mission_ids': related}})
+    cascade.register_cascade_rule('d', {'type': 'update_shared_data', 'data': {'key': 'alarm', 'value': 'raised'}})
+    assert cascade.cycles == [['d', 'a', 'b', 'd']]
+    assert [entry[0] for entry in cascade.get_botch_closure('a')] == ['b', 'c', 'd']
+
+    for mission_id in 'abcd':
+        mission = Mission(mission_id, mission_id, 'Linked contract')
+        mission.set_state(MissionState.MENTIONED)
+        manager.save_mission(mission)
+    manager.get_mission('c').botch()
+
+    preview = cascade.preview_botch('a')
+    assert [entry['id'] for entry in preview['botched']] == ['b', 'd']
+    assert preview['effects'] == [{'mission_id': 'd', 'type': 'update_shared_data',
+                                   'data': {'key': 'alarm', 'value': 'raised'}}]
+    assert not manager.get_mission('b').is_botched
+
+    assert manager.botch_mission('a', 'sabotage')
+    assert all(manager.get_mission(mission_id).is_botched for mission_id in 'abcd')
+    assert cascade.get_shared_data('alarm') == 'raised'
+
+
+def test_event_stream_receives_state_changes_progress_and_hooks(tmp_path):
+    """Fired triggers reach the event stream in order and readers resume from an event ID."""
+    manager = MissionManager(data_directory=str(tmp_path), config={'save_durability': 'sync', 'stream_buffer_size': 4})
+    stream = manager.event_stream
+    mission = Mission('hunt', 'Hunt', 'Clear the sector', mission_type='elimination')
+    mission.add_objective(Objective('1', 'Eliminate 2 pirate ships'))
+    mission.custom_fields.update({'target_enemy_type': 'pirate', 'enemy_count': 2})
+    mission.set_state(MissionState.MENTIONED)
+    manager.save_mission(mission)
+    start = stream.last_event_id
+
+    manager.accept_mission('hunt')
+    manager.process_game_event({'type': 'enemy_destroyed', 'enemy_type': 'pirate'})
+    events, reset, last_id = stream.events_after(start, timeout=0)
+
+    assert [event.event for event in events] == ['mission_state_changed', 'mission_accepted', 'objective_progress']
+    assert not reset and last_id == events[-1].id
+    accepted = json.loads(events[1].to_json())
+    assert accepted['data']['progress']['state'] == 'Accepted' and accepted['data']['hooks']
+    assert stream.events_after(last_id, timeout=0) == ([], False, last_id)
+
+    manager.process_game_event({'type': 'enemy_destroyed', 'enemy_type': 'pirate'})
+    events, reset, _ = stream.events_after(start, timeout=0)
+    assert reset and len(events) == 4
+
+    slots = [stream.open_client() for _ in range(stream.max_clients + 1)]
+    assert slots[-1] is False and stream.client_count == stream.max_clients
+    stream.close_client()
+    assert stream.open_client()
+    manager.shutdown()
+
+
+def test_retried_cascade_does_not_reapply_effects(tmp_path):
+    """A cascade retried after a partial failure applies each botch and rule only once."""
+    manager = MissionManager(data_directory=str(tmp_path),
+                             config={'save_durability': 'sync', 'job_workers': 0, 'job_retry_delay': 0})
+    cascade = manager.cascade_handler
+    cascade.register_cascade_rule('convoy', {'type': 'botch_related_missions', 'data': {'mission_ids': ['patrol']}})
+    cascade.register_cascade_rule('patrol', {'type': 'modify_faction_standing',
+                                             'data': {'faction': 'alliance', 'change': -10}})
+    cascade.register_cascade_rule('patrol', {'type': 'update_shared_data', 'data': {'key': 'alert', 'value': 'red'}})
+    for mission_id in ('convoy', 'patrol'):
+        mission = Mission(mission_id, mission_id, 'Convoy duty')
+        mission.set_state(MissionState.MENTIONED)
+        manager.save_mission(mission)
+
+    update_shared_data = cascade._update_shared_data
+    failures = []
+
+    def flaky_update(key, value):
+        if not failures:
+            failures.append(key)
+            raise RuntimeError('transient')
+        update_shared_data(key, value)
+
+    cascade._update_shared_data = flaky_update
+    assert manager.botch_mission('convoy', 'ambush')
+
+    assert failures and manager.job_queue.stats['retries'] == 1
+    assert manager.get_mission('patrol').is_botched
+    assert cascade.get_faction_standing('alliance') == -10
+    assert cascade.get_shared_data('alert') == 'red'
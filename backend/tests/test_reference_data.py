@@ -0,0 +1,31 @@
+import json
+
+from backend.reference_data import REFERENCE_FILES, ReferenceDataManager
+
+
+def _write_reference_data(directory, factions):
+    (directory / 'factions.json').write_text(json.dumps({'factions': factions}))
+    (directory / 'object_types.json').write_text(json.dumps({'objectTypes': {'star': {}}}))
+    (directory / 'planet_classes.json').write_text(json.dumps({'planetClasses': {'Class-M': {}}}))
+    (directory / 'diplomacy_states.json').write_text(json.dumps({'diplomacyStates': {'peace': {}}}))
+
+
+def test_changed_file_is_reloaded_and_corrupt_file_keeps_previous_data(tmp_path):
+    """Hot reload swaps in valid files; a broken file keeps the old data and is retried."""
+    _write_reference_data(tmp_path, {'friendly': {'color': '#00ff00'}})
+    manager = ReferenceDataManager(tmp_path, reload_interval=0)
+    assert manager.get_faction_color('friendly') == '#00ff00'
+
+    _write_reference_data(tmp_path, {'friendly': {'color': '#00ff00'}, 'enemy': {'color': '#ff0000'}})
+    assert manager.get_all_factions() == ['friendly', 'enemy']
+    assert manager.metadata['factions_count'] == 2
+
+    (tmp_path / 'factions.json').write_text('{"factions": {"friendly"')
+    assert manager.check_for_changes() == []
+    snapshot = manager.get_snapshot()
+    assert set(snapshot) == set(REFERENCE_FILES) | {'metadata'}
+    assert list(snapshot['factions']['factions']) == ['friendly', 'enemy']
+
+    (tmp_path / 'factions.json').write_text(json.dumps({'factions': {'neutral': {}}}))
+    assert manager.check_for_changes() == ['factions']
+    assert manager.get_all_factions() == ['neutral']
@@ -0,0 +1,228 @@
+import json
+import os
+import struct
+
+import pytest
+
+from backend.star_charts_adapter import StarChartsAdapter
+from backend.star_charts_binary import write_binary_database
+from backend.star_charts_storage import file_sha256, write_sharded_database
+
+
+def _object(object_id, name, object_type, object_class='rocky', position=None):
+    return {
+        'id': object_id,
+        'name': name,
+        'type': object_type,
+        'class': object_class,
+        'position': position or [0, 0, 0],
+    }
+
+
+@pytest.fixture
+def database():
+    """Small Star Charts database with a duplicated moon ID like the generator emits."""
+    return {
+        'metadata': {'total_sectors': 2, 'universe_seed': 'test'},
+        'sectors': {
+            'A0': {
+                'star': _object('A0_star', 'Sol', 'star', 'yellow dwarf'),
+                'objects': [
+                    _object('A0_terra_prime', 'Terra Prime', 'planet', 'Class-M', [149.6, 0, 0]),
+                    _object('A0_luna', 'Luna', 'moon', 'rocky', [151.1, 0, 0]),
+                ],
+            },
+            'A1': {
+                'star': _object('A1_star', 'Vega', 'star', 'blue giant'),
+                'objects': [
+                    _object('A1_kepler', 'Kepler', 'planet', 'Class-D', [80.0, 0, 0]),
+                    _object('A1_iii', 'III', 'moon', 'ice', [81.0, 0, 0]),
+                    _object('A1_iii', 'III', 'moon', 'rocky', [95.0, 0, 0]),
+                ],
+            },
+        },
+    }
+
+
+def _write_database(directory, database, layout):
+    """Write the database in the given on-disk layout and return the objects.json path."""
+    path = directory / 'objects.json'
+    path.write_text(json.dumps(database))
+    if layout == 'sharded':
+        write_sharded_database(database, str(directory / 'objects.shards.jsonl'), file_sha256(str(path)))
+    elif layout == 'binary':
+        write_binary_database(database, str(directory / 'objects.bin'), file_sha256(str(path)))
+    return path
+
+
+def _as_float32(value):
+    """Copy of a JSON value with every float rounded to float32, as the binary columns store it."""
+    if isinstance(value, float):
+        return struct.unpack('<f', struct.pack('<f', value))[0]
+    if isinstance(value, list):
+        return [_as_float32(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _as_float32(item) for key, item in value.items()}
+    return value
+
+
+@pytest.fixture(params=['json', 'sharded', 'binary'])
+def adapter(request, tmp_path, database):
+    """Adapter over a temporary copy of the test database, in each on-disk layout."""
+    path = _write_database(tmp_path, database, request.param)
+
+    adapter = StarChartsAdapter(str(path), cache_size=1)
+    assert adapter.load_star_charts_data()
+    assert adapter.get_stats()['storage'] == request.param
+    return adapter
+
+
+def test_object_lookup_by_id(adapter):
+    """Objects and stars resolve through the ID index."""
+    assert adapter.get_object_by_id('A0_star')['name'] == 'Sol'
+    assert adapter.get_object_by_id('A0_luna')['name'] == 'Luna'
+    assert adapter.get_object_by_id('A0_missing') is None
+    assert adapter.get_object_by_id('garbage') is None
+
+
+def test_duplicate_ids_are_detected(adapter):
+    """The first occurrence of a duplicated ID wins and the duplicate is reported."""
+    assert adapter.get_object_by_id('A1_iii')['class'] == 'ice'
+    assert adapter.get_duplicate_ids() == {'A1_iii': 2}
+    assert adapter.get_all_sector_objects('A1') == ['A1_star', 'A1_kepler', 'A1_iii']
+
+    stats = adapter.get_stats()
+    assert stats['total_objects'] == 6
+    assert stats['duplicate_ids'] == 1
+
+
+def test_objects_by_type(adapter):
+    """Type lookups work across all sectors and within one sector."""
+    assert [obj['id'] for obj in adapter.get_objects_by_type('planet')] == ['A0_terra_prime', 'A1_kepler']
+    assert [obj['id'] for obj in adapter.get_objects_by_type('star', 'A1')] == ['A1_star']
+    assert adapter.get_objects_by_type('station') == []
+
+
+def test_search_is_ranked_and_limited(adapter):
+    """Name matches rank above type/class matches; limit and sector filter apply."""
+    results = adapter.search_objects('terra')
+    assert [obj['id'] for obj in results] == ['A0_terra_prime']
+
+    results = adapter.search_objects('l')
+    assert [obj['id'] for obj in results][:2] == ['A0_luna', 'A0_star']
+    assert len(adapter.search_objects('l', limit=2)) == 2
+
+    assert [obj['id'] for obj in adapter.search_objects('planet', sector='A1')] == ['A1_kepler']
+    assert adapter.search_objects('rime')[0]['id'] == 'A0_terra_prime'
+    assert adapter.search_objects('nonexistent') == []
+
+
+def test_sectors_are_decoded_lazily(adapter):
+    """Sector lookups go through a bounded cache."""
+    assert adapter.get_object_by_id('A0_luna')['name'] == 'Luna'
+    assert adapter.get_object_by_id('A1_kepler')['name'] == 'Kepler'
+    assert adapter.get_stats()['cached_sectors'] == 1
+    assert adapter.get_sector_data('A0')['star']['name'] == 'Sol'
+    assert adapter.get_sector_data('Z9') is None
+
+
+@pytest.mark.parametrize('layout', ['json', 'sharded', 'binary'])
+def test_changed_file_is_reloaded(tmp_path, database, layout):
+    """A rewritten data file is picked up; a broken one keeps the old data in service."""
+    adapter = StarChartsAdapter(str(_write_database(tmp_path, database, layout)), reload_interval=0)
+    assert adapter.get_object_by_id('A0_luna')['name'] == 'Luna'
+    snapshot = adapter.get_snapshot()
+
+    database['sectors']['A0']['objects'][1]['name'] = 'Selene'
+    _write_database(tmp_path, database, layout)
+    assert adapter.get_object_by_id('A0_luna')['name'] == 'Selene'
+    assert snapshot.sector_index('A0').objects['A0_luna']['name'] == 'Luna'
+
+    broken = tmp_path / {'json': 'objects.json', 'sharded': 'objects.shards.jsonl', 'binary': 'objects.bin'}[layout]
+    broken.write_text('{not json')
+    assert adapter.get_object_by_id('A0_luna')['name'] == 'Selene'
+
+
+@pytest.mark.parametrize('layout', ['json', 'sharded', 'binary'])
+def test_old_snapshot_reads_uncached_sectors_after_replace(tmp_path, database, layout):
+    """A snapshot keeps decoding its own version of the file after the file is replaced."""
+    adapter = StarChartsAdapter(str(_write_database(tmp_path, database, layout)), cache_size=1, reload_interval=0)
+    snapshot = adapter.get_snapshot()
+    assert snapshot.sector_index('A0') is not None
+
+    # Longer records shift every offset behind the first sector
+    database['sectors']['A0']['objects'][1]['name'] = 'Selene of the Outer Ring'
+    database['sectors']['A1']['objects'][0]['name'] = 'Kepler Prime'
+    _write_database(tmp_path, database, layout)
+
+    assert snapshot.sector_index('A1').objects['A1_kepler']['name'] == 'Kepler'
+    assert adapter.get_object_by_id('A1_kepler')['name'] == 'Kepler Prime'
+
+
+def test_replaced_sharded_snapshot_is_closed_once_retired(tmp_path, database):
+    """A replaced snapshot's shard file is closed after the retirement period."""
+    adapter = StarChartsAdapter(str(_write_database(tmp_path, database, 'sharded')),
+                                reload_interval=0, retired_ttl=0)
+    snapshot = adapter.get_snapshot()
+
+    database['sectors']['A1']['objects'][0]['name'] = 'Kepler Prime'
+    _write_database(tmp_path, database, 'sharded')
+    assert adapter.get_object_by_id('A1_kepler')['name'] == 'Kepler Prime'
+
+    assert snapshot.source._file.closed
+    assert not adapter.get_snapshot().source._file.closed
+    assert snapshot.sector_index('A1') is None
+
+
+def test_spatial_queries_are_projected_and_paginated(adapter):
+    """Bounding box and radius queries use map (x, z) coordinates and return map fields."""
+    page = adapter.get_objects_in_bbox('A0', 100, -1, 200, 1)
+    assert [obj['id'] for obj in page['objects']] == ['A0_terra_prime', 'A0_luna']
+    assert set(page['objects'][0]) == {'id', 'name', 'type', 'class', 'position'}
+    assert page['total'] == 2
+
+    page = adapter.get_objects_in_bbox('A0', -200, -200, 200, 200, fields=['name'], offset=1, limit=1)
+    assert page['objects'] == [{'id': 'A0_terra_prime', 'name': 'Terra Prime'}]
+    assert page['total'] == 3
+
+    page = adapter.get_objects_in_radius('A0', 152, 0, 3)
+    assert [obj['id'] for obj in page['objects']] == ['A0_luna', 'A0_terra_prime']
+    assert adapter.get_objects_in_radius('Z9', 0, 0, 10) is None
+
+
+def test_binary_layout_round_trips_sector_data(tmp_path, database):
+    """The binary layout rebuilds sectors equal to the JSON source, extras included."""
+    database['sectors']['A0']['infrastructure'] = {'stations': [{'id': 'a0_hub', 'position': [1.5, 0, 2.25]}]}
+    database['sectors']['A0']['objects'][0]['faction'] = 'friendly'
+    adapter = StarChartsAdapter(str(_write_database(tmp_path, database, 'binary')))
+
+    assert adapter.get_stats()['storage'] == 'binary'
+    for sector_id, sector_data in database['sectors'].items():
+        # Same JSON text up to float32 precision: integers stay integers and key order is kept
+        assert json.dumps(adapter.get_sector_data(sector_id)) == json.dumps(_as_float32(sector_data))
+
+
+@pytest.mark.parametrize('layout', ['sharded', 'binary'])
+def test_edited_objects_json_wins_over_stale_derived_file(tmp_path, database, layout):
+    """A derived file built from another objects.json is skipped, and editing objects.json triggers a reload."""
+    path = _write_database(tmp_path, database, layout)
+    adapter = StarChartsAdapter(str(path), reload_interval=0)
+    assert adapter.get_stats()['storage'] == layout
+
+    database['sectors']['A0']['objects'][1]['name'] = 'Selene'
+    path.write_text(json.dumps(database))
+
+    assert adapter.get_object_by_id('A0_luna')['name'] == 'Selene'
+    assert adapter.get_stats()['storage'] == 'json'
+
+
+def test_derived_file_written_before_objects_json_is_used(tmp_path, database):
+    """A checkout that leaves objects.json newer than an up-to-date objects.bin still serves the binary."""
+    path = _write_database(tmp_path, database, 'binary')
+    binary = tmp_path / 'objects.bin'
+    # git writes files in checkout order, not build order
+    os.utime(binary, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+
+    adapter = StarChartsAdapter(str(path), reload_interval=0)
+    assert adapter.get_stats()['storage'] == 'binary'
@@ -0,0 +1,41 @@
+import gzip
+import json
+
+from backend.static_data import build_static_data, ensure_static_data, select_encoding
+
+
+def test_build_writes_hashed_variants_and_prunes_old_versions(tmp_path):
+    """Each dataset gets a content-hashed file with a gzip twin; stale versions are removed."""
+    source = tmp_path / 'factions.json'
+    source.write_text(json.dumps({'factions': {'friendly': {}}}))
+    output_dir = tmp_path / 'build'
+
+    first = build_static_data({'reference/factions': source}, output_dir)['reference/factions']
+    assert first['file'] == f"factions.{first['hash']}.json"
+    assert gzip.decompress((output_dir / (first['file'] + '.gz')).read_bytes()) == source.read_bytes()
+
+    source.write_text(json.dumps({'factions': {'enemy': {}}}))
+    second = build_static_data({'reference/factions': source}, output_dir)['reference/factions']
+    assert second['hash'] != first['hash']
+    assert not (output_dir / first['file']).exists()
+    assert json.loads((output_dir / 'manifest.json').read_text())['reference/factions']['file'] == second['file']
+
+
+def test_select_encoding_honours_quality_values():
+    """The best prebuilt encoding the client accepts wins; q=0 excludes an encoding."""
+    assert select_encoding('gzip, deflate, br', ['br', 'gzip']) == 'br'
+    assert select_encoding('br;q=0, gzip;q=0.5', ['br', 'gzip']) == 'gzip'
+    assert select_encoding('gzip', ['br']) is None
+    assert select_encoding('*', ['gzip']) == 'gzip'
+    assert select_encoding(None, ['gzip']) is None
+
+
+def test_ensure_static_data_builds_only_without_a_manifest(tmp_path):
+    """A missing manifest triggers a build of the frontend datasets; an existing one is kept."""
+    assert ensure_static_data(tmp_path)
+    manifest = json.loads((tmp_path / 'manifest.json').read_text())
+    assert {'star_charts/objects', 'starter_system_infrastructure'} <= set(manifest)
+
+    (tmp_path / 'manifest.json').write_text('{}')
+    assert ensure_static_data(tmp_path)
+    assert json.loads((tmp_path / 'manifest.json').read_text()) == {}
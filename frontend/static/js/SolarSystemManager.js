@@ -3,6 +3,7 @@ import { debug } from './debug.js';
 import { GameObjectFactory } from './core/GameObjectFactory.js';
 import { CelestialBodyFactory } from './managers/CelestialBodyFactory.js';
 import { OrbitCalculator } from './managers/OrbitCalculator.js';
+import { resolveStaticDataUrl } from './utils/StaticDataUrls.js';
 
 /**
  * SolarSystemManager - Manages celestial body creation and physics
@@ -596,7 +597,9 @@ export class SolarSystemManager {
         debug('UTILITY', 'Creating Sol System space stations and infrastructure...');
 
         try {
-            const response = await fetch('/static/data/starter_system_infrastructure.json');
+            const infrastructureUrl = await resolveStaticDataUrl(
+                'starter_system_infrastructure', '/static/data/starter_system_infrastructure.json');
+            const response = await fetch(infrastructureUrl);
             if (!response.ok) {
                 throw new Error(`Failed to load infrastructure data: ${response.status}`);
             }
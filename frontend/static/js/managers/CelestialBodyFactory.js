@@ -8,6 +8,7 @@
 import * as THREE from 'three';
 import { debug } from '../debug.js';
 import { GameObjectFactory } from '../core/GameObjectFactory.js';
+import { resolveStaticDataUrl } from '../utils/StaticDataUrls.js';
 
 /**
  * @typedef {Object} PlanetData
@@ -680,7 +681,9 @@ export class CelestialBodyFactory {
         }
 
         try {
-            const response = await fetch('/static/data/starter_system_infrastructure.json');
+            const infrastructureUrl = await resolveStaticDataUrl(
+                'starter_system_infrastructure', '/static/data/starter_system_infrastructure.json');
+            const response = await fetch(infrastructureUrl);
             if (!response.ok) {
                 throw new Error(`Failed to load beacon data: ${response.status}`);
             }
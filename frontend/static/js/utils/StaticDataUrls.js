@@ -0,0 +1,39 @@
+import { debug } from '../debug.js';
+
+/**
+ * StaticDataUrls - Resolves static datasets to their content-hashed URLs
+ *
+ * The server publishes a manifest (/api/static-data/manifest) mapping logical
+ * dataset names such as 'star_charts/objects' to precompressed files whose
+ * names change with their content, so browsers cache each version once.
+ * The manifest is fetched once per page load and shared by all callers.
+ */
+
+let manifestPromise = null;
+
+function loadManifest() {
+    if (!manifestPromise) {
+        manifestPromise = fetch('/api/static-data/manifest')
+            .then(response => (response.ok ? response.json() : null))
+            .catch(error => {
+                debug('UTILITY', 'Static data manifest unavailable:', error);
+                return null;
+            });
+    }
+    return manifestPromise;
+}
+
+/**
+ * Get the URL to fetch a static dataset from
+ * @param {string} datasetName - Logical dataset name from the manifest
+ * @param {string} fallbackUrl - Uncached URL used when the dataset is not in the manifest
+ * @returns {Promise<string>} Content-hashed URL, or fallbackUrl
+ */
+export async function resolveStaticDataUrl(datasetName, fallbackUrl) {
+    const manifest = await loadManifest();
+    const url = manifest?.datasets?.[datasetName]?.url;
+    if (!url) {
+        debug('UTILITY', `Static dataset ${datasetName} not in manifest, using ${fallbackUrl}`);
+    }
+    return url || fallbackUrl;
+}
@@ -1,5 +1,6 @@
 import { debug } from '../debug.js';
 import { DistanceCalculator } from '../utils/DistanceCalculator.js';
+import { resolveStaticDataUrl } from '../utils/StaticDataUrls.js';
 import { SCMSpatialGrid } from './starcharts/SCMSpatialGrid.js';
 import { SCMDiscoveryProcessor } from './starcharts/SCMDiscoveryProcessor.js';
 import { GameObjectRegistry } from '../core/GameObjectRegistry.js';
@@ -285,7 +286,8 @@ debug('UI', `🔧 TEMP FIX: Triggering Star Charts UI refresh`);
         // Load static database generated from verse.py
         
         try {
-            const response = await fetch('/static/data/star_charts/objects.json');
+            const databaseUrl = await resolveStaticDataUrl('star_charts/objects', '/static/data/star_charts/objects.json');
+            const response = await fetch(databaseUrl);
             if (!response.ok) {
                 throw new Error(`Failed to load database: ${response.status}`);
             }
@@ -302,7 +304,7 @@ debug('UTILITY', `   - Generated: ${this.objectDatabase.metadata.generation_time
             throw error;
         }
     }
-    
+
     getScenePosition(obj) {
         // Get actual 3D scene coordinates from SolarSystemManager instead of data coordinates
         
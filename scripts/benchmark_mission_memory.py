@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Measure the resident memory of loaded Mission objects.
+
+Usage:
+    python3 scripts/benchmark_mission_memory.py [--count N]
+
+Builds N missions the way MissionManager loads them (JSON text per mission,
+json.loads, Mission.from_dict) with a realistic mix of types, locations,
+factions, objectives and custom fields, then reports the bytes retained per
+mission as measured by tracemalloc. The parsed dicts are dropped; only what
+the Mission objects keep alive is counted.
+
+The same documents are also kept as the plain dicts json.loads returns,
+the dict-backed baseline, and both numbers are printed.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List
+
+# Add backend to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.mission_system import Mission, MissionState, Objective
+
+MISSION_TYPES = ('delivery', 'elimination', 'exploration', 'escort')
+LOCATIONS = ('terra_prime', 'luna', 'mars', 'europa', 'ceres', 'titan')
+FACTIONS = ('terran_republic_alliance', 'friendly', 'neutral', 'traders_guild')
+
+
+def mission_json(i: int) -> str:
+    """Serialized mission number i, as read from a mission file"""
+    mission = Mission(
+        f"mission_{i:06d}", f"Contract {i}", f"Generated contract number {i}",
+        mission_type=MISSION_TYPES[i % len(MISSION_TYPES)],
+        location=LOCATIONS[i % len(LOCATIONS)],
+        faction=FACTIONS[i % len(FACTIONS)],
+        client='Mission Control'
+    )
+    for n in range(3):
+        mission.add_objective(Objective(f"obj_{n + 1}", f"Objective {n + 1} of contract {i}",
+                                        is_optional=n == 2))
+    mission.objectives[0].achieve()
+    mission.set_state(MissionState.ACCEPTED)
+    mission.custom_fields = {'cargo_type': 'medical_supplies', 'cargo_amount': 10 + i % 40,
+                             'destination': LOCATIONS[(i + 1) % len(LOCATIONS)]}
+    return json.dumps(mission.to_storage_dict())
+
+
+def measure(documents: List[str], load: Callable[[str], Any]) -> float:
+    """Bytes retained per mission loaded with load(document)"""
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    missions = [load(document) for document in documents]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    assert len(missions) == len(documents)
+    return retained / len(documents)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=20000, help='missions to load')
+    args = parser.parse_args()
+
+    documents = [mission_json(i) for i in range(args.count)]
+    baseline = measure(documents, json.loads)
+    per_mission = measure(documents, lambda document: Mission.from_dict(json.loads(document)))
+    slotted = hasattr(Mission, '__slots__')
+    print(f"📊 {args.count:,} missions (plain dicts): {baseline:,.0f} bytes per mission")
+    print(f"📊 {args.count:,} missions ({'slotted' if slotted else 'dict-backed'} objects): "
+          f"{per_mission:,.0f} bytes per mission ({per_mission / baseline:.0%} of plain dicts)")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
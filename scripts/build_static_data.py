@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Build precompressed, content-hashed copies of the static datasets.
+
+Usage:
+    python3 scripts/build_static_data.py
+
+Writes every dataset (Star Charts database, starter system infrastructure
+and reference data) to data/build/static_data/ as <name>.<hash>.json plus
+.gz and, if the brotli package is installed, .br variants, and a
+manifest.json mapping logical dataset names to the hashed files. The server
+exposes the manifest at /api/static-data/manifest and serves the files from
+/static-data/ with immutable caching.
+
+Run after changing any published JSON file; generate_star_charts_db.py and
+the Docker image build run it automatically, and the server builds once at
+startup when no manifest exists.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.static_data import STATIC_DATA_BUILD_DIR, build_static_data, brotli
+
+
+def main():
+    """Build the static data files and print a summary"""
+    manifest = build_static_data()
+    if brotli is None:
+        print("⚠️ brotli is not installed: building gzip variants only")
+
+    print(f"✅ Built {len(manifest)} static datasets in {STATIC_DATA_BUILD_DIR}")
+    for name, entry in sorted(manifest.items()):
+        sizes = ', '.join(f"{encoding} {size:,}" for encoding, size in sorted(entry['encodings'].items()))
+        print(f"   - {name}: {entry['file']} ({entry['size']:,} bytes; {sizes})")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -4,21 +4,35 @@ Generate Star Charts database from procedural universe generation.
 Run this script to create/update the static database for the Star Charts system.
 
 Usage:
-    python3 scripts/generate_star_charts_db.py
+    python3 scripts/generate_star_charts_db.py [--incremental] [--workers N]
 
 This script:
 1. Uses the same UNIVERSE_SEED as the game for consistency
 2. Generates universe data using verse.py functions
 3. Creates static JSON database with object IDs, positions, and metadata
 4. Handles A0 infrastructure integration from JSON file
-5. Outputs database to data/star_charts/objects.json
+5. Outputs database to data/star_charts/objects.json (compact, written atomically)
+6. Writes the sharded layout (objects.shards.jsonl) used for lazy per-sector loading
+   and the compact columnar binary layout (objects.bin) read by the server
+7. Publishes objects.json to frontend/static/data/star_charts/ (the copy the
+   browser loads) and rebuilds the precompressed, content-hashed static data
+
+Every sector records a hash of its generation inputs (generator version,
+universe seed and, for A0, the infrastructure template) in
+metadata.sector_hashes. With --incremental, sectors whose hash matches the
+existing database are kept as they are and only stale sectors are
+regenerated, spread over --workers processes.
 """
 
 import os
 import json
 import sys
 import math
+import argparse
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
 
 # Add backend to path
@@ -27,126 +41,136 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / 'backend'))
 
 try:
-    from backend.verse import generate_universe, sector_to_seed
+    from backend.verse import (
+        generate_star_system, generate_starter_system, sector_to_seed, initialize_rng, Lehmer32
+    )
     from backend.infrastructure_loader import (
         load_starter_infrastructure_template,
         convert_stations_to_verse_format,
         convert_beacons_to_verse_format
     )
+    from backend.star_charts_storage import (
+        write_json_database, write_sharded_database, sharded_path_for, file_sha256
+    )
+    from backend.star_charts_binary import write_binary_database, binary_path_for
+    from backend.static_data import build_static_data, FRONTEND_DATA_DIR
     print("✅ Successfully imported verse.py functions")
 except ImportError as e:
     print(f"❌ Failed to import verse.py: {e}")
     print("Make sure you're running this from the project root directory")
     sys.exit(1)
 
-def main():
-    """Generate Star Charts database from procedural universe generation"""
+# Bump when a change to this script alters the generated sector data
+GENERATOR_VERSION = "1.0"
+
+# 90 sectors: A0-J8
+TOTAL_SECTORS = 90
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Generate the Star Charts static database")
+    parser.add_argument('--incremental', action='store_true',
+                        help="regenerate only sectors whose inputs changed since the last run")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes used to generate sectors")
+    return parser.parse_args()
+
+
+def main(incremental=False, workers=1, output_dir=None, publish=True):
+    """
+    Generate Star Charts database from procedural universe generation
+
+    Args:
+        incremental: Reuse sectors whose generation inputs are unchanged
+        workers: Worker processes used to generate sectors
+        output_dir: Directory of objects.json and its derived layouts,
+            defaults to data/star_charts
+        publish: Copy objects.json to the frontend and rebuild the hashed
+            static data served to browsers
+    """
     
     # Use same seed as game
     universe_seed = os.getenv('UNIVERSE_SEED', '20299999')
     print(f"🌌 Generating Star Charts database with seed: {universe_seed}")
     
     try:
-        # Generate universe (90 sectors: A0-J8)
-        print("🔄 Generating procedural universe...")
-        universe = generate_universe(90, universe_seed)
-        print(f"✅ Generated {len(universe)} sectors")
+        output_dir = Path(output_dir) if output_dir else project_root / "data" / "star_charts"
+        output_path = output_dir / "objects.json"
+
+        base_seed = resolve_universe_base_seed(universe_seed)
+        infrastructure_data = load_starter_infrastructure_template()
+        infrastructure_hash = content_hash(infrastructure_data)
+
+        sectors = sector_ids(TOTAL_SECTORS)
+        sector_hashes = {
+            sector: sector_input_hash(sector, universe_seed, base_seed, infrastructure_hash)
+            for sector in sectors
+        }
+
+        # Reuse sectors whose generation inputs are unchanged
+        reusable = {}
+        if incremental:
+            existing = load_existing_database(output_path)
+            if existing:
+                existing_hashes = existing.get('metadata', {}).get('sector_hashes', {})
+                reusable = {
+                    sector: existing['sectors'][sector] for sector in sectors
+                    if sector in existing.get('sectors', {}) and existing_hashes.get(sector) == sector_hashes[sector]
+                }
+        stale = [sector for sector in sectors if sector not in reusable]
+
+        if not stale:
+            print(f"✅ Star Charts database is up to date: {output_path}")
+            return True
+
+        print(f"🔄 Generating {len(stale)} of {len(sectors)} sectors with {workers} worker(s)...")
+        generated = dict(generate_sectors(stale, base_seed, workers))
+        print(f"✅ Generated {len(generated)} sectors")
         
+        # Load and position A0 infrastructure data
+        if 'A0' in generated and infrastructure_data:
+            print("🔄 Adding A0 infrastructure data...")
+            generated['A0']['infrastructure'] = position_infrastructure(infrastructure_data)
+            infrastructure = generated['A0']['infrastructure']
+            print(f"✅ Added {len(infrastructure['stations'])} positioned stations and {len(infrastructure['beacons'])} positioned beacons to A0")
+
         # Create database structure
         star_charts_db = {
             "metadata": {
                 "universe_seed": universe_seed,
                 "generation_timestamp": datetime.now().isoformat(),
-                "generator_version": "1.0",
-                "total_sectors": len(universe),
-                "description": "Star Charts static database generated from verse.py"
+                "generator_version": GENERATOR_VERSION,
+                "total_sectors": len(sectors),
+                "description": "Star Charts static database generated from verse.py",
+                "sector_hashes": sector_hashes
             },
-            "sectors": {}
-        }
-        
-        # Process each sector
-        print("🔄 Processing sectors...")
-        for i, star_system in enumerate(universe):
-            sector = star_system['sector']
-            star_charts_db["sectors"][sector] = extract_sector_data(star_system)
-            
-            if i % 10 == 0:  # Progress indicator
-                print(f"   Processed {i+1}/{len(universe)} sectors...")
-        
-        # Load and position A0 infrastructure data
-        print("🔄 Loading A0 infrastructure data...")
-        infrastructure_data = load_starter_infrastructure_template()
-        if infrastructure_data and 'A0' in star_charts_db["sectors"]:
-            # Convert 2D coordinates to 3D before positioning
-            print("🔄 Converting 2D coordinates to 3D...")
-            stations_3d = convert_stations_to_verse_format(infrastructure_data.get('stations', []))
-            beacons_3d = convert_beacons_to_verse_format(infrastructure_data.get('beacons', []))
-
-            # Use original infrastructure positions instead of calculated orbital positions
-            # This ensures stations are created at the same positions used in the game scene
-            positioned_stations = []
-            positioned_beacons = []
-
-            # Process stations with their original positions
-            for station in stations_3d:
-                positioned_station = station.copy()
-
-                # Ensure position is in the correct format [x, y, z]
-                if 'position' in station and isinstance(station['position'], list):
-                    positioned_station['position'] = station['position']
-                else:
-                    # Fallback to calculated position if position is missing
-                    positioned_station['position'] = [100.0, 0.0, 0.0]
-
-                # Calculate orbit data for consistency
-                positioned_station['orbit'] = {
-                    'parent': 'star',
-                    'radius': math.sqrt(positioned_station['position'][0]**2 + positioned_station['position'][2]**2),
-                    'angle': math.degrees(math.atan2(positioned_station['position'][2], positioned_station['position'][0])),
-                    'period': 0.0
-                }
-
-                positioned_stations.append(positioned_station)
-
-            # Process beacons with their original positions
-            for beacon in beacons_3d:
-                positioned_beacon = beacon.copy()
-
-                # Ensure position is in the correct format [x, y, z]
-                if 'position' in beacon and isinstance(beacon['position'], list):
-                    positioned_beacon['position'] = beacon['position']
-                else:
-                    # Fallback to calculated position if position is missing
-                    positioned_beacon['position'] = [100.0, 0.0, 0.0]
-
-                # Calculate orbit data for consistency
-                positioned_beacon['orbit'] = {
-                    'parent': 'star',
-                    'radius': math.sqrt(positioned_beacon['position'][0]**2 + positioned_beacon['position'][2]**2),
-                    'angle': math.degrees(math.atan2(positioned_beacon['position'][2], positioned_beacon['position'][0])),
-                    'period': 0.0
-                }
-
-                positioned_beacons.append(positioned_beacon)
-
-            star_charts_db["sectors"]["A0"]["infrastructure"] = {
-                "stations": positioned_stations,
-                "beacons": positioned_beacons
+            "sectors": {
+                sector: generated[sector] if sector in generated else reusable[sector]
+                for sector in sectors
             }
-            print(f"✅ Added {len(positioned_stations)} positioned stations and {len(positioned_beacons)} positioned beacons to A0")
+        }
         
         # Ensure output directory exists
-        output_dir = project_root / "data" / "star_charts"
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Save database
-        output_path = output_dir / "objects.json"
-        with open(output_path, 'w') as f:
-            json.dump(star_charts_db, f, indent=2)
+        write_json_database(star_charts_db, str(output_path))
+        
+        # Save sharded layout for lazy per-sector loading, tied to this objects.json
+        source_hash = file_sha256(str(output_path))
+        write_sharded_database(star_charts_db, sharded_path_for(str(output_path)), source_hash)
+        write_binary_database(star_charts_db, binary_path_for(str(output_path)), source_hash)
+        
+        # Publish the browser copy and refresh its hashed static files
+        if publish:
+            write_json_database(star_charts_db, str(FRONTEND_DATA_DIR / "star_charts" / "objects.json"))
+            build_static_data()
         
         print(f"✅ Star Charts database generated: {output_path}")
         print(f"📊 Database statistics:")
         print(f"   - Total sectors: {len(star_charts_db['sectors'])}")
+        print(f"   - Regenerated sectors: {len(generated)}")
         print(f"   - Universe seed: {universe_seed}")
         print(f"   - Generation time: {star_charts_db['metadata']['generation_timestamp']}")
         
@@ -166,6 +190,109 @@ def main():
         traceback.print_exc()
         return False
 
+def sector_ids(count):
+    """List sector coordinates in generation order (A0, A1, ... A8, B0, ...)"""
+    return [chr(ord('A') + i // 9) + str(i % 9) for i in range(count)]
+
+def stable_seed(universe_seed):
+    """
+    32-bit RNG seed of a universe seed, the same in every process.
+
+    Numeric seeds are used as is, like verse.initialize_rng() does for
+    UNIVERSE_SEED. Other strings are reduced with SHA-256 instead of
+    Python's hash(), which is salted per process unless PYTHONHASHSEED is
+    set and would make every run generate a different universe.
+    """
+    try:
+        return int(universe_seed) & 0xFFFFFFFF
+    except ValueError:
+        digest = hashlib.sha256(str(universe_seed).encode('utf-8')).digest()
+        return int.from_bytes(digest[:4], 'big')
+
+def resolve_universe_base_seed(universe_seed):
+    """Resolve the numeric base seed generate_universe() derives sector seeds from"""
+    initialize_rng(stable_seed(universe_seed))
+    return Lehmer32()
+
+def content_hash(value):
+    """Short stable hash of a JSON-serializable value"""
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+def sector_input_hash(sector, universe_seed, base_seed, infrastructure_hash):
+    """Hash of everything that determines the generated data of a sector"""
+    inputs = {
+        "generator_version": GENERATOR_VERSION,
+        "universe_seed": universe_seed,
+        "base_seed": base_seed,
+        "sector": sector
+    }
+    if sector == 'A0':
+        inputs["infrastructure"] = infrastructure_hash
+    return content_hash(inputs)
+
+def load_existing_database(path):
+    """Load a previously generated database, or None if there is no usable one"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (IOError, OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ Ignoring unreadable existing database {path}: {e}")
+        return None
+
+def generate_sector(sector, base_seed):
+    """Generate the Star Charts data of one sector, exactly as generate_universe() would"""
+    if sector == 'A0':
+        star_system = generate_starter_system()
+    else:
+        star_system = generate_star_system(random_seed=(base_seed + sector_to_seed(sector)) & 0xFFFFFFFF)
+    star_system['sector'] = sector
+    return sector, extract_sector_data(star_system)
+
+def generate_sectors(sectors, base_seed, workers):
+    """Generate sectors, in parallel worker processes when more than one worker is requested"""
+    if workers <= 1 or len(sectors) <= 1:
+        return [generate_sector(sector, base_seed) for sector in sectors]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate_sector, sectors, repeat(base_seed), chunksize=8))
+
+def position_infrastructure(infrastructure_data):
+    """Convert A0 infrastructure template to positioned 3D stations and beacons"""
+    # Convert 2D coordinates to 3D before positioning
+    stations_3d = convert_stations_to_verse_format(infrastructure_data.get('stations', []))
+    beacons_3d = convert_beacons_to_verse_format(infrastructure_data.get('beacons', []))
+
+    # Use original infrastructure positions instead of calculated orbital positions
+    # This ensures stations are created at the same positions used in the game scene
+    return {
+        "stations": [position_at_original_location(station) for station in stations_3d],
+        "beacons": [position_at_original_location(beacon) for beacon in beacons_3d]
+    }
+
+def position_at_original_location(item):
+    """Copy an infrastructure item, keeping its original position and adding orbit data"""
+    positioned = item.copy()
+
+    # Ensure position is in the correct format [x, y, z]
+    if 'position' in item and isinstance(item['position'], list):
+        positioned['position'] = item['position']
+    else:
+        # Fallback to calculated position if position is missing
+        positioned['position'] = [100.0, 0.0, 0.0]
+
+    # Calculate orbit data for consistency
+    positioned['orbit'] = {
+        'parent': 'star',
+        'radius': math.sqrt(positioned['position'][0]**2 + positioned['position'][2]**2),
+        'angle': math.degrees(math.atan2(positioned['position'][2], positioned['position'][0])),
+        'period': 0.0
+    }
+
+    return positioned
+
 def extract_sector_data(star_system):
     """Extract object data for Star Charts database"""
     
@@ -265,7 +392,8 @@ if __name__ == "__main__":
     print("🚀 Star Charts Database Generator")
     print("=" * 50)
     
-    success = main()
+    args = parse_args()
+    success = main(incremental=args.incremental, workers=args.workers)
     
     if success:
         print("\n✅ Database generation completed successfully!")